@@ -0,0 +1,346 @@
+"""
+새로 수집한 행마다 가격 변동 알림 규칙을 평가하여 파일이나 웹훅으로 이벤트를 보냅니다.
+
+규칙 종류 (alerts.json):
+    {"name": "급등", "metric": "change", "op": ">=", "threshold": 2.0}
+    {"name": "스프레드 확대", "metric": "spread", "op": ">", "threshold": 5}
+    {"name": "MA5 상향 돌파", "cross": "ma5", "direction": "up"}
+
+- 임계값 규칙은 (지표, 비교 연산자)별로 임계값을 정렬해 두고 행마다 이진 검색 한 번으로
+  조건을 만족하는 규칙 구간을 찾으므로, 규칙이 수천 개여도 비용은 그룹 수와 발생한 알림 수에 비례합니다.
+- 돌파 규칙은 국내기준가가 이전 행과 현재 행 사이에 이동평균(MA5/MA10)을 넘어선 경우 발생합니다.
+- 지표는 저장소가 upsert 트랜잭션에서 미리 계산해 둔 분석값을 사용하므로 이력을 다시 읽지 않습니다.
+
+    engine = load_engine('alerts.json')
+    save_prices(df, store_path, alerts=engine)
+
+사용법 (저장소의 최근 행으로 규칙 확인):
+    python alerts.py --last 30
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import io
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+
+from analytics_state import ANALYTICS_COLUMNS
+from schema import DATE_COLUMN, PRICE_COLUMNS
+
+CONFIG_PATH = 'alerts.json'
+WEBHOOK_TIMEOUT = 5
+
+# 규칙에서 사용하는 지표 이름 -> 설명
+METRICS = {
+    'bid': 'Bid',
+    'ask': 'Ask',
+    'international': '국제가',
+    'domestic': '국내기준가',
+    'spread': 'Bid/Ask 스프레드',
+    'change': '일일변동률(%)',
+    'ma5': 'MA5',
+    'ma10': 'MA10',
+}
+OPERATORS = ('>=', '>', '<=', '<')
+CROSS_METRICS = ('ma5', 'ma10')
+DIRECTIONS = ('up', 'down', 'both')
+
+
+@dataclass(frozen=True)
+class Rule:
+    """알림 규칙 하나 (임계값 규칙은 op/threshold, 돌파 규칙은 direction 사용)"""
+    name: str
+    metric: str
+    op: str = None
+    threshold: float = None
+    direction: str = None
+
+    @property
+    def is_cross(self):
+        return self.direction is not None
+
+
+def parse_rule(item):
+    """설정의 규칙 항목 하나를 검사하여 Rule로 변환합니다."""
+    name = item.get('name')
+    if not name:
+        raise Exception(f"규칙에 name이 없습니다: {item!r}")
+    if 'cross' in item:
+        if item['cross'] not in CROSS_METRICS:
+            raise Exception(f"{name}: 돌파 기준은 {', '.join(CROSS_METRICS)} 중 하나여야 합니다.")
+        direction = item.get('direction', 'both')
+        if direction not in DIRECTIONS:
+            raise Exception(f"{name}: direction은 {', '.join(DIRECTIONS)} 중 하나여야 합니다.")
+        return Rule(name, item['cross'], direction=direction)
+
+    if item.get('metric') not in METRICS:
+        raise Exception(f"{name}: metric은 {', '.join(METRICS)} 중 하나여야 합니다.")
+    if item.get('op') not in OPERATORS:
+        raise Exception(f"{name}: op는 {', '.join(OPERATORS)} 중 하나여야 합니다.")
+    try:
+        threshold = float(item['threshold'])
+    except (KeyError, TypeError, ValueError):
+        raise Exception(f"{name}: threshold는 숫자여야 합니다.")
+    return Rule(name, item['metric'], item['op'], threshold)
+
+
+class _ThresholdIndex:
+    """같은 (지표, 연산자) 규칙들을 임계값 순으로 정렬해 둔 색인입니다."""
+
+    def __init__(self, op, rules):
+        self.op = op
+        self.rules = sorted(rules, key=lambda rule: rule.threshold)
+        self.thresholds = [rule.threshold for rule in self.rules]
+
+    def matches(self, value):
+        """value가 조건을 만족하는 규칙 목록 (임계값이 정렬되어 있으므로 항상 앞 또는 뒤의 연속 구간)"""
+        if self.op == '>=':
+            return self.rules[:bisect_right(self.thresholds, value)]
+        if self.op == '>':
+            return self.rules[:bisect_left(self.thresholds, value)]
+        if self.op == '<=':
+            return self.rules[bisect_left(self.thresholds, value):]
+        return self.rules[bisect_right(self.thresholds, value):]
+
+
+class AlertEngine:
+    """
+    규칙 색인과 이벤트를 보낼 곳(sink)을 보관합니다.
+    evaluate()는 한 행을 평가하고, check_ingest()는 upsert로 새로 들어오거나 바뀐 행을 평가합니다.
+    """
+
+    def __init__(self, rules, sinks=()):
+        self.rules = list(rules)
+        self.sinks = list(sinks)
+        groups = {}
+        self._cross = {}
+        for rule in self.rules:
+            if rule.is_cross:
+                directions = ('up', 'down') if rule.direction == 'both' else (rule.direction,)
+                for direction in directions:
+                    self._cross.setdefault((rule.metric, direction), []).append(rule)
+            else:
+                groups.setdefault((rule.metric, rule.op), []).append(rule)
+        self._thresholds = [(metric, _ThresholdIndex(op, rules)) for (metric, op), rules in groups.items()]
+
+    def evaluate(self, row, previous=None):
+        """
+        행 하나(지표 이름 -> 값)에 규칙을 적용합니다. previous는 돌파 규칙에 쓰는 이전 행입니다.
+        반환값: 발생한 이벤트 목록
+        """
+        events = []
+        for metric, index in self._thresholds:
+            value = row[metric]
+            if math.isnan(value):
+                continue
+            for rule in index.matches(value):
+                message = f"{METRICS[metric]} {value:,.2f} {rule.op} {rule.threshold:,.2f}"
+                events.append(self._event(rule, row, value, message))
+
+        if previous is not None and self._cross:
+            for metric in CROSS_METRICS:
+                before = previous['domestic'] - previous[metric]
+                after = row['domestic'] - row[metric]
+                if before <= 0 < after:
+                    direction = 'up'
+                elif before >= 0 > after:
+                    direction = 'down'
+                else:
+                    # NaN이 있으면 비교가 모두 False이므로 여기로 옴
+                    continue
+                label = '상향' if direction == 'up' else '하향'
+                message = f"국내기준가 {METRICS[metric]} {label} 돌파 ({row['domestic']:,.2f} / {row[metric]:,.2f})"
+                for rule in self._cross.get((metric, direction), ()):
+                    events.append(self._event(rule, row, row['domestic'], message))
+        return events
+
+    @staticmethod
+    def _event(rule, row, value, message):
+        return {
+            'rule': rule.name,
+            'date': row['date'],
+            'metric': rule.metric,
+            'value': value,
+            'message': f"[{row['date']}] {rule.name}: {message}",
+        }
+
+    def evaluate_frame(self, frame, evaluate_from=0):
+        """
+        rows_frame() 결과(날짜 오름차순)의 evaluate_from번째 행부터 평가합니다.
+        (그 앞의 행은 돌파 규칙의 이전 행으로만 사용)
+        """
+        rows = [_row_dict(values) for values in frame.itertuples(index=False, name=None)]
+        events = []
+        for i in range(evaluate_from, len(rows)):
+            events.extend(self.evaluate(rows[i], rows[i - 1] if i > 0 else None))
+        return events
+
+    def snapshot(self, storage):
+        """upsert 전에 저장소의 최근 두 행을 기억해 둡니다. (check_ingest에 전달)"""
+        return storage.read(limit=2)
+
+    def check_ingest(self, storage, before):
+        """
+        snapshot() 이후 upsert로 새로 추가되었거나 마지막 날짜의 값이 바뀐 행을 평가하고 이벤트를 보냅니다.
+        저장소가 비어 있었으면 이력 전체가 아니라 가장 최근 행만 평가합니다.
+        반환값: 발생한 이벤트 목록
+        """
+        if before.empty:
+            latest = storage.read(limit=2)
+            if latest.empty:
+                return []
+            frame = rows_frame(storage, latest[DATE_COLUMN].min())
+            evaluate_from = len(frame) - 1
+        else:
+            frame = rows_frame(storage, before[DATE_COLUMN].min())
+            last = before.iloc[0]
+            dates = frame[DATE_COLUMN]
+            evaluate_from = int((dates < last[DATE_COLUMN]).sum())
+            # 마지막 날짜의 행은 값이 바뀐 경우에만 평가
+            same = frame.iloc[evaluate_from:evaluate_from + 1]
+            if len(same) and same[DATE_COLUMN].iloc[0] == last[DATE_COLUMN]:
+                old = last[PRICE_COLUMNS].to_numpy(dtype='float64')
+                new = same[PRICE_COLUMNS].iloc[0].to_numpy(dtype='float64')
+                if all(a == b or (math.isnan(a) and math.isnan(b)) for a, b in zip(old, new)):
+                    evaluate_from += 1
+        events = self.evaluate_frame(frame, evaluate_from)
+        self.emit(events)
+        return events
+
+    def emit(self, events):
+        """이벤트를 모든 sink로 보냅니다. (sink가 실패해도 수집은 계속 진행)"""
+        if not events:
+            return
+        for sink in self.sinks:
+            try:
+                sink.send(events)
+            except Exception as e:
+                print(f"⚠️ 알림 전송 실패 ({sink}): {e}")
+
+
+def rows_frame(storage, start):
+    """start 이후 행의 가격과 분석값을 날짜 오름차순 DataFrame으로 읽습니다."""
+    prices = storage.read(start=start)
+    analytics = storage.read_analytics(start=start)
+    frame = prices.merge(analytics, on=DATE_COLUMN, how='left')
+    return frame[[DATE_COLUMN, *PRICE_COLUMNS, *ANALYTICS_COLUMNS]].sort_values(DATE_COLUMN).reset_index(drop=True)
+
+
+def _row_dict(values):
+    """rows_frame()의 행 튜플을 지표 이름 -> 값으로 변환합니다."""
+    date, bid, ask, international, domestic, ma5, ma10, change, _ = values
+    return {
+        'date': f"{date:%Y.%m.%d}",
+        'bid': bid,
+        'ask': ask,
+        'international': international,
+        'domestic': domestic,
+        'spread': ask - bid,
+        'change': change,
+        'ma5': ma5,
+        'ma10': ma10,
+    }
+
+
+class FileSink:
+    """이벤트를 JSON lines 파일에 추가합니다."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def send(self, events):
+        sent_at = datetime.now().isoformat(timespec='seconds')
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps({'sent_at': sent_at, **event}, ensure_ascii=False) + '\n' for event in events))
+
+    def __str__(self):
+        return f"file:{self.path}"
+
+
+class WebhookSink:
+    """이벤트 목록을 JSON({"events": [...]})으로 웹훅 URL에 POST합니다."""
+
+    def __init__(self, url, timeout=WEBHOOK_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, events):
+        import requests
+
+        response = requests.post(self.url, json={'events': events}, timeout=self.timeout)
+        response.raise_for_status()
+
+    def __str__(self):
+        return f"webhook:{self.url}"
+
+
+class PrintSink:
+    """이벤트 메시지를 화면에 출력합니다."""
+
+    def send(self, events):
+        for event in events:
+            print(f"🔔 {event['message']}")
+
+    def __str__(self):
+        return "print"
+
+
+def make_sink(item):
+    kind = item.get('type')
+    if kind == 'file':
+        return FileSink(item['path'])
+    if kind == 'webhook':
+        return WebhookSink(item['url'], item.get('timeout', WEBHOOK_TIMEOUT))
+    if kind == 'print':
+        return PrintSink()
+    raise Exception(f"알 수 없는 sink 종류입니다: {kind!r} (file, webhook, print)")
+
+
+def load_engine(path=CONFIG_PATH):
+    """설정 파일에서 규칙과 sink를 읽어 AlertEngine을 만듭니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    rules = [parse_rule(item) for item in config.get('rules', [])]
+    if not rules:
+        raise Exception(f"{path}에 등록된 규칙이 없습니다.")
+    names = [rule.name for rule in rules]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise Exception(f"규칙 이름이 중복되었습니다: {', '.join(duplicates)}")
+    sinks = [make_sink(item) for item in config.get('sinks', [{'type': 'print'}])]
+    return AlertEngine(rules, sinks)
+
+
+if __name__ == "__main__":
+    from storage import STORE_PATH, open_storage
+
+    # Windows 콘솔 인코딩 설정
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='저장소의 최근 행에 알림 규칙 적용')
+    parser.add_argument('--config', default=CONFIG_PATH, help='알림 규칙 설정 파일')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--last', type=int, default=30, help='평가할 최근 행 수')
+    parser.add_argument('--send', action='store_true', help='설정의 sink로도 보냅니다. (기본: 화면 출력만)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.store):
+        raise Exception(f"{args.store} 파일을 찾을 수 없습니다.")
+    engine = load_engine(args.config)
+    storage = open_storage(args.store)
+    try:
+        recent = storage.read(limit=args.last + 1)
+        frame = rows_frame(storage, recent[DATE_COLUMN].min()) if not recent.empty else recent
+    finally:
+        storage.close()
+
+    events = engine.evaluate_frame(frame, evaluate_from=1) if len(frame) > 1 else []
+    print(f"규칙 {len(engine.rules)}개, 최근 {max(len(frame) - 1, 0)}개 행에서 알림 {len(events)}개")
+    PrintSink().send(events)
+    if args.send:
+        engine.sinks = [sink for sink in engine.sinks if not isinstance(sink, PrintSink)]
+        engine.emit(events)
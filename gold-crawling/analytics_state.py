@@ -0,0 +1,210 @@
+"""
+국내기준가의 이동평균(5일/10일), 일일 변동률, 누적 수익률을 저장소에 미리 계산해 둡니다.
+
+가격 테이블 옆에 분석값 테이블({table}_analytics)과 이어서 계산하기 위한 상태
+({table}_analytics_state: 마지막 날짜, 첫 가격, 최근 10개 가격)를 함께 보관합니다.
+마지막 날짜 이후의 행이 추가되면 상태만으로 행마다 O(1)에 계산하고,
+이전 날짜의 가격이 바뀌거나 중간 날짜가 끼어든 경우에만 전체를 다시 계산합니다.
+"""
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from schema import DATE_COLUMN
+
+MA_WINDOWS = (5, 10)
+# 상태에 보관하는 최근 가격 수 (가장 긴 이동평균 창)
+RECENT_SIZE = max(MA_WINDOWS)
+
+# 분석값 컬럼 (시각화에서 사용하는 이름, 누적수익률은 비율)
+ANALYTICS_COLUMNS = ['MA5', 'MA10', '일일변동률', '누적수익률']
+
+# 이전 날짜의 변경 여부를 확인할 때 한 번에 조회하는 날짜 수
+_QUERY_CHUNK = 500
+
+
+def compute_analytics(prices):
+    """
+    날짜 오름차순 가격 배열 전체에서 분석값을 한 번에 계산합니다.
+    pandas의 rolling(n).mean(), pct_change() * 100, 첫 가격 대비 수익률과 같은 값입니다.
+    """
+    prices = np.asarray(prices, dtype='float64')
+    n = len(prices)
+    columns = {}
+    for window in MA_WINDOWS:
+        ma = np.full(n, np.nan)
+        if n >= window:
+            ma[window - 1:] = np.lib.stride_tricks.sliding_window_view(prices, window).sum(axis=1) / window
+        columns[f'MA{window}'] = ma
+
+    change = np.full(n, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if n > 1:
+            previous = prices[:-1]
+            change[1:] = np.where(previous == 0, np.nan, (prices[1:] / previous - 1) * 100)
+        valid = np.flatnonzero(~np.isnan(prices))
+        first = prices[valid[0]] if len(valid) else np.nan
+        cumulative = np.where(np.isnan(change) | (first == 0), np.nan, prices / first - 1)
+    columns['일일변동률'] = change
+    columns['누적수익률'] = cumulative
+    return columns
+
+
+def _nan_to_none(value):
+    return None if value is None or math.isnan(value) else value
+
+
+def _none_to_nan(value):
+    return math.nan if value is None else value
+
+
+class AnalyticsStore:
+    """SQLite 가격 테이블 하나의 분석값과 이어서 계산하기 위한 상태를 관리합니다."""
+
+    def __init__(self, conn, table='prices'):
+        self.conn = conn
+        self.table = table
+        self.analytics_table = f'{table}_analytics'
+        self.state_table = f'{table}_analytics_state'
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.analytics_table} ('
+            'day INTEGER PRIMARY KEY, price REAL, ma5 REAL, ma10 REAL, daily_change REAL, cumulative_return REAL)'
+        )
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.state_table} ('
+            'id INTEGER PRIMARY KEY CHECK (id = 0), last_day INTEGER, first_price REAL, recent TEXT)'
+        )
+
+    def _load_state(self):
+        row = self.conn.execute(f'SELECT last_day, first_price, recent FROM {self.state_table}').fetchone()
+        if row is None:
+            return None
+        return {
+            'last_day': row[0],
+            'first_price': _none_to_nan(row[1]),
+            'recent': [_none_to_nan(price) for price in json.loads(row[2])],
+        }
+
+    def _save_state(self, state):
+        self.conn.execute(
+            f'INSERT OR REPLACE INTO {self.state_table} VALUES (0, ?, ?, ?)',
+            (
+                state['last_day'],
+                _nan_to_none(state['first_price']),
+                json.dumps([_nan_to_none(price) for price in state['recent']]),
+            ),
+        )
+
+    @staticmethod
+    def _step(state, price):
+        """상태에 가격 하나를 이어 붙이고 해당 행의 (MA5, MA10, 일일변동률, 누적수익률)을 반환합니다."""
+        price = _none_to_nan(price)
+        recent = state['recent']
+        previous = recent[-1] if recent else math.nan
+        recent.append(price)
+        if len(recent) > RECENT_SIZE:
+            del recent[0]
+
+        averages = [
+            sum(recent[-window:]) / window if len(recent) >= window else math.nan
+            for window in MA_WINDOWS
+        ]
+        change = math.nan if previous == 0 else (price / previous - 1) * 100
+        if math.isnan(state['first_price']):
+            state['first_price'] = price
+        first = state['first_price']
+        cumulative = math.nan if math.isnan(change) or first == 0 else price / first - 1
+        return (*averages, change, cumulative)
+
+    def _changed(self, days):
+        """이미 계산된 날짜 중 가격이 바뀌었거나 분석값이 없는 날짜가 있는지 확인합니다."""
+        for start in range(0, len(days), _QUERY_CHUNK):
+            chunk = days[start:start + _QUERY_CHUNK]
+            placeholders = ', '.join('?' * len(chunk))
+            changed = self.conn.execute(
+                f'SELECT 1 FROM {self.table} p LEFT JOIN {self.analytics_table} a ON a.day = p.day '
+                f'WHERE p.day IN ({placeholders}) AND (a.day IS NULL OR a.price IS NOT p.domestic) LIMIT 1',
+                chunk,
+            ).fetchone()
+            if changed:
+                return True
+        return False
+
+    def update(self, days=()):
+        """
+        가격 테이블에 반영된 고시날짜(1970-01-01 기준 일수)에 맞게 분석값을 갱신합니다.
+        마지막 계산 날짜 이후의 행은 행마다 O(1)로 이어서 계산하고,
+        이전 날짜가 바뀐 경우에만 전체를 다시 계산합니다.
+        반환값: 계산한 행 수
+        """
+        state = self._load_state()
+        if state is None:
+            return self.rebuild()
+        old_days = sorted({day for day in days if day <= state['last_day']})
+        if old_days and self._changed(old_days):
+            return self.rebuild()
+
+        rows = self.conn.execute(
+            f'SELECT day, domestic FROM {self.table} WHERE day > ? ORDER BY day', (state['last_day'],)
+        ).fetchall()
+        if not rows:
+            return 0
+        records = [
+            (day, price, *(_nan_to_none(value) for value in self._step(state, price)))
+            for day, price in rows
+        ]
+        self.conn.executemany(
+            f'INSERT OR REPLACE INTO {self.analytics_table} VALUES (?, ?, ?, ?, ?, ?)', records
+        )
+        state['last_day'] = rows[-1][0]
+        self._save_state(state)
+        return len(records)
+
+    def rebuild(self):
+        """가격 테이블 전체에서 분석값과 상태를 다시 계산합니다. 반환값: 계산한 행 수"""
+        rows = self.conn.execute(f'SELECT day, domestic FROM {self.table} ORDER BY day').fetchall()
+        self.conn.execute(f'DELETE FROM {self.analytics_table}')
+        self.conn.execute(f'DELETE FROM {self.state_table}')
+        if not rows:
+            return 0
+
+        array = np.array(rows, dtype='float64')
+        prices = array[:, 1]
+        columns = compute_analytics(prices)
+        values = np.column_stack([array] + [columns[column] for column in ANALYTICS_COLUMNS])
+        self.conn.executemany(
+            f'INSERT INTO {self.analytics_table} VALUES (?, ?, ?, ?, ?, ?)',
+            ((int(row[0]), *(_nan_to_none(value) for value in row[1:])) for row in values.tolist()),
+        )
+        valid = prices[~np.isnan(prices)]
+        self._save_state({
+            'last_day': rows[-1][0],
+            'first_price': valid[0] if len(valid) else math.nan,
+            'recent': prices[-RECENT_SIZE:].tolist(),
+        })
+        return len(rows)
+
+    def read(self, start_day=None):
+        """
+        분석값을 최신 날짜순의 DataFrame(고시날짜 + ANALYTICS_COLUMNS)으로 읽습니다.
+        start_day(1970-01-01 기준 일수)가 있으면 그 날짜 이후만 기본 키 범위 검색으로 읽습니다.
+        """
+        # 다른 경로로 추가된 행이 있으면 먼저 이어서 계산
+        last_day = self.conn.execute(f'SELECT MAX(day) FROM {self.table}').fetchone()[0]
+        state = self._load_state()
+        if state is None or state['last_day'] != last_day:
+            with self.conn:
+                self.update()
+
+        rows = self.conn.execute(
+            f'SELECT day, ma5, ma10, daily_change, cumulative_return FROM {self.analytics_table} '
+            'WHERE day >= ? ORDER BY day DESC',
+            (-2 ** 63 if start_day is None else start_day,),
+        ).fetchall()
+        array = np.array(rows, dtype='float64').reshape(-1, len(ANALYTICS_COLUMNS) + 1)
+        df = pd.DataFrame({DATE_COLUMN: array[:, 0].astype('int64').astype('datetime64[D]').astype('datetime64[ns]')})
+        for i, column in enumerate(ANALYTICS_COLUMNS, start=1):
+            df[column] = array[:, i]
+        return df
@@ -0,0 +1,217 @@
+"""
+저장해 둔 금시세 페이지(HTML 스냅샷) 여러 개에서 행을 추출하여 저장소에 한 번에 반영합니다.
+
+- 디렉토리(하위 디렉토리의 .html/.htm 포함) 또는 glob 패턴으로 파일을 지정합니다.
+- 파일은 프로세스 풀에서 병렬로 파싱하고, 작업 프로세스는 행을 숫자 배열로 변환하여 돌려줍니다.
+- 파싱이 끝난 파일의 행은 체크포인트(SQLite)에 모아 두므로 중간에 멈춰도 다시 실행하면
+  (수정 시각과 크기가 같은) 이미 처리한 파일은 건너뛰고 이어서 진행합니다.
+- 모든 파일의 행을 고시날짜 기준으로 중복 제거하고(같은 날짜는 가장 최근 스냅샷의 값),
+  저장소에는 트랜잭션 한 번으로 upsert합니다. 반영이 끝나면 체크포인트를 삭제합니다.
+
+사용법:
+    python backfill_snapshots.py snapshots/
+    python backfill_snapshots.py "archive/2025-*/*.html" --workers 8
+    python backfill_snapshots.py snapshots/ --keep last
+"""
+import argparse
+import glob
+import os
+import sqlite3
+import sys
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import span
+from schema import DATE_COLUMN, PRICE_COLUMNS, normalize_frame
+from storage import DB_COLUMNS, STORE_PATH, open_storage
+from tabulator_parser import iter_rows_from_file
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+CHECKPOINT_PATH = 'backfill_checkpoint.db'
+SNAPSHOT_EXTENSIONS = ('.html', '.htm')
+
+# 체크포인트에 한 번에 커밋하는 파일 수
+COMMIT_EVERY = 50
+# 작업 프로세스에 한 번에 넘기는 파일 수
+CHUNK_SIZE = 8
+
+
+def find_snapshots(targets):
+    """디렉토리 또는 glob 패턴 목록에서 스냅샷 파일 경로를 찾아 정렬된 목록으로 반환합니다."""
+    paths = set()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, _, files in os.walk(target):
+                paths.update(
+                    os.path.join(root, name) for name in files
+                    if name.lower().endswith(SNAPSHOT_EXTENSIONS)
+                )
+        else:
+            paths.update(path for path in glob.glob(target, recursive=True) if os.path.isfile(path))
+    return sorted(os.path.abspath(path) for path in paths)
+
+
+def extract_snapshot(path):
+    """
+    스냅샷 파일 하나에서 모든 행을 추출합니다. (작업 프로세스에서 실행)
+    반환값: (경로, 고시날짜 일수 목록, 가격 행 목록, 오류 메시지 또는 None)
+    """
+    try:
+        rows = list(iter_rows_from_file(path))
+    except Exception as e:
+        return path, [], [], str(e)
+    if not rows:
+        return path, [], [], None
+    typed = normalize_frame(pd.DataFrame(rows))
+    days = typed[DATE_COLUMN].values.astype('datetime64[D]').astype('int64').tolist()
+    prices = typed[PRICE_COLUMNS].to_numpy(dtype='float64').tolist()
+    return path, days, prices, None
+
+
+class Checkpoint:
+    """
+    파싱이 끝난 파일과 그 행을 보관하는 SQLite 파일입니다.
+    파일의 수정 시각과 크기가 같으면 이미 처리한 것으로 보고 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, path=CHECKPOINT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS files ('
+            'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, row_count INTEGER)'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS rows ('
+            'path TEXT, day INTEGER, bid REAL, ask REAL, international REAL, domestic REAL)'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS rows_path ON rows (path)')
+
+    def done(self):
+        """{경로: (수정 시각, 크기)}"""
+        return {path: (mtime_ns, size) for path, mtime_ns, size in
+                self.conn.execute('SELECT path, mtime_ns, size FROM files')}
+
+    def add(self, path, stat, days, prices):
+        # 이전 실행 이후 파일이 바뀐 경우 기존 행을 지우고 다시 기록
+        self.conn.execute('DELETE FROM rows WHERE path = ?', (path,))
+        self.conn.executemany(
+            'INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?)',
+            ((path, day, *values) for day, values in zip(days, prices)),
+        )
+        self.conn.execute(
+            'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)', (path, stat.st_mtime_ns, stat.st_size, len(days))
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+    def merged_frame(self, paths):
+        """
+        paths 파일들의 행을 고시날짜 기준으로 중복 제거한 DataFrame을 반환합니다.
+        같은 날짜가 여러 파일에 있으면 수정 시각이 가장 늦은 스냅샷의 값을 사용합니다.
+        """
+        self.conn.execute('CREATE TEMP TABLE IF NOT EXISTS selected (path TEXT PRIMARY KEY)')
+        self.conn.execute('DELETE FROM selected')
+        self.conn.executemany('INSERT INTO selected VALUES (?)', ((path,) for path in paths))
+        # 날짜마다 (수정 시각, 경로)가 가장 큰 파일의 행
+        records = self.conn.execute(
+            f'SELECT {", ".join(DB_COLUMNS)} FROM ('
+            '  SELECT r.*, ROW_NUMBER() OVER (PARTITION BY r.day ORDER BY f.mtime_ns DESC, f.path DESC) AS rank'
+            '  FROM rows r JOIN files f ON f.path = r.path JOIN selected s ON s.path = r.path'
+            ') WHERE rank = 1 ORDER BY day'
+        ).fetchall()
+        array = np.array(records, dtype='float64').reshape(-1, len(DB_COLUMNS))
+        df = pd.DataFrame({DATE_COLUMN: array[:, 0].astype('int64').astype('datetime64[D]').astype('datetime64[ns]')})
+        for i, column in enumerate(PRICE_COLUMNS, start=1):
+            df[column] = array[:, i]
+        return df
+
+    def close(self):
+        self.conn.close()
+
+    def remove(self):
+        self.close()
+        os.remove(self.path)
+
+
+def backfill(targets, store_path=STORE_PATH, workers=None, keep='first',
+             checkpoint_path=CHECKPOINT_PATH, keep_checkpoint=False):
+    """
+    스냅샷 파일들을 병렬로 파싱하여 저장소에 반영합니다.
+    keep='first'는 저장소에 이미 있는 날짜의 값을 유지하고, 'last'는 스냅샷 값으로 덮어씁니다.
+    반환값: 저장소에 추가되거나 변경된 행 수
+    """
+    paths = find_snapshots(targets)
+    if not paths:
+        raise Exception(f"스냅샷 파일을 찾을 수 없습니다: {', '.join(targets)}")
+
+    checkpoint = Checkpoint(checkpoint_path)
+    done = checkpoint.done()
+    stats = {path: os.stat(path) for path in paths}
+    pending = [path for path in paths if done.get(path) != (stats[path].st_mtime_ns, stats[path].st_size)]
+    print(f"스냅샷 {len(paths)}개 중 {len(paths) - len(pending)}개는 체크포인트에서 이어서 사용, "
+          f"{len(pending)}개 파싱")
+
+    failed = []
+    start = time.monotonic()
+    with span('backfill.extract', rows=len(pending)):
+        workers = max(1, min(workers or os.cpu_count() or 1, len(pending) or 1))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(extract_snapshot, pending, chunksize=CHUNK_SIZE)
+            for count, (path, days, prices, error) in enumerate(results, start=1):
+                if error:
+                    # 실패한 파일은 체크포인트에 남기지 않아 다음 실행에서 다시 시도
+                    failed.append((path, error))
+                else:
+                    checkpoint.add(path, stats[path], days, prices)
+                if count % COMMIT_EVERY == 0:
+                    checkpoint.commit()
+                    print(f"  {count}/{len(pending)}개 파싱 ({time.monotonic() - start:.1f}초)")
+        checkpoint.commit()
+
+    for path, error in failed:
+        print(f"  ❌ {path}: {error}")
+    failed_paths = {path for path, _ in failed}
+
+    with span('backfill.merge') as s:
+        df = checkpoint.merged_frame([path for path in paths if path not in failed_paths])
+        s.rows = len(df)
+    print(f"고시날짜 기준 중복 제거 후 {len(df)}개 행")
+
+    storage = open_storage(store_path)
+    try:
+        # upsert는 트랜잭션 한 번으로 모든 행과 분석값/집계를 반영
+        changed = storage.upsert(df, keep=keep)
+        print(f"\n✅ {changed}개의 데이터를 {store_path}에 반영했습니다. (전체 {len(storage)}개)")
+    finally:
+        storage.close()
+
+    if failed or keep_checkpoint:
+        checkpoint.close()
+        if failed:
+            print(f"실패한 파일 {len(failed)}개는 다시 실행하면 재시도합니다. (체크포인트: {checkpoint_path})")
+    else:
+        checkpoint.remove()
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='HTML 스냅샷 일괄 수집')
+    parser.add_argument('targets', nargs='+', help='스냅샷 디렉토리 또는 glob 패턴 (예: "archive/*.html")')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--workers', type=int, default=None, help='파싱 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--keep', choices=['first', 'last'], default='first',
+                        help='저장소에 이미 있는 날짜의 처리 (first: 기존 값 유지, last: 스냅샷 값으로 덮어씀)')
+    parser.add_argument('--checkpoint', default=CHECKPOINT_PATH, help='이어서 진행하기 위한 체크포인트 파일')
+    parser.add_argument('--keep-checkpoint', action='store_true', help='반영이 끝나도 체크포인트를 지우지 않습니다.')
+    args = parser.parse_args()
+
+    backfill(args.targets, args.store, args.workers, args.keep, args.checkpoint, args.keep_checkpoint)
@@ -0,0 +1,317 @@
+"""
+금시세 수집 파이프라인의 단계별 마이크로 벤치마크입니다.
+
+#example-table과 같은 형태의 Tabulator HTML을 100 / 1만 / 100만 행으로 합성하여
+각 단계의 처리량(rows/sec)과 최대 메모리(peak RSS)를 측정하고,
+저장된 기준값(baseline.json)보다 느려지면 0이 아닌 코드로 종료합니다.
+처리량은 단계마다 여러 번 실행한 것 중 가장 빠른 실행으로 비교합니다.
+
+사용법 (gold-crawling 디렉토리에서):
+    python benchmarks/bench_ingest.py
+    python benchmarks/bench_ingest.py --sizes 100 10000 --stages merge load_data
+    python benchmarks/bench_ingest.py --update-baseline
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# 커밋된 100행 픽스처: 더 큰 픽스처의 헤더/꼬리 템플릿으로도 사용
+TEMPLATE_FIXTURE = os.path.join(FIXTURE_DIR, 'tabulator_100.html')
+
+DEFAULT_SIZES = [100, 10_000, 1_000_000]
+STAGES = ['extract_data_from_html', 'extract_from_html_file', 'merge', 'load_data', 'load_data_cached']
+
+# 기준값 대비 허용 오차 (처리량 25% 감소 / 메모리 25% 증가까지 허용)
+DEFAULT_TOLERANCE = 0.25
+
+# 단계마다 여러 번 실행하여 가장 빠른 실행으로 비교 (한 번만 재면 잡음으로 결과가 크게 흔들림)
+DEFAULT_REPEAT = 5
+# 측정 시간의 합이 이보다 짧으면 repeat 횟수를 넘어서도 반복 (작은 입력은 한 번이 수 ms)
+MIN_DURATION = 1.0
+# 측정 시간의 합이 이보다 길면 repeat 횟수 전에 멈춤 (100만 행 단계)
+MAX_DURATION = 30.0
+
+# pandas datetime64[ns] 범위 안에 들어가도록 날짜는 이 일수마다 반복됩니다.
+MAX_DAYS = 200_000
+LAST_DATE = date(2026, 1, 15)
+
+ROW_TEMPLATE = (
+    '<div class="tabulator-row tabulator-selectable tabulator-row-{parity}" role="row" style="padding-left: 0px;">'
+    '<div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">{date}</div>'
+    '<div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">{bid}</div>'
+    '<div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">{ask}</div>'
+    '<div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">{intl}</div>'
+    '<div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">{domestic}</div>'
+    '</div>'
+)
+ROW_MARKER = '<div class="tabulator-row '
+FOOTER = '</div></div>'
+
+
+def synthetic_rows(n_rows, seed=0):
+    """최신 날짜부터 과거로 내려가는 합성 금시세 행을 생성합니다."""
+    rng = random.Random(seed)
+    bid = 4600.0
+    for i in range(n_rows):
+        bid = max(100.0, bid * (1 + rng.gauss(0, 0.01)))
+        ask = bid * 1.0004
+        yield {
+            '고시날짜': (LAST_DATE - timedelta(days=i % MAX_DAYS)).strftime('%Y.%m.%d'),
+            'Bid': f'{bid:,.2f}',
+            'Ask': f'{ask:,.2f}',
+            '국제가 (USD/T.oz)': f'{ask:,.2f}',
+            '국내기준가 (₩/g)': f'{bid * 47.3:,.0f}',
+        }
+
+
+def _read_header():
+    with open(TEMPLATE_FIXTURE, 'r', encoding='utf-8') as f:
+        template = f.read()
+    return template[:template.index(ROW_MARKER)]
+
+
+def write_fixture(path, n_rows, header=None):
+    """합성 Tabulator HTML을 파일로 씁니다. (100만 행도 스트리밍으로 작성)"""
+    header = _read_header() if header is None else header
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(header)
+        for i, row in enumerate(synthetic_rows(n_rows)):
+            f.write(ROW_TEMPLATE.format(
+                parity='odd' if i % 2 == 0 else 'even',
+                date=row['고시날짜'],
+                bid=row['Bid'],
+                ask=row['Ask'],
+                intl=row['국제가 (USD/T.oz)'],
+                domestic=row['국내기준가 (₩/g)'],
+            ))
+        f.write(FOOTER)
+
+
+def html_fixture(n_rows):
+    """n행 HTML 픽스처 경로를 반환합니다. 없으면 생성하여 재사용합니다."""
+    path = os.path.join(FIXTURE_DIR, f'tabulator_{n_rows}.html')
+    if not os.path.exists(path):
+        write_fixture(path, n_rows)
+    return path
+
+
+def store_fixture(n_rows):
+    """n행 SQLite 저장소 픽스처 경로를 반환합니다. 없으면 생성하여 재사용합니다."""
+    import pandas as pd
+    from storage import SQLiteStorage
+
+    path = os.path.join(FIXTURE_DIR, f'gold_prices_{n_rows}.db')
+    if not os.path.exists(path):
+        storage = SQLiteStorage(path)
+        storage.write(pd.DataFrame(synthetic_rows(n_rows)))
+        storage.close()
+    return path
+
+
+# ---------------------------------------------------------------------------
+# 단계별 벤치마크: 준비 작업은 측정에서 제외하고 (처리 행 수, 소요 시간)을 반환
+# ---------------------------------------------------------------------------
+
+def bench_extract_data_from_html(n_rows):
+    from update_excel import extract_data_from_html
+
+    with open(html_fixture(n_rows), 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    start = time.perf_counter()
+    data = extract_data_from_html(html_content)
+    return len(data), time.perf_counter() - start
+
+
+def bench_extract_from_html_file(n_rows):
+    from crawl_gold_prices import extract_from_html_file
+
+    path = html_fixture(n_rows)
+    start = time.perf_counter()
+    # 기본 limit(최근 100개)이면 큰 픽스처도 100행만 읽으므로 전체 행을 추출
+    df = extract_from_html_file(path, limit=None)
+    return len(df), time.perf_counter() - start
+
+
+def bench_merge(n_rows):
+    """update_excel.py의 갱신 단계: n행 저장소에 새 데이터를 고시날짜 기준으로 upsert"""
+    import shutil
+    import tempfile
+    import pandas as pd
+    from storage import SQLiteStorage
+
+    # 새 데이터: 최신 10%는 기존과 겹치고 나머지는 동일한 형태의 다른 값
+    new_df = pd.DataFrame(synthetic_rows(max(1, n_rows // 10), seed=1))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'gold_prices.db')
+        shutil.copy(store_fixture(n_rows), path)
+        storage = SQLiteStorage(path)
+        start = time.perf_counter()
+        storage.upsert(new_df, keep='first')
+        seconds = time.perf_counter() - start
+        storage.close()
+    return len(new_df), seconds
+
+
+def bench_load_data(n_rows):
+    from visualize_gold_prices import load_data
+
+    path = store_fixture(n_rows)
+    start = time.perf_counter()
+    df = load_data(path, use_cache=False)
+    return len(df), time.perf_counter() - start
+
+
+def bench_load_data_cached(n_rows):
+    from visualize_gold_prices import load_data
+
+    path = store_fixture(n_rows)
+    load_data(path)  # 캐시 준비
+    start = time.perf_counter()
+    df = load_data(path)
+    return len(df), time.perf_counter() - start
+
+
+BENCHMARKS = {
+    'extract_data_from_html': bench_extract_data_from_html,
+    'extract_from_html_file': bench_extract_from_html_file,
+    'merge': bench_merge,
+    'load_data': bench_load_data,
+    'load_data_cached': bench_load_data_cached,
+}
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_in_child(stage, n_rows, repeat=DEFAULT_REPEAT):
+    sys.path.insert(0, PROJECT_DIR)
+    runs, total, seconds = 0, 0.0, None
+    while True:
+        rows, elapsed = BENCHMARKS[stage](n_rows)
+        runs += 1
+        total += elapsed
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+        if total >= MAX_DURATION or (runs >= repeat and total >= MIN_DURATION):
+            break
+    return {
+        'stage': stage,
+        'size': n_rows,
+        'rows': rows,
+        'runs': runs,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds > 0 else float('inf'),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_benchmark(stage, n_rows, repeat=DEFAULT_REPEAT):
+    """
+    단계 하나를 새 프로세스에서 실행하여 메모리 측정이 서로 섞이지 않게 합니다.
+    repeat번 이상(측정 시간의 합이 MIN_DURATION 이상이 될 때까지) 실행하여 가장 빠른 실행을 반환합니다.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        return pool.apply(_run_in_child, (stage, n_rows, repeat))
+
+
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_regression(result, baseline, tolerance):
+    """기준값 대비 회귀 여부를 확인하여 문제 목록을 반환합니다."""
+    base = baseline.get(result['stage'], {}).get(str(result['size']))
+    if not base:
+        return []
+    problems = []
+    if result['rows_per_sec'] < base['rows_per_sec'] * (1 - tolerance):
+        problems.append(
+            f"처리량 {result['rows_per_sec']:,.0f} rows/s < 기준 {base['rows_per_sec']:,.0f} rows/s"
+        )
+    if (result['peak_rss_mb'] is not None and base.get('peak_rss_mb')
+            and result['peak_rss_mb'] > base['peak_rss_mb'] * (1 + tolerance)):
+        problems.append(
+            f"peak RSS {result['peak_rss_mb']:,.1f} MB > 기준 {base['peak_rss_mb']:,.1f} MB"
+        )
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='금시세 수집 단계별 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='단계마다 최소 실행 횟수 (가장 빠른 실행으로 비교)')
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='측정 결과로 기준값 파일을 갱신합니다.')
+    parser.add_argument('--json', help='측정 결과를 JSON 파일로 저장합니다.')
+    args = parser.parse_args(argv)
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    baseline = load_baseline(args.baseline)
+    results = []
+    failures = []
+
+    print(f"{'stage':<24}{'size':>10}{'rows/sec':>16}{'peak RSS (MB)':>16}")
+    print("-" * 66)
+    for stage in args.stages:
+        for n_rows in args.sizes:
+            result = run_benchmark(stage, n_rows, args.repeat)
+            results.append(result)
+            rss = '-' if result['peak_rss_mb'] is None else f"{result['peak_rss_mb']:,.1f}"
+            print(f"{stage:<24}{n_rows:>10,}{result['rows_per_sec']:>16,.0f}{rss:>16}")
+            for problem in check_regression(result, baseline, args.tolerance):
+                failures.append(f"{stage} ({n_rows:,}행): {problem}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        for result in results:
+            baseline.setdefault(result['stage'], {})[str(result['size'])] = {
+                'rows_per_sec': round(result['rows_per_sec'], 1),
+                'peak_rss_mb': None if result['peak_rss_mb'] is None else round(result['peak_rss_mb'], 1),
+            }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값을 {args.baseline}에 저장했습니다.")
+        return 0
+
+    if failures:
+        print("\n[회귀 발생]")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n[완료] 기준값 대비 회귀가 없습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
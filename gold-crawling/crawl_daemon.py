@@ -0,0 +1,264 @@
+"""
+금시세 페이지를 정해진 주기로 조회하여 바뀐 데이터만 저장소에 반영하는 상주 스케줄러입니다.
+
+- 이전 응답의 ETag/Last-Modified로 조건부 요청(If-None-Match/If-Modified-Since)을 보내고,
+  304 응답이나 내용 해시가 같은 응답은 파싱하지 않고 건너뜁니다.
+- 페이지가 Tabulator ajaxURL로 데이터를 불러오면 다음부터 데이터 소스를 직접 조건부 요청합니다.
+- 수집한 행 중 저장소와 값이 다른(또는 새) 행만 저장 단계로 넘깁니다.
+- 실패하면 지수적으로 늘어나는 대기 시간(지터 포함) 후 다시 시도합니다.
+- 검증자(ETag 등)와 데이터 소스 URL은 상태 파일에 저장하여 다시 시작해도 이어서 사용합니다.
+- --alerts를 지정하면 저장소에 반영한 새 행마다 알림 규칙을 평가합니다.
+- --ticks를 지정하면 장중 모드로, 새 응답마다 가장 최근 고시날짜의 가격을 틱 파일(링 버퍼)에 기록합니다.
+
+사용법:
+    python crawl_daemon.py --interval 600
+    python crawl_daemon.py --once
+    python crawl_daemon.py --interval 15 --ticks ticks.bin
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import io
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from alerts import CONFIG_PATH as ALERTS_PATH, load_engine
+from crawl_gold_prices import GOLD_PRICE_URL, find_data_url, get_session, rows_from_response
+from schema import DATE_COLUMN, PRICE_COLUMNS, normalize_frame
+from storage import EXCEL_PATH, STORE_PATH, open_storage, save_prices
+from tick_buffer import DEFAULT_CAPACITY, TickBuffer
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+STATE_PATH = 'crawl_state.json'
+
+# 조회 주기 (초)
+POLL_INTERVAL = 600.0
+# 실패 후 첫 재시도 대기 시간과 최대 대기 시간 (초)
+RETRY_DELAY = 30.0
+MAX_BACKOFF = 3600.0
+REQUEST_TIMEOUT = 10
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {'validators': {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    state.setdefault('validators', {})
+    return state
+
+
+def save_state(state, path=STATE_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def backoff_delay(failures, base=RETRY_DELAY, cap=MAX_BACKOFF):
+    """연속 실패 횟수에 따른 다음 시도까지의 대기 시간 (지수 증가, 절반~전체 범위의 지터)"""
+    delay = min(cap, base * 2 ** max(0, failures - 1))
+    return random.uniform(delay / 2, delay)
+
+
+def conditional_get(session, url, validators, timeout=REQUEST_TIMEOUT):
+    """
+    이전 응답의 검증자로 조건부 요청을 보냅니다.
+    반환값: (응답, 새 검증자) - 바뀌지 않았으면(304 또는 같은 내용) 응답은 None입니다.
+    바뀐 응답의 새 검증자는 validators에 바로 넣지 않으므로, 호출한 쪽에서 응답을 저장한 뒤에 반영해야
+    저장에 실패했을 때 다음 조회에서 같은 내용을 다시 처리합니다.
+    """
+    cached = validators.get(url, {})
+    headers = {}
+    if cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    response = session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return None, cached
+    response.raise_for_status()
+
+    # 검증자를 보내지 않는 서버도 있으므로 내용 해시로 한 번 더 확인
+    digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+    staged = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'digest': digest,
+    }
+    if cached.get('digest') == digest:
+        # 이미 저장한 내용과 같으므로 새 검증자를 바로 반영
+        validators[url] = staged
+        return None, staged
+    return response, staged
+
+
+def changed_rows(typed, store_path=STORE_PATH):
+    """수집한 행(normalize_frame 결과) 중 저장소에 없거나 값이 다른 행만 반환합니다."""
+    typed = typed.drop_duplicates(subset=[DATE_COLUMN], keep='last')
+    if typed.empty:
+        return typed
+    storage = open_storage(store_path)
+    try:
+        existing = storage.read(start=typed[DATE_COLUMN].min(), end=typed[DATE_COLUMN].max())
+    finally:
+        storage.close()
+
+    merged = typed.merge(existing, on=DATE_COLUMN, how='left', suffixes=('', '_저장'))
+    same = pd.Series(True, index=merged.index)
+    for column in PRICE_COLUMNS:
+        new, old = merged[column], merged[f'{column}_저장']
+        same &= (new == old) | (new.isna() & old.isna())
+    # 저장소에 없는 날짜는 old가 NaN이므로 new가 NaN이 아니면 바뀐 행
+    return typed[~same.to_numpy()].reset_index(drop=True)
+
+
+def record_tick(ticks, typed):
+    """가장 최근 고시날짜 행의 가격을 현재 시각의 틱으로 기록합니다."""
+    latest = typed.loc[typed[DATE_COLUMN].idxmax(), PRICE_COLUMNS]
+    ticks.append(time.time_ns(), *latest.to_numpy(dtype='float64'))
+
+
+def record_last_tick(ticks, store_path=STORE_PATH):
+    """
+    응답이 바뀌지 않았을 때 마지막으로 알려진 가격을 현재 시각의 틱으로 다시 기록합니다.
+    (틱 버퍼가 비어 있으면 저장소의 최신 행을 사용)
+    """
+    if len(ticks):
+        prices = ticks.latest(1)[1][0]
+    else:
+        storage = open_storage(store_path)
+        try:
+            latest = storage.read(limit=1)
+        finally:
+            storage.close()
+        if latest.empty:
+            return
+        prices = latest[PRICE_COLUMNS].to_numpy(dtype='float64')[0]
+    ticks.append(time.time_ns(), *prices)
+
+
+def poll_once(state, url=GOLD_PRICE_URL, session=None, store_path=STORE_PATH, excel_path=None,
+              timeout=REQUEST_TIMEOUT, ticks=None, alerts=None):
+    """
+    한 번 조회하여 바뀐 행을 저장소에 반영합니다. (ticks가 있으면 최근 가격을 틱으로도 기록)
+    alerts(alerts.AlertEngine)가 있으면 반영한 행에 알림 규칙을 적용합니다.
+    반환값: 반영한 행 수 (응답이 바뀌지 않았으면 None)
+    """
+    session = session or get_session()
+    target = state.get('data_url') or url
+    try:
+        response, validators = conditional_get(session, target, state['validators'], timeout)
+    except Exception:
+        if target != url:
+            # 데이터 소스 주소가 바뀌었을 수 있으므로 다음에는 페이지를 조건 없이 받아 다시 찾음
+            # (페이지 검증자가 남아 있으면 304/같은 내용으로 판단되어 ajaxURL을 다시 찾지 않음)
+            state.pop('data_url', None)
+            state['validators'].pop(url, None)
+            state['validators'].pop(target, None)
+        raise
+    if response is None:
+        # 가격이 그대로여도 조회할 때마다 틱을 남겨 장중 시세를 일정한 간격으로 기록
+        if ticks is not None:
+            record_last_tick(ticks, store_path)
+        return None
+
+    if target == url and 'json' not in response.headers.get('Content-Type', ''):
+        data_url = find_data_url(response)
+        if data_url:
+            # 페이지는 껍데기이고 데이터는 ajaxURL에서 오므로 데이터 소스를 직접 조건부 요청
+            # (페이지 내용은 저장하지 않으므로 검증자를 바로 반영)
+            state['data_url'] = data_url
+            state['validators'][url] = validators
+            return poll_once(state, url, session, store_path, excel_path, timeout, ticks, alerts)
+
+    df = pd.DataFrame(rows_from_response(response, session, timeout))
+    if df.empty:
+        raise Exception("응답에서 테이블 데이터를 찾을 수 없습니다.")
+    typed = normalize_frame(df)
+    changed = changed_rows(typed, store_path)
+    if not changed.empty:
+        save_prices(changed, store_path, excel_path, alerts=alerts)
+    # 저장까지 끝난 뒤에 검증자를 반영하고 틱을 기록
+    # (도중에 실패하면 다음 조회에서 같은 응답을 다시 처리하므로 틱이 두 번 기록되지 않음)
+    state['validators'][target] = validators
+    if ticks is not None and not typed.empty:
+        record_tick(ticks, typed)
+    return len(changed)
+
+
+def _log(message):
+    print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}", flush=True)
+
+
+def run(url=GOLD_PRICE_URL, store_path=STORE_PATH, excel_path=None, interval=POLL_INTERVAL,
+        retry_delay=RETRY_DELAY, max_backoff=MAX_BACKOFF, state_path=STATE_PATH, once=False,
+        tick_path=None, tick_capacity=DEFAULT_CAPACITY, alerts_path=None):
+    """interval초마다 poll_once를 실행합니다. (실패하면 지수 백오프 후 재시도)"""
+    state = load_state(state_path)
+    session = get_session()
+    # 틱 파일은 메모리 매핑하므로 다시 시작해도 이어서 기록
+    ticks = TickBuffer.open(tick_path, tick_capacity) if tick_path else None
+    alerts = load_engine(alerts_path) if alerts_path else None
+    failures = 0
+    while True:
+        try:
+            changed = poll_once(state, url, session, store_path, excel_path, ticks=ticks, alerts=alerts)
+            failures = 0
+            state['last_success'] = datetime.now().isoformat(timespec='seconds')
+            if changed is None:
+                _log("변경 없음 (조건부 요청)")
+            else:
+                _log(f"바뀐 행 {changed}개 반영")
+            delay = interval
+        except Exception as e:
+            failures += 1
+            delay = backoff_delay(failures, retry_delay, max_backoff)
+            _log(f"조회 실패 ({failures}회 연속): {e}")
+        state['failures'] = failures
+        save_state(state, state_path)
+        if ticks is not None:
+            ticks.flush()
+
+        if once:
+            return failures == 0
+        if failures:
+            _log(f"{delay:.0f}초 후 재시도합니다.")
+        time.sleep(delay)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='금시세 주기 수집 스케줄러')
+    parser.add_argument('--url', default=GOLD_PRICE_URL, help='금시세 페이지 URL')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--excel', nargs='?', const=EXCEL_PATH,
+                        help='데이터가 바뀌면 엑셀 파일로도 내보냅니다. (기본: gold_prices.xlsx)')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='조회 주기 (초)')
+    parser.add_argument('--retry-delay', type=float, default=RETRY_DELAY, help='실패 후 첫 재시도 대기 시간 (초)')
+    parser.add_argument('--max-backoff', type=float, default=MAX_BACKOFF, help='최대 재시도 대기 시간 (초)')
+    parser.add_argument('--state', default=STATE_PATH, help='조건부 요청 상태 파일 경로')
+    parser.add_argument('--once', action='store_true', help='한 번만 조회하고 종료합니다.')
+    parser.add_argument('--ticks', help='장중 모드: 조회한 최근 가격을 기록할 틱 파일 경로')
+    parser.add_argument('--tick-capacity', type=int, default=DEFAULT_CAPACITY,
+                        help='틱 파일을 새로 만들 때 보관할 최대 틱 수')
+    parser.add_argument('--alerts', nargs='?', const=ALERTS_PATH,
+                        help='반영한 새 행에 알림 규칙을 적용합니다. (기본: alerts.json)')
+    args = parser.parse_args()
+
+    print(f"금시세 주기 수집 시작: {args.url} ({args.interval:.0f}초 간격)")
+    try:
+        ok = run(args.url, args.store, args.excel, args.interval, args.retry_delay,
+                 args.max_backoff, args.state, args.once, args.ticks, args.tick_capacity, args.alerts)
+    except KeyboardInterrupt:
+        print("\n수집을 종료합니다.")
+        ok = True
+    sys.exit(0 if ok else 1)
@@ -1,20 +1,321 @@
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 import time
-import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urljoin
 
-def crawl_gold_prices():
+from instrumentation import span
+from alerts import CONFIG_PATH as ALERTS_PATH, load_engine
+from storage import EXCEL_PATH, STORE_PATH, save_prices
+from tabulator_parser import iter_rows, iter_rows_from_file
+
+# 한국금거래소 금시세 페이지 (일반적인 금시세 사이트)
+# 실제 URL은 사용자가 제공한 페이지로 변경해야 합니다
+GOLD_PRICE_URL = "https://www.goldmarket.co.kr/gold-price"  # 예시 URL
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 컬럼명 -> Tabulator 데이터 소스(JSON)의 필드명
+# (페이지의 tabulator-field 값과 동일 - 국제가 컬럼도 ask 필드에 묶여 있어 Ask와 같은 값을 표시함)
+# 한글 컬럼명으로 오는 경우는 그 값을 그대로 사용합니다.
+JSON_FIELDS = {
+    '고시날짜': 'date',
+    'Bid': 'bid',
+    'Ask': 'ask',
+    '국제가 (USD/T.oz)': 'ask',
+    '국내기준가 (₩/g)': 'domesticPrice',
+}
+
+# 페이지 스크립트에 있는 Tabulator 설정의 ajaxURL
+AJAX_URL_PATTERN = re.compile(r"""ajaxURL\s*:\s*["']([^"']+)["']""")
+
+# 테이블 준비 상태 확인 스크립트
+# Tabulator 인스턴스를 찾으면 dataLoaded/renderComplete 이벤트에 한 번만 연결하고,
+# 현재 행 수와 이벤트 발생 여부를 반환합니다.
+READY_STATE_SCRIPT = """
+    if (!window.__goldTableHooked) {
+        var el = document.querySelector('#example-table') || document.querySelector('.tabulator');
+        var table = null;
+        if (el && window.Tabulator && Tabulator.findTable) {
+            var found = Tabulator.findTable(el);
+            table = found && found[0];
+        }
+        if (table && table.on) {
+            window.__goldTableHooked = true;
+            var mark = function () { window.__goldTableReady = true; };
+            table.on('dataLoaded', mark);
+            table.on('renderComplete', mark);
+            if (table.getDataCount && table.getDataCount() > 0) {
+                mark();
+            }
+        }
+    }
+    return {
+        rows: document.querySelectorAll('.tabulator-row').length,
+        ready: !!window.__goldTableReady
+    };
+"""
+
+# 대기 기본값 (초)
+LOAD_TIMEOUT = 20.0
+SETTLE_TIME = 0.5
+POLL_INTERVAL = 0.1
+
+# 기본 모드에서 저장하는 최대 행 수 (전체 이력 모드는 제한 없음)
+DEFAULT_LIMIT = 100
+
+# 전체 이력 모드의 페이지 크기와 동시에 요청하는 페이지 수
+PAGE_SIZE = 100
+PAGE_WORKERS = 4
+
+# 현재 DOM에 렌더링된 행을 읽는 스크립트
+DOM_ROWS_SCRIPT = """
+    var table = document.querySelector('#example-table') || document.querySelector('.tabulator');
+    if (!table) return null;
+    
+    var rows = table.querySelectorAll('.tabulator-row');
+    var result = [];
+    
+    for (var i = 0; i < rows.length; i++) {
+        var cells = rows[i].querySelectorAll('.tabulator-cell');
+        if (cells.length >= 5) {
+            result.push({
+                '고시날짜': cells[0].textContent.trim(),
+                'Bid': cells[1].textContent.trim(),
+                'Ask': cells[2].textContent.trim(),
+                '국제가 (USD/T.oz)': cells[3].textContent.trim(),
+                '국내기준가 (₩/g)': cells[4].textContent.trim()
+            });
+        }
+    }
+    return result;
+"""
+
+# Tabulator API로 전체 데이터를 읽는 비동기 스크립트
+# (가상 렌더링으로 DOM에 없는 행도 포함하며, 원격 페이지네이션이면 모든 페이지를 순회)
+TABULATOR_DATA_SCRIPT = """
+    var done = arguments[arguments.length - 1];
+    var el = document.querySelector('#example-table') || document.querySelector('.tabulator');
+    var table = null;
+    if (el && window.Tabulator && Tabulator.findTable) {
+        var found = Tabulator.findTable(el);
+        table = found && found[0];
+    }
+    if (!table) { done(null); return; }
+    
+    var remote = table.options.paginationMode === 'remote' || table.options.pagination === 'remote';
+    var maxPage = table.getPageMax ? table.getPageMax() : 1;
+    if (!remote || !maxPage || maxPage <= 1) { done(table.getData()); return; }
+    
+    var result = [];
+    var page = 1;
+    function next() {
+        table.setPage(page).then(function () {
+            result = result.concat(table.getData());
+            if (page >= maxPage) { done(result); } else { page++; next(); }
+        }).catch(function () { done(result); });
+    }
+    next();
+"""
+
+# 테이블 스크롤 영역을 한 화면만큼 내리고 끝에 도달했는지 반환하는 스크립트
+SCROLL_SCRIPT = """
+    var holder = document.querySelector('#example-table .tabulator-tableHolder')
+        || document.querySelector('.tabulator-tableHolder');
+    if (!holder) return true;
+    var before = holder.scrollTop;
+    holder.scrollTop = before + holder.clientHeight;
+    return holder.scrollTop === before;
+"""
+
+_session = None
+
+
+def get_session():
+    """연결을 재사용하는 공용 requests.Session을 반환합니다."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+        _session.headers['User-Agent'] = USER_AGENT
+    return _session
+
+
+def rows_from_json(payload):
+    """Tabulator 데이터 소스(JSON 배열 또는 {"data": [...]})를 행 목록으로 변환합니다."""
+    if isinstance(payload, dict):
+        payload = payload.get('data', [])
+    
+    data = []
+    for item in payload:
+        row = {}
+        for column, field in JSON_FIELDS.items():
+            if column in item:
+                row[column] = item[column]
+            elif field in item:
+                row[column] = item[field]
+            else:
+                break
+        else:
+            data.append(row)
+    return data
+
+
+def fetch_table_http(url=GOLD_PRICE_URL, session=None, timeout=10):
+    """브라우저 없이 HTTP 요청만으로 Tabulator 테이블 데이터를 가져옵니다."""
+    session = session or get_session()
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return rows_from_response(response, session, timeout)
+
+
+def rows_from_response(response, session=None, timeout=10):
     """
-    금시세 데이터를 크롤링하여 엑셀 파일로 저장합니다.
-    Tabulator 테이블에서 데이터를 추출합니다.
+    HTTP 응답에서 테이블 행을 추출합니다.
+    JSON 응답, 서버에서 렌더링된 테이블, 페이지 스크립트의 ajaxURL 순으로 시도합니다.
     """
+    session = session or get_session()
+    if 'json' in response.headers.get('Content-Type', ''):
+        return rows_from_json(response.json())
+    
+    html = response.text
+    try:
+        data = list(iter_rows(html))
+    except Exception:
+        data = []
+    if data:
+        return data
+    
+    data_url = find_data_url(response)
+    if data_url:
+        data_response = session.get(data_url, timeout=timeout)
+        data_response.raise_for_status()
+        data = rows_from_json(data_response.json())
+        if data:
+            return data
+    
+    raise Exception("HTTP 응답에서 테이블 데이터를 찾을 수 없습니다.")
+
+
+def find_data_url(response):
+    """응답이 JSON이면 그 URL을, HTML이면 Tabulator 설정의 ajaxURL을 반환합니다."""
+    if 'json' in response.headers.get('Content-Type', ''):
+        return response.url
+    match = AJAX_URL_PATTERN.search(response.text)
+    if match:
+        return urljoin(response.url, match.group(1))
+    return None
+
+
+def fetch_full_history_http(url=GOLD_PRICE_URL, session=None, page_size=PAGE_SIZE,
+                            max_workers=PAGE_WORKERS, timeout=10):
+    """
+    Tabulator 원격 페이지네이션(?page=N&size=M, 응답의 last_page)을 따라
+    전체 이력을 가져옵니다. 첫 페이지로 전체 페이지 수를 확인한 뒤
+    나머지 페이지는 max_workers개씩 동시에 요청합니다.
+    """
+    session = session or get_session()
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    
+    data_url = find_data_url(response)
+    if not data_url:
+        raise Exception("Tabulator 데이터 소스(ajaxURL)를 찾을 수 없습니다.")
+    
+    def fetch_page(page):
+        page_response = session.get(data_url, params={'page': page, 'size': page_size}, timeout=timeout)
+        page_response.raise_for_status()
+        return page_response.json()
+    
+    first = fetch_page(1)
+    data = rows_from_json(first)
+    if not isinstance(first, dict):
+        # 페이지네이션 없이 전체 데이터를 한 번에 반환하는 소스
+        return data
+    
+    last_page = int(first.get('last_page') or 1)
+    print(f"전체 {last_page}페이지 다운로드 중...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for payload in executor.map(fetch_page, range(2, last_page + 1)):
+            data.extend(rows_from_json(payload))
+    return data
+
+
+def wait_for_table(driver, timeout=LOAD_TIMEOUT, settle_time=SETTLE_TIME, poll_interval=POLL_INTERVAL):
+    """
+    Tabulator 테이블이 준비될 때까지 기다립니다.
+    dataLoaded/renderComplete 이벤트가 발생하거나 .tabulator-row 개수가
+    settle_time 동안 변하지 않으면 바로 반환하고, timeout을 넘기면 포기합니다.
+    
+    반환값: {'ready', 'reason'('event' | 'stable' | 'timeout'), 'waited'(초), 'rows'}
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    last_count = -1
+    stable_since = start
+    
+    while True:
+        state = driver.execute_script(READY_STATE_SCRIPT) or {}
+        now = time.monotonic()
+        count = state.get('rows', 0)
+        
+        if state.get('ready') and count > 0:
+            reason = 'event'
+            break
+        if count > 0 and count == last_count:
+            if now - stable_since >= settle_time:
+                reason = 'stable'
+                break
+        else:
+            last_count = count
+            stable_since = now
+        if now >= deadline:
+            reason = 'timeout'
+            break
+        time.sleep(poll_interval)
+    
+    return {
+        'ready': reason != 'timeout',
+        'reason': reason,
+        'waited': now - start,
+        'rows': count,
+    }
+
+
+def scroll_collect_rows(driver, pause=0.05):
+    """
+    Tabulator 스크롤 영역을 끝까지 내리면서 화면에 렌더링되는 행을 모두 수집합니다.
+    (가상 렌더링으로 한 번에 일부 행만 DOM에 존재하는 경우, 고시날짜 기준 중복 제거)
+    """
+    seen = {}
+    while True:
+        for row in driver.execute_script(DOM_ROWS_SCRIPT) or []:
+            seen.setdefault(row['고시날짜'], row)
+        if driver.execute_script(SCROLL_SCRIPT):
+            break
+        time.sleep(pause)
+    return list(seen.values())
+
+
+def crawl_with_selenium(url=GOLD_PRICE_URL, full_history=False, limit=DEFAULT_LIMIT,
+                        load_timeout=LOAD_TIMEOUT, settle_time=SETTLE_TIME):
+    """
+    헤드리스 Chrome으로 페이지를 렌더링한 뒤 Tabulator 테이블에서 데이터를 추출합니다.
+    full_history이면 Tabulator API(또는 스크롤)로 모든 행을 가져옵니다.
+    실제 대기 시간 정보는 df.attrs['wait']에 기록됩니다.
+    """
+    # HTTP 요청으로 충분한 경우가 많으므로 Selenium은 필요할 때만 불러옵니다
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
     
     # Chrome 옵션 설정
     chrome_options = Options()
@@ -22,131 +323,94 @@ def crawl_gold_prices():
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
     
     # 웹드라이버 초기화
     driver = webdriver.Chrome(options=chrome_options)
     
     try:
-        # 한국금거래소 금시세 페이지 (일반적인 금시세 사이트)
-        # 실제 URL은 사용자가 제공한 페이지로 변경해야 합니다
-        url = "https://www.goldmarket.co.kr/gold-price"  # 예시 URL
-        
         print(f"페이지 로딩 중: {url}")
-        driver.get(url)
-        
-        # 페이지가 완전히 로드될 때까지 대기
-        time.sleep(5)
+        with span('crawl.driver_get'):
+            driver.get(url)
         
-        # Tabulator 테이블이 로드될 때까지 대기
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "tabulator-table"))
-            )
-        except:
-            print("Tabulator 테이블을 찾을 수 없습니다. JavaScript 실행을 기다립니다...")
-            time.sleep(10)
-        
-        # 페이지 소스 가져오기
-        page_source = driver.page_source
+        # Tabulator 테이블이 준비될 때까지 대기 (고정 sleep 없이 준비되는 즉시 진행)
+        with span('crawl.wait_table') as s:
+            wait = wait_for_table(driver, timeout=load_timeout, settle_time=settle_time)
+            s.rows = wait['rows']
+            s.labels['reason'] = wait['reason']
+        if wait['ready']:
+            print(f"테이블 준비 완료 ({wait['reason']}): {wait['waited']:.2f}초 대기, {wait['rows']}개 행")
+        else:
+            print(f"Tabulator 테이블을 {wait['waited']:.2f}초 동안 찾을 수 없습니다.")
         
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(page_source, 'html.parser')
+        with span('crawl.extract', full_history=full_history) as s:
+            if full_history:
+                # Tabulator API로 전체 데이터 추출 (DOM에 렌더링되지 않은 행 포함)
+                driver.set_script_timeout(max(60, load_timeout))
+                data = rows_from_json(driver.execute_async_script(TABULATOR_DATA_SCRIPT) or [])
+                if not data:
+                    print("Tabulator API를 사용할 수 없습니다. 스크롤하며 행을 수집합니다...")
+                    data = scroll_collect_rows(driver)
+            else:
+                # 페이지 소스에서 Tabulator 테이블 행 추출 (#example-table, 없으면 .tabulator)
+                try:
+                    data = list(islice(iter_rows(driver.page_source), limit))
+                except Exception:
+                    data = None
+                
+                # 데이터가 비어있으면 JavaScript로 재시도
+                if not data:
+                    print("HTML 파싱 실패. JavaScript로 데이터 추출 시도...")
+                    data = (driver.execute_script(DOM_ROWS_SCRIPT) or [])[:limit]
+            s.rows = len(data)
         
-        # Tabulator 테이블 찾기
-        table = soup.find('div', {'id': 'example-table'})
-        if not table:
-            # 다른 가능한 ID나 클래스 시도
-            table = soup.find('div', class_='tabulator')
+        df = pd.DataFrame(data)
+        df.attrs['wait'] = wait
+        return df
         
-        if not table:
-            print("테이블을 찾을 수 없습니다. JavaScript로 데이터 추출 시도...")
-            # JavaScript로 데이터 추출 시도
-            data = driver.execute_script("""
-                var table = document.querySelector('#example-table');
-                if (!table) return null;
-                
-                var rows = table.querySelectorAll('.tabulator-row');
-                var result = [];
-                
-                for (var i = 0; i < Math.min(rows.length, 100); i++) {
-                    var row = rows[i];
-                    var cells = row.querySelectorAll('.tabulator-cell');
-                    if (cells.length >= 5) {
-                        result.push({
-                            '고시날짜': cells[0].textContent.trim(),
-                            'Bid': cells[1].textContent.trim(),
-                            'Ask': cells[2].textContent.trim(),
-                            '국제가 (USD/T.oz)': cells[3].textContent.trim(),
-                            '국내기준가 (₩/g)': cells[4].textContent.trim()
-                        });
-                    }
-                }
-                return result;
-            """)
-            
-            if data:
+    finally:
+        driver.quit()
+
+
+def crawl_gold_prices(url=GOLD_PRICE_URL, use_http=True, session=None, full_history=False,
+                      load_timeout=LOAD_TIMEOUT, settle_time=SETTLE_TIME,
+                      store_path=STORE_PATH, excel_path=None, alerts=None):
+    """
+    금시세 데이터를 크롤링하여 저장소에 저장합니다. (excel_path가 있으면 엑셀로도 내보냄)
+    alerts(alerts.AlertEngine)가 있으면 새로 들어오거나 바뀐 행에 알림 규칙을 적용합니다.
+    먼저 HTTP 요청으로 Tabulator 데이터를 직접 가져오고,
+    실패하면 Selenium으로 페이지를 렌더링하여 추출합니다.
+    full_history이면 최근 100개가 아니라 모든 페이지의 전체 이력을 가져옵니다.
+    load_timeout/settle_time은 Selenium 대기 기한(초)입니다.
+    """
+    limit = None if full_history else DEFAULT_LIMIT
+    try:
+        df = None
+        if use_http:
+            try:
+                print(f"HTTP 요청 중: {url}")
+                with span('crawl.http', full_history=full_history) as s:
+                    if full_history:
+                        data = fetch_full_history_http(url, session=session)
+                    else:
+                        data = fetch_table_http(url, session=session)[:limit]
+                    s.rows = len(data)
                 df = pd.DataFrame(data)
-            else:
-                raise Exception("데이터를 추출할 수 없습니다.")
-        else:
-            # HTML에서 직접 데이터 추출
-            rows = table.find_all('div', class_='tabulator-row')
-            data = []
-            
-            for row in rows[:100]:  # 최대 100개
-                cells = row.find_all('div', class_='tabulator-cell')
-                if len(cells) >= 5:
-                    data.append({
-                        '고시날짜': cells[0].get_text(strip=True),
-                        'Bid': cells[1].get_text(strip=True),
-                        'Ask': cells[2].get_text(strip=True),
-                        '국제가 (USD/T.oz)': cells[3].get_text(strip=True),
-                        '국내기준가 (₩/g)': cells[4].get_text(strip=True)
-                    })
-            
-            df = pd.DataFrame(data)
+            except Exception as e:
+                print(f"HTTP 직접 요청 실패: {str(e)}")
+                print("Selenium으로 페이지를 렌더링합니다...")
         
-        # 데이터가 비어있으면 JavaScript 방법 재시도
-        if df.empty:
-            print("HTML 파싱 실패. JavaScript로 재시도...")
-            data = driver.execute_script("""
-                var table = document.querySelector('#example-table');
-                if (!table) {
-                    // 다른 가능한 선택자 시도
-                    table = document.querySelector('.tabulator');
-                }
-                if (!table) return null;
-                
-                var rows = table.querySelectorAll('.tabulator-row');
-                var result = [];
-                
-                for (var i = 0; i < Math.min(rows.length, 100); i++) {
-                    var row = rows[i];
-                    var cells = row.querySelectorAll('.tabulator-cell');
-                    if (cells.length >= 5) {
-                        result.push({
-                            '고시날짜': cells[0].textContent.trim(),
-                            'Bid': cells[1].textContent.trim(),
-                            'Ask': cells[2].textContent.trim(),
-                            '국제가 (USD/T.oz)': cells[3].textContent.trim(),
-                            '국내기준가 (₩/g)': cells[4].textContent.trim()
-                        });
-                    }
-                }
-                return result;
-            """)
-            
-            if data:
-                df = pd.DataFrame(data)
+        if df is None or df.empty:
+            with span('crawl.selenium', full_history=full_history) as s:
+                df = crawl_with_selenium(url, full_history=full_history, limit=limit,
+                                         load_timeout=load_timeout, settle_time=settle_time)
+                s.rows = len(df)
         
         if df.empty:
             raise Exception("데이터를 추출할 수 없습니다. 페이지 구조를 확인해주세요.")
         
-        # 엑셀 파일로 저장
-        output_file = 'gold_prices.xlsx'
-        df.to_excel(output_file, index=False, engine='openpyxl')
-        print(f"\n✅ {len(df)}개의 데이터를 {output_file}에 저장했습니다.")
+        # 저장소에 고시날짜 기준으로 추가 (엑셀은 선택 출력)
+        save_prices(df, store_path, excel_path, alerts=alerts)
         print(f"\n저장된 데이터 미리보기:")
         print(df.head(10))
         
@@ -157,47 +421,32 @@ def crawl_gold_prices():
         print("\n대안: 제공된 HTML에서 직접 데이터 추출 시도...")
         # 제공된 HTML에서 직접 추출하는 방법도 제공
         return None
-        
-    finally:
-        driver.quit()
 
 
-def extract_from_html_file(html_file_path):
+def extract_from_html_file(html_file_path, limit=DEFAULT_LIMIT):
     """
     HTML 파일에서 직접 데이터를 추출합니다.
+    limit이 None이면 모든 행을 추출합니다.
     """
-    with open(html_file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Tabulator 테이블 찾기
-    table = soup.find('div', {'id': 'example-table'})
-    if not table:
-        table = soup.find('div', class_='tabulator')
-    
-    if not table:
-        raise Exception("테이블을 찾을 수 없습니다.")
-    
-    rows = table.find_all('div', class_='tabulator-row')
-    data = []
-    
-    for row in rows[:100]:  # 최대 100개
-        cells = row.find_all('div', class_='tabulator-cell')
-        if len(cells) >= 5:
-            data.append({
-                '고시날짜': cells[0].get_text(strip=True),
-                'Bid': cells[1].get_text(strip=True),
-                'Ask': cells[2].get_text(strip=True),
-                '국제가 (USD/T.oz)': cells[3].get_text(strip=True),
-                '국내기준가 (₩/g)': cells[4].get_text(strip=True)
-            })
+    # 파일을 조각 단위로 읽으며 행 추출
+    data = list(islice(iter_rows_from_file(html_file_path), limit))
     
     df = pd.DataFrame(data)
     return df
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='금시세 데이터 크롤링')
+    parser.add_argument('--url', default=GOLD_PRICE_URL, help='금시세 페이지 URL')
+    parser.add_argument('--full-history', action='store_true',
+                        help='최근 100개 대신 모든 페이지의 전체 이력을 가져옵니다.')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--excel', nargs='?', const=EXCEL_PATH,
+                        help='엑셀 파일로도 내보냅니다. (기본: gold_prices.xlsx)')
+    parser.add_argument('--alerts', nargs='?', const=ALERTS_PATH,
+                        help='새 행에 알림 규칙을 적용합니다. (기본: alerts.json)')
+    args = parser.parse_args()
+    
     # 현재 스크립트의 디렉토리로 이동
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
@@ -205,7 +454,9 @@ if __name__ == "__main__":
     print("금시세 데이터 크롤링 시작...")
     
     # 먼저 웹 크롤링 시도
-    df = crawl_gold_prices()
+    engine = load_engine(args.alerts) if args.alerts else None
+    df = crawl_gold_prices(args.url, full_history=args.full_history,
+                           store_path=args.store, excel_path=args.excel, alerts=engine)
     
     # 실패하면 HTML 파일에서 추출 시도
     if df is None or df.empty:
@@ -213,5 +464,6 @@ if __name__ == "__main__":
         # 사용자가 제공한 HTML을 파일로 저장했다고 가정
         # 실제로는 사용자가 URL을 제공하거나 HTML을 파일로 저장해야 합니다
         print("HTML 파일 경로를 입력하거나, 웹 페이지 URL을 확인해주세요.")
+        print("저장해 둔 HTML 스냅샷이 많으면: python backfill_snapshots.py <디렉토리 또는 glob 패턴>")
     
     print("\n완료!")
@@ -0,0 +1,279 @@
+"""
+설정 파일(sources.json)에 등록된 여러 시세 소스(금, 은, 백금, 거래소별 시세 등)를 동시에 수집합니다.
+
+- 소스마다 URL과 컬럼 매핑(저장 컬럼 -> JSON 필드명, HTML 머리글 제목/tabulator-field 또는 셀 순서)을 지정하므로
+  고시날짜/Bid/Ask 등의 키가 다른 페이지도 코드 수정 없이 추가할 수 있습니다.
+- asyncio로 모든 소스를 한꺼번에 요청하되, 호스트마다 동시 요청 수와 요청 간 최소 간격을 지킵니다.
+  (HTTP 요청은 requests를 asyncio.to_thread로 실행)
+- 결과는 같은 저장소의 소스별 테이블(기본: prices_<이름>)에 고시날짜 기준으로 upsert합니다.
+
+설정 예시 (sources.json):
+    {
+      "hosts": {"default": {"concurrency": 2, "min_interval": 1.0}},
+      "sources": [
+        {"name": "gold", "table": "prices", "url": "https://www.goldmarket.co.kr/gold-price"},
+        {"name": "silver", "url": "https://example.com/silver.json",
+         "columns": {"고시날짜": "date", "Bid": "buy", "Ask": "sell",
+                     "국제가 (USD/T.oz)": "intl", "국내기준가 (₩/g)": "krw"}}
+      ]
+    }
+    (검증하지 않은 은/백금 소스 예시는 sources.example.json에 있습니다.)
+
+사용법:
+    python crawl_sources.py
+    python crawl_sources.py --config sources.json --only gold silver
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+import io
+import time
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from crawl_gold_prices import find_data_url, get_session, rows_from_json
+from storage import STORE_PATH, SQLiteStorage
+from tabulator_parser import COLUMNS, iter_cells, read_columns
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+CONFIG_PATH = 'sources.json'
+
+# 호스트별 제한 기본값: 동시 요청 수, 같은 호스트로 보내는 요청 사이의 최소 간격 (초)
+HOST_CONCURRENCY = 2
+HOST_MIN_INTERVAL = 1.0
+REQUEST_TIMEOUT = 10
+
+# 테이블 이름에 쓰이므로 소스 이름은 영문/숫자/밑줄만 허용
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_]+$')
+
+
+class HostLimiter:
+    """호스트 하나의 동시 요청 수와 요청 시작 간격을 제한합니다."""
+
+    def __init__(self, concurrency=HOST_CONCURRENCY, min_interval=HOST_MIN_INTERVAL):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            # 요청 시작 시각을 차례로 예약하여 min_interval 간격을 유지
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self.min_interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.semaphore.release()
+
+
+def load_config(path=CONFIG_PATH):
+    """설정 파일을 읽고 소스 항목을 검사합니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    sources = config.get('sources', [])
+    if not sources:
+        raise Exception(f"{path}에 등록된 소스가 없습니다.")
+    names = set()
+    for source in sources:
+        name = source.get('name', '')
+        if not _NAME_PATTERN.match(name):
+            raise Exception(f"소스 이름은 영문, 숫자, 밑줄만 사용할 수 있습니다: {name!r}")
+        if name in names:
+            raise Exception(f"소스 이름이 중복되었습니다: {name}")
+        if not source.get('url'):
+            raise Exception(f"{name} 소스에 url이 없습니다.")
+        columns = source.get('columns')
+        if columns is not None and COLUMNS[0] not in columns:
+            raise Exception(f"{name} 소스의 컬럼 매핑에 {COLUMNS[0]}이(가) 없습니다.")
+        names.add(name)
+        source.setdefault('table', f'prices_{name}')
+        if not _NAME_PATTERN.match(source['table']):
+            raise Exception(f"{name} 소스의 테이블 이름이 올바르지 않습니다: {source['table']!r}")
+    config.setdefault('hosts', {})
+    return config
+
+
+def map_json_rows(payload, columns, data_key='data'):
+    """JSON 데이터(배열 또는 {data_key: [...]})를 컬럼 매핑에 따라 저장 컬럼의 행 목록으로 변환합니다."""
+    if isinstance(payload, dict):
+        payload = payload.get(data_key, [])
+    return [
+        {column: item.get(field) for column, field in columns.items()}
+        for item in payload
+        if item.get(columns[COLUMNS[0]]) is not None
+    ]
+
+
+def map_html_rows(html, columns):
+    """HTML 테이블의 행을 컬럼 매핑(저장 컬럼 -> 셀 순서)에 따라 변환합니다."""
+    size = max(columns.values()) + 1
+    return [
+        {column: cells[index] for column, index in columns.items()}
+        for cells in iter_cells(html)
+        if len(cells) >= size
+    ]
+
+
+def html_column_indexes(html, columns):
+    """
+    이름으로 된 컬럼 매핑(저장 컬럼 -> 머리글 제목 또는 tabulator-field)을 셀 순서로 바꿉니다.
+    제목이 필드명보다 우선하며, 같은 필드가 여러 컬럼에 묶여 있으면 첫 컬럼을 사용합니다.
+    찾을 수 없는 이름이 있으면 None을 반환합니다.
+    """
+    indexes = {}
+    for index, (field, title) in enumerate(read_columns(html)):
+        if field:
+            indexes.setdefault(('field', field), index)
+        indexes.setdefault(('title', title), index)
+
+    mapped = {}
+    for column, name in columns.items():
+        if isinstance(name, int):
+            mapped[column] = name
+            continue
+        index = indexes.get(('title', name), indexes.get(('field', name)))
+        if index is None:
+            return None
+        mapped[column] = index
+    return mapped
+
+
+class SourceCrawler:
+    """설정의 소스들을 호스트별 제한을 지키며 동시에 수집합니다."""
+
+    def __init__(self, config, session=None, timeout=REQUEST_TIMEOUT):
+        self.config = config
+        self.session = session or get_session()
+        self.timeout = timeout
+        self._limiters = {}
+
+    def _limiter(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            hosts = self.config['hosts']
+            options = {**hosts.get('default', {}), **hosts.get(host, {})}
+            self._limiters[host] = HostLimiter(
+                options.get('concurrency', HOST_CONCURRENCY),
+                options.get('min_interval', HOST_MIN_INTERVAL),
+            )
+        return self._limiters[host]
+
+    async def _get(self, url):
+        async with self._limiter(url):
+            response = await asyncio.to_thread(self.session.get, url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    async def fetch(self, source):
+        """
+        소스 하나의 행을 가져옵니다. (저장 컬럼 이름의 DataFrame)
+        JSON 응답, 서버에서 렌더링된 테이블, 페이지 스크립트의 ajaxURL 순으로 시도합니다.
+        """
+        columns = source.get('columns')
+        data_key = source.get('data_key', 'data')
+        response = await self._get(source['url'])
+
+        if 'json' in response.headers.get('Content-Type', ''):
+            data = self._json_rows(response.json(), columns, data_key)
+        else:
+            # 파서가 UTF-8로 해석하므로 charset이 없는 응답도 머리글 제목이 깨지지 않도록 바이트를 넘김
+            data = await asyncio.to_thread(self._html_rows, response.content, columns)
+            if not data:
+                data_url = find_data_url(response)
+                if data_url:
+                    data_response = await self._get(data_url)
+                    data = self._json_rows(data_response.json(), columns, data_key)
+        if not data:
+            raise Exception("응답에서 테이블 데이터를 찾을 수 없습니다.")
+        return pd.DataFrame(data, columns=COLUMNS)
+
+    @staticmethod
+    def _json_rows(payload, columns, data_key):
+        if columns is None:
+            if isinstance(payload, dict):
+                payload = payload.get(data_key, [])
+            return rows_from_json(payload)
+        return map_json_rows(payload, {column: field for column, field in columns.items()
+                                       if isinstance(field, str)}, data_key)
+
+    @staticmethod
+    def _html_rows(html, columns):
+        # 기본 매핑은 금시세 페이지와 같은 셀 순서
+        if columns is None:
+            columns = {column: index for index, column in enumerate(COLUMNS)}
+        try:
+            if not all(isinstance(index, int) for index in columns.values()):
+                columns = html_column_indexes(html, columns)
+                # 머리글에 없는 이름은 JSON 데이터 소스용 매핑이므로 ajaxURL로 넘어감
+                if columns is None:
+                    return []
+            return map_html_rows(html, columns)
+        except Exception:
+            return []
+
+    async def crawl(self, sources):
+        """모든 소스를 동시에 수집합니다. 반환값: 소스 이름 -> DataFrame 또는 예외"""
+        results = await asyncio.gather(*(self.fetch(source) for source in sources), return_exceptions=True)
+        return {source['name']: result for source, result in zip(sources, results)}
+
+
+def crawl_sources(config_path=CONFIG_PATH, store_path=STORE_PATH, only=None, session=None):
+    """
+    설정의 소스를 모두 수집하여 같은 저장소의 소스별 테이블에 저장합니다.
+    반환값: 소스 이름 -> 반영한 행 수 (실패한 소스는 예외)
+    """
+    if store_path.endswith('.xlsx'):
+        raise Exception("여러 소스 수집은 SQLite 저장소만 지원합니다.")
+    config = load_config(config_path)
+    sources = [source for source in config['sources'] if not only or source['name'] in only]
+    if not sources:
+        raise Exception(f"수집할 소스가 없습니다: {', '.join(only)}")
+
+    start = time.monotonic()
+    results = asyncio.run(SourceCrawler(config, session).crawl(sources))
+    print(f"{len(sources)}개 소스 수집: {time.monotonic() - start:.2f}초")
+
+    summary = {}
+    for source in sources:
+        name, result = source['name'], results[source['name']]
+        if isinstance(result, Exception):
+            print(f"  ❌ {name}: {result}")
+            summary[name] = result
+            continue
+        # SQLite는 쓰기가 직렬화되므로 수집이 끝난 뒤 테이블마다 차례로 반영
+        storage = SQLiteStorage(store_path, table=source['table'])
+        try:
+            changed = storage.upsert(result)
+            print(f"  ✅ {name}: {len(result)}개 수집, {changed}개 반영 -> {source['table']} (전체 {len(storage)}개)")
+        finally:
+            storage.close()
+        summary[name] = changed
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='여러 시세 소스 동시 수집')
+    parser.add_argument('--config', default=CONFIG_PATH, help='소스 설정 파일 (기본: sources.json)')
+    parser.add_argument('--store', default=STORE_PATH, help='SQLite 저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--only', nargs='+', help='지정한 이름의 소스만 수집합니다.')
+    args = parser.parse_args()
+
+    summary = crawl_sources(args.config, args.store, args.only)
+    failed = [name for name, result in summary.items() if isinstance(result, Exception)]
+    sys.exit(1 if failed else 0)
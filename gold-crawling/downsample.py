@@ -0,0 +1,110 @@
+"""
+긴 시계열을 그래프의 픽셀 폭에 맞게 줄이는 다운샘플링 함수입니다.
+
+화면(이미지)의 한 픽셀 열에는 점 몇 개만 구분되어 보이므로, 이력이 길어져도
+그리는 점의 수를 축의 픽셀 폭 정도로 제한하면 렌더링 시간과 PNG 크기가 일정하게 유지됩니다.
+
+- LTTB (Largest-Triangle-Three-Buckets): 선 그래프의 모양(꺾이는 점)을 보존
+- min/max 버킷: 버킷마다 최솟값과 최댓값을 남겨 급등락(막대, 변동률)을 보존
+"""
+import numpy as np
+
+# 점 수가 이보다 많으면 마커를 생략 (마커가 겹쳐 선이 보이지 않음)
+MARKER_MAX_POINTS = 200
+
+
+def axes_pixel_width(ax, dpi):
+    """축(Axes)이 저장될 이미지에서 차지하는 가로 픽셀 수"""
+    return max(1, int(ax.get_position().width * ax.figure.get_figwidth() * dpi))
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype('datetime64[ns]').astype('int64')
+    return values.astype('float64')
+
+
+def lttb_indices(x, y, n_out):
+    """
+    LTTB로 n_out개의 점을 고른 인덱스를 반환합니다. (x는 오름차순, NaN 없음)
+    첫 점과 마지막 점은 항상 포함하고, 나머지는 버킷마다 이전 선택점 및
+    다음 버킷 평균과 이루는 삼각형의 넓이가 가장 큰 점을 고릅니다.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _as_float(x)
+    x = x - x[0]
+    y = np.asarray(y, dtype='float64')
+
+    # 첫/마지막 점을 제외한 구간을 n_out - 2개 버킷으로 나눔: 버킷 i = [edges[i], edges[i + 1])
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    avg_x = (cum_x[edges[1:]] - cum_x[edges[:-1]]) / counts
+    avg_y = (cum_y[edges[1:]] - cum_y[edges[:-1]]) / counts
+    # 마지막 버킷의 "다음 버킷"은 마지막 점
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_buckets):
+    """
+    y를 n_buckets개의 같은 크기 버킷으로 나누어 버킷마다 최솟값과 최댓값의 인덱스를 반환합니다.
+    첫 점과 마지막 점도 포함하며, 결과는 오름차순입니다.
+    """
+    y = np.asarray(y, dtype='float64')
+    n = len(y)
+    if n_buckets < 1 or 2 * n_buckets >= n:
+        return np.arange(n)
+    size = -(-n // n_buckets)
+    rows = -(-n // size)
+    pad = rows * size - n
+    # NaN과 채움 값은 최솟값/최댓값으로 선택되지 않도록 ±inf로 대체
+    low = np.concatenate((np.where(np.isnan(y), np.inf, y), np.full(pad, np.inf))).reshape(rows, size)
+    high = np.concatenate((np.where(np.isnan(y), -np.inf, y), np.full(pad, -np.inf))).reshape(rows, size)
+    offsets = np.arange(rows) * size
+    indices = np.concatenate((
+        offsets + low.argmin(axis=1),
+        offsets + high.argmax(axis=1),
+        [0, n - 1],
+    ))
+    return np.unique(indices[indices < n])
+
+
+def downsample_indices(x, y, n_pixels, method='lttb'):
+    """
+    n_pixels 폭에 그릴 점의 인덱스를 반환합니다. (줄일 필요가 없으면 전체)
+    method: 'lttb'(선 모양 보존) 또는 'minmax'(버킷별 최솟값/최댓값 보존)
+    NaN인 점은 어차피 그려지지 않으므로 LTTB에서는 제외합니다.
+    """
+    y = np.asarray(y, dtype='float64')
+    if method == 'minmax':
+        return minmax_indices(y, n_pixels)
+    if method != 'lttb':
+        raise Exception(f"지원하지 않는 다운샘플링 방식입니다: {method}")
+    valid = np.flatnonzero(~np.isnan(y))
+    if len(valid) == len(y):
+        return lttb_indices(x, y, n_pixels)
+    return valid[lttb_indices(np.asarray(x)[valid], y[valid], n_pixels)]
+
+
+def marker_for(n_points, marker):
+    """점이 적을 때만 마커를 사용합니다."""
+    return marker if n_points <= MARKER_MAX_POINTS else None
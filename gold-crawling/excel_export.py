@@ -0,0 +1,159 @@
+"""
+금시세 이력을 엑셀(xlsx) 파일로 내보냅니다.
+
+openpyxl의 write-only 모드로 행을 하나씩 파일에 바로 쓰므로 이력이 100만 행을 넘어도
+메모리 사용량이 일정합니다. 가격은 쉼표 문자열이 아니라 숫자 셀에 표시 형식(#,##0.00)을,
+고시날짜는 날짜 셀에 yyyy.mm.dd 형식을 지정하여 엑셀에서 바로 계산하거나 정렬할 수 있습니다.
+
+- by_year이면 연도별 시트로 나누어 씁니다.
+- 시트 하나의 최대 행 수(1,048,576)를 넘으면 '시트 이름 (2)'처럼 다음 시트로 이어서 씁니다.
+
+사용법:
+    python excel_export.py
+    python excel_export.py --output gold_prices_by_year.xlsx --by-year
+"""
+import argparse
+import math
+import os
+import sys
+import io
+from datetime import date
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from schema import DATE_COLUMN, PRICE_COLUMNS
+
+SHEET_NAME = '금시세'
+DATE_NUMBER_FORMAT = 'yyyy.mm.dd'
+PRICE_NUMBER_FORMAT = '#,##0.00'
+COLUMN_WIDTHS = (12, 12, 12, 18, 18)
+
+# 엑셀 시트 하나의 최대 행 수 (머리글 포함)
+MAX_SHEET_ROWS = 1_048_576
+# 1970-01-01의 엑셀 날짜 일련번호 (1900 날짜 체계)
+EXCEL_EPOCH_SERIAL = 25569
+UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def frame_records(df):
+    """저장 형식 DataFrame(normalize_frame 결과)을 (일수, Bid, Ask, 국제가, 국내기준가) 행으로 변환합니다."""
+    days = df[DATE_COLUMN].values.astype('datetime64[D]').astype('int64')
+    prices = df[PRICE_COLUMNS].to_numpy(dtype='float64')
+    return zip(days.tolist(), *prices.T.tolist())
+
+
+class _SheetWriter:
+    """시트 이름 하나에 해당하는 write-only 시트들 (최대 행 수를 넘으면 다음 시트를 만듦)"""
+
+    def __init__(self, workbook, name):
+        self.workbook = workbook
+        self.name = name
+        self.parts = 0
+        self.sheet = None
+        self.rows = 0
+        # 행마다 셀을 만들지 않도록 서식이 지정된 셀을 재사용 (append 시 바로 파일에 기록됨)
+        self.cells = None
+
+    def _next_sheet(self):
+        self.parts += 1
+        title = self.name if self.parts == 1 else f'{self.name} ({self.parts})'
+        sheet = self.workbook.create_sheet(title[:31])
+        for i, width in enumerate(COLUMN_WIDTHS):
+            sheet.column_dimensions[chr(ord('A') + i)].width = width
+        sheet.freeze_panes = 'A2'
+        header = []
+        for column in (DATE_COLUMN, *PRICE_COLUMNS):
+            cell = WriteOnlyCell(sheet, column)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+
+        date_cell = WriteOnlyCell(sheet)
+        date_cell.number_format = DATE_NUMBER_FORMAT
+        self.cells = [date_cell]
+        for _ in PRICE_COLUMNS:
+            cell = WriteOnlyCell(sheet)
+            cell.number_format = PRICE_NUMBER_FORMAT
+            self.cells.append(cell)
+        self.sheet = sheet
+        self.rows = 1
+
+    def append(self, record):
+        if self.sheet is None or self.rows >= MAX_SHEET_ROWS:
+            self._next_sheet()
+        day, *prices = record
+        cells = self.cells
+        cells[0].value = day + EXCEL_EPOCH_SERIAL
+        for cell, price in zip(cells[1:], prices):
+            # NaN 가격은 빈 셀
+            cell.value = None if price is None or math.isnan(price) else price
+        self.sheet.append(cells)
+        self.rows += 1
+
+
+def write_excel(records, path, by_year=False, sheet_name=SHEET_NAME):
+    """
+    (일수, Bid, Ask, 국제가, 국내기준가) 행들을 순서대로 엑셀 파일에 씁니다.
+    by_year이면 고시날짜의 연도별 시트(처음 나온 연도 순서)에 나누어 씁니다.
+    임시 파일에 쓴 뒤 교체하므로 도중에 실패해도 기존 파일은 남습니다.
+    반환값: 쓴 행 수
+    """
+    workbook = Workbook(write_only=True)
+    writers = {}
+    count = 0
+    for record in records:
+        key = _year(record[0]) if by_year else sheet_name
+        writer = writers.get(key)
+        if writer is None:
+            writer = writers[key] = _SheetWriter(workbook, str(key))
+        writer.append(record)
+        count += 1
+    if not writers:
+        # 빈 이력도 머리글만 있는 시트로 저장
+        _SheetWriter(workbook, sheet_name)._next_sheet()
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        workbook.save(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return count
+
+
+def _year(day):
+    """1970-01-01 기준 일수의 연도"""
+    return date.fromordinal(day + UNIX_EPOCH_ORDINAL).year
+
+
+def export_store(store_path, path, by_year=False):
+    """저장소의 전체 이력을 최신 날짜순으로 엑셀 파일에 씁니다. 반환값: 쓴 행 수"""
+    from storage import open_storage
+
+    storage = open_storage(store_path)
+    try:
+        return write_excel(storage.iter_records(), path, by_year)
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    from storage import EXCEL_PATH, STORE_PATH
+
+    # Windows 콘솔 인코딩 설정
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='금시세 이력 엑셀 내보내기')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--output', default=EXCEL_PATH, help='엑셀 파일 경로 (기본: gold_prices.xlsx)')
+    parser.add_argument('--by-year', action='store_true', help='연도별 시트로 나누어 씁니다.')
+    args = parser.parse_args()
+
+    if args.output == args.store:
+        raise Exception("저장소와 같은 파일로 내보낼 수 없습니다.")
+    count = export_store(args.store, args.output, args.by_year)
+    print(f"✅ {count}개 행을 {args.output}에 내보냈습니다.")
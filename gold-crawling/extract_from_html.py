@@ -1,62 +1,73 @@
 """
-제공된 HTML에서 금시세 데이터를 추출하여 엑셀 파일로 저장합니다.
+저장해 둔 HTML(파일 또는 표준 입력)에서 금시세 데이터를 추출하여 저장소에 반영합니다.
+
+사용법:
+    python extract_from_html.py page.html
+    curl -s https://www.goldmarket.co.kr/gold-price | python extract_from_html.py
+    python extract_from_html.py            # 예제 HTML (samples/extract_from_html.html)
 """
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
+import argparse
+from itertools import chain, islice
+import os
 import sys
 import io
 
+from instrumentation import span
+from tabulator_parser import STDIN_PATH, iter_rows, iter_rows_from_path, stdin_is_piped
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-# 사용자가 제공한 HTML 데이터
-html_content = '''<div id="example-table" class="tabulator" role="grid" tabulator-layout="fitColumns"><div class="tabulator-header" style="padding-right: 0px;"><div class="tabulator-headers" style="margin-left: 0px;"><div class="tabulator-col" role="columnheader" aria-sort="none" tabulator-field="date" title="" style="min-width: 40px; height: 40px; padding-top: 0px; width: 227px;"><div class="tabulator-col-content"><div class="tabulator-col-title">고시날짜</div></div></div><div class="tabulator-col" role="columnheader" aria-sort="none" tabulator-field="bid" title="" style="min-width: 40px; height: 40px; padding-top: 0px; width: 227px;"><div class="tabulator-col-content"><div class="tabulator-col-title">Bid</div></div></div><div class="tabulator-col" role="columnheader" aria-sort="none" tabulator-field="ask" title="" style="min-width: 40px; height: 40px; padding-top: 0px; width: 227px;"><div class="tabulator-col-content"><div class="tabulator-col-title">Ask</div></div></div><div class="tabulator-col" role="columnheader" aria-sort="none" tabulator-field="ask" title="" style="min-width: 40px; height: 40px; padding-top: 0px; width: 227px;"><div class="tabulator-col-content"><div class="tabulator-col-title">국제가 (USD/T.oz)</div></div></div><div class="tabulator-col" role="columnheader" aria-sort="none" tabulator-field="domesticPrice" title="" style="min-width: 40px; height: 40px; padding-top: 0px; width: 227px;"><div class="tabulator-col-content"><div class="tabulator-col-title">국내기준가 (₩/g)</div></div></div></div><div class="tabulator-frozen-rows-holder"></div></div><div class="tabulator-tableHolder" tabindex="0" style="height: 1224px;"><div class="tabulator-table" style="padding-top: 0px; padding-bottom: 0px;"><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.15</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,603.84</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,605.62</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,605.62</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">217,845</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.14</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,634.29</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,636.2</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,636.2</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">219,613</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.13</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,592.55</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,594.26</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,594.26</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">217,662</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.12</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,596.77</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,598.45</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,598.45</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">217,433</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.11</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,510.26</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,511.79</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,511.79</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">211,559</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.10</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,510.26</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,511.79</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,511.79</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">211,559</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.09</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,468.23</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,469.91</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,469.91</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">209,484</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.08</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,431.82</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,433.59</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,433.59</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">207,467</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.07</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,467.99</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,469.74</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,469.74</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">208,006</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.06</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,468.35</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,470.09</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,470.09</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">208,084</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.05</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,429.83</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,431.63</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,431.63</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">206,173</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.04</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,329.89</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,332.1</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,332.1</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">201,061</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.03</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,329.89</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,332.1</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,332.1</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">201,061</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.02</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,386.61</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,389.21</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,389.21</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">204,022</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2026.01.01</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,314.12</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,317.07</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,317.07</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">200,725</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.31</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,306.87</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,308.87</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,308.87</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">200,593</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.30</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,364.63</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,366.61</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,366.61</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">203,256</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.29</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,460.5</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,462.7</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,462.7</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">205,855</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.28</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,532.29</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,533.98</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,533.98</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">210,470</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.27</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,532.29</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,533.98</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,533.98</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">210,470</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.26</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,518.17</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,520.37</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,520.37</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">210,265</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.25</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,480.09</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,482.4</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,482.4</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">208,704</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.24</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,481.94</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,484.14</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,484.14</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">209,808</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.23</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,489.52</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,491.32</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,491.32</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">214,073</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.22</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,408.13</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,410.13</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,410.13</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">210,005</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.21</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,337.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,340.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,340.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">206,129</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.20</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,337.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,340.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,340.73</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">206,129</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.19</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,325.95</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,327.49</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,327.49</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">205,874</div></div><div class="tabulator-row tabulator-selectable tabulator-row-even" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.18</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,326.65</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,328.19</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,328.19</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">205,548</div></div><div class="tabulator-row tabulator-selectable tabulator-row-odd" role="row" style="padding-left: 0px;"><div class="tabulator-cell" role="gridcell" tabulator-field="date" title="" style="width: 227px; text-align: center; height: 40px;">2025.12.17</div><div class="tabulator-cell" role="gridcell" tabulator-field="bid" title="" style="width: 227px; text-align: center; height: 40px;">4,318.99</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,320.63</div><div class="tabulator-cell" role="gridcell" tabulator-field="ask" title="" style="width: 227px; text-align: center; height: 40px;">4,320.63</div><div class="tabulator-cell" role="gridcell" tabulator-field="domesticPrice" title="" style="width: 227px; text-align: center; height: 40px;">205,621</div></div></div></div>'''
+# 입력을 지정하지 않았을 때 사용하는 예제 HTML
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'samples', 'extract_from_html.html')
 
-def extract_data_from_html(html_content):
-    """HTML에서 금시세 데이터를 추출합니다."""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Tabulator 테이블 찾기
-    table = soup.find('div', {'id': 'example-table'})
-    if not table:
-        table = soup.find('div', class_='tabulator')
-    
-    if not table:
-        raise Exception("테이블을 찾을 수 없습니다.")
-    
-    # 테이블 행 찾기
-    rows = table.find_all('div', class_='tabulator-row')
-    data = []
-    
-    for row in rows[:100]:  # 최대 100개
-        cells = row.find_all('div', class_='tabulator-cell')
-        if len(cells) >= 5:
-            data.append({
-                '고시날짜': cells[0].get_text(strip=True),
-                'Bid': cells[1].get_text(strip=True),
-                'Ask': cells[2].get_text(strip=True),
-                '국제가 (USD/T.oz)': cells[3].get_text(strip=True),
-                '국내기준가 (₩/g)': cells[4].get_text(strip=True)
-            })
-    
+# 기본으로 사용하는 최대 행 수
+DEFAULT_LIMIT = 100
+
+def extract_data_from_html(html_content, limit=DEFAULT_LIMIT):
+    """HTML(문자열 또는 파일 객체)에서 금시세 데이터를 추출합니다. (limit이 None이면 전체)"""
+    # Tabulator 테이블 행을 스트리밍으로 읽어 최대 limit개까지만 사용
+    with span('parse.html') as s:
+        data = list(islice(iter_rows(html_content), limit))
+        s.rows = len(data)
     return data
 
+def extract_data_from_paths(paths, limit=DEFAULT_LIMIT):
+    """HTML 파일들('-'이면 표준 입력)에서 금시세 데이터를 차례로 추출합니다. (limit이 None이면 전체)"""
+    with span('parse.html') as s:
+        data = list(islice(chain.from_iterable(iter_rows_from_path(path) for path in paths), limit))
+        s.rows = len(data)
+    return data
+
+def default_inputs():
+    """입력 경로가 없으면 파이프로 들어온 표준 입력, 그것도 없으면 예제 HTML을 사용합니다."""
+    return [STDIN_PATH] if stdin_is_piped() else [SAMPLE_PATH]
+
 if __name__ == "__main__":
+    import pandas as pd
+    
+    from storage import EXCEL_PATH, STORE_PATH, save_prices
+    
+    parser = argparse.ArgumentParser(description='HTML에서 금시세 데이터 추출')
+    parser.add_argument('inputs', nargs='*',
+                        help="HTML 파일 경로 ('-'이면 표준 입력, 기본: 파이프 입력 또는 예제 HTML)")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help=f'추출할 최대 행 수 (기본: {DEFAULT_LIMIT}, 0이면 전체)')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--excel', nargs='?', const=EXCEL_PATH,
+                        help='엑셀 파일로도 내보냅니다. (기본: gold_prices.xlsx)')
+    args = parser.parse_args()
+    
     print("HTML에서 금시세 데이터 추출 중...")
     
-    # HTML에서 데이터 추출
-    data = extract_data_from_html(html_content)
+    # HTML에서 데이터 추출 (큰 파일도 조각 단위로 파싱)
+    data = extract_data_from_paths(args.inputs or default_inputs(), args.limit or None)
     
-    # DataFrame 생성
+    # 저장소에 고시날짜 기준으로 추가 (엑셀은 선택 출력)
     df = pd.DataFrame(data)
+    save_prices(df, args.store, args.excel)
     
-    # 엑셀 파일로 저장
-    output_file = 'gold_prices.xlsx'
-    df.to_excel(output_file, index=False, engine='openpyxl')
-    
-    print(f"\n[완료] {len(df)}개의 데이터를 {output_file}에 저장했습니다.")
     print(f"\n저장된 데이터 미리보기:")
     print(df.head(10))
     print(f"\n전체 데이터 개수: {len(df)}")
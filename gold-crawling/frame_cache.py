@@ -0,0 +1,58 @@
+"""
+파싱된 DataFrame을 원본 파일의 내용 해시 기준으로 캐시합니다.
+
+원본 파일(gold_prices.db 등)의 내용이 바뀌지 않았다면 저장소를 다시 읽거나
+타입을 변환하지 않고 캐시된 pickle 파일을 바로 불러옵니다.
+"""
+import glob
+import hashlib
+import os
+
+import pandas as pd
+
+CACHE_DIR = '.cache'
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """파일 내용의 BLAKE2b 해시(16진수)를 반환합니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_frame(source_path, build, cache_dir=None, version=None):
+    """
+    source_path 내용 해시에 해당하는 캐시가 있으면 불러오고,
+    없으면 build()로 DataFrame을 만들어 캐시에 저장합니다. (이전 해시의 캐시는 삭제)
+    version이 바뀌면(build 결과의 형식이 바뀐 경우) 원본이 같아도 캐시를 다시 만듭니다.
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(source_path)), CACHE_DIR)
+    name = os.path.basename(source_path)
+    key = file_digest(source_path)
+    if version is not None:
+        key = f'{key}-v{version}'
+    cache_path = os.path.join(cache_dir, f'{name}.{key}.pkl')
+
+    if os.path.exists(cache_path):
+        return pd.read_pickle(cache_path)
+
+    df = build()
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale in glob.glob(os.path.join(glob.escape(cache_dir), f'{glob.escape(name)}.*.pkl')):
+        os.remove(stale)
+    df.to_pickle(cache_path)
+    return df
+
+
+def frame_digest(df):
+    """DataFrame 내용(컬럼명과 값)의 BLAKE2b 해시(16진수)를 반환합니다."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
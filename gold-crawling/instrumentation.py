@@ -0,0 +1,217 @@
+"""
+수집, 파싱, 저장, 렌더링 단계의 소요 시간과 자원 사용량을 구간(span) 단위로 기록합니다.
+
+    with span('parse.html') as s:
+        data = list(iter_rows(html))
+        s.rows = len(data)
+
+구간마다 경과 시간(wall), CPU 시간, 처리 행 수, 구간 동안 늘어난 최대 메모리를 측정하고
+환경 변수로 지정한 곳에 기록합니다. (둘 다 없으면 측정만 하고 기록하지 않음)
+
+최대 메모리는 프로세스 수명 전체의 최대값(ru_maxrss)이 아니라 tracemalloc으로 추적한
+Python 할당 메모리가 구간 시작 때보다 가장 많이 늘어난 양입니다. tracemalloc은 기록할 곳이
+지정되었을 때(또는 이미 추적 중일 때)만 사용하며, 그렇지 않으면 값은 None입니다.
+
+- GOLD_TRACE_FILE: 구간마다 JSON 한 줄을 추가합니다. (중첩 구간은 parent에 바깥 구간 이름)
+- GOLD_METRICS_FILE: node exporter textfile collector가 읽는 Prometheus 텍스트 파일로,
+  단계(와 레이블)별 마지막 실행 값과 실행 횟수를 보관합니다. 여러 스크립트나 작업 프로세스가
+  같은 파일을 쓰므로 기존 값에 합쳐서 임시 파일로 쓴 뒤 교체합니다.
+"""
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+TRACE_ENV = 'GOLD_TRACE_FILE'
+METRICS_ENV = 'GOLD_METRICS_FILE'
+
+# Prometheus 지표: 이름 -> (타입, 설명)
+METRICS = {
+    'gold_stage_wall_seconds': ('gauge', '마지막 실행의 경과 시간 (초)'),
+    'gold_stage_cpu_seconds': ('gauge', '마지막 실행의 CPU 시간 (초)'),
+    'gold_stage_rows': ('gauge', '마지막 실행에서 처리한 행 수'),
+    'gold_stage_peak_traced_bytes': ('gauge', '마지막 실행 동안 늘어난 Python 할당 메모리의 최대값 (byte, tracemalloc)'),
+    'gold_stage_success': ('gauge', '마지막 실행의 성공 여부 (1: 성공, 0: 실패)'),
+    'gold_stage_last_run_timestamp_seconds': ('gauge', '마지막 실행이 끝난 시각 (Unix 시간)'),
+    'gold_stage_runs_total': ('counter', '실행 횟수'),
+}
+
+_SAMPLE_PATTERN = re.compile(r'^(\w+)(\{.*\})?\s+(\S+)$')
+
+_local = threading.local()
+_write_lock = threading.Lock()
+
+# 메모리를 측정 중인 구간 (모든 스레드): tracemalloc의 최대값은 프로세스에 하나뿐이므로
+# 새 구간이 최대값을 초기화하기 전에 진행 중인 구간들의 최대값에 먼저 반영합니다.
+_memory_lock = threading.Lock()
+_memory_spans = set()
+
+
+def _memory_tracing():
+    """구간 메모리를 측정할지 여부 (기록할 곳이 있으면 tracemalloc을 시작)"""
+    if tracemalloc.is_tracing():
+        return True
+    if os.environ.get(TRACE_ENV) or os.environ.get(METRICS_ENV):
+        tracemalloc.start()
+        return True
+    return False
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+class Span:
+    """
+    with 블록 하나를 측정하는 구간입니다.
+    블록 안에서 rows(처리 행 수)나 labels를 채우면 함께 기록됩니다.
+    """
+
+    def __init__(self, name, rows=None, **labels):
+        self.name = name
+        self.rows = rows
+        self.labels = {key: str(value).lower() if isinstance(value, bool) else str(value) for key, value in labels.items()}
+        self.parent = None
+        self.wall = None
+        self.cpu = None
+        self.peak_traced = None
+        self.ok = None
+        self._memory_start = None
+        self._memory_peak = None
+
+    def __enter__(self):
+        stack = _stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        if _memory_tracing():
+            with _memory_lock:
+                current, peak = tracemalloc.get_traced_memory()
+                for running in _memory_spans:
+                    running._memory_peak = max(running._memory_peak, peak)
+                tracemalloc.reset_peak()
+                self._memory_start = self._memory_peak = current
+                _memory_spans.add(self)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.wall = time.perf_counter() - self._wall_start
+        self.cpu = time.process_time() - self._cpu_start
+        if self in _memory_spans:
+            with _memory_lock:
+                _memory_spans.discard(self)
+                if tracemalloc.is_tracing():
+                    self._memory_peak = max(self._memory_peak, tracemalloc.get_traced_memory()[1])
+                self.peak_traced = self._memory_peak - self._memory_start
+        self.ok = exc_type is None
+        _stack().pop()
+        emit(self)
+        return False
+
+    def to_dict(self):
+        return {
+            'ts': round(time.time(), 3),
+            'span': self.name,
+            'parent': self.parent,
+            'wall_s': round(self.wall, 6),
+            'cpu_s': round(self.cpu, 6),
+            'rows': self.rows,
+            'peak_traced_bytes': self.peak_traced,
+            'ok': self.ok,
+            'pid': os.getpid(),
+            **({'labels': self.labels} if self.labels else {}),
+        }
+
+
+def span(name, rows=None, **labels):
+    """이름과 레이블(예: chart='timeseries')로 구간을 만듭니다. (with 문에 사용)"""
+    return Span(name, rows, **labels)
+
+
+def emit(finished):
+    """끝난 구간을 환경 변수로 지정된 JSON lines 파일과 Prometheus 텍스트 파일에 기록합니다."""
+    trace_path = os.environ.get(TRACE_ENV)
+    metrics_path = os.environ.get(METRICS_ENV)
+    if not trace_path and not metrics_path:
+        return
+    with _write_lock:
+        if trace_path:
+            # 한 번의 write로 추가하므로 여러 프로세스가 같은 파일에 써도 줄이 섞이지 않음
+            with open(trace_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(finished.to_dict(), ensure_ascii=False) + '\n')
+        if metrics_path:
+            _update_metrics(metrics_path, finished)
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(finished):
+    labels = {'stage': finished.name, **finished.labels}
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + '}'
+
+
+def read_metrics(path):
+    """Prometheus 텍스트 파일의 이 모듈 지표를 {(이름, 레이블 문자열): 값}으로 읽습니다."""
+    samples = {}
+    if not os.path.exists(path):
+        return samples
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = _SAMPLE_PATTERN.match(line.strip())
+            if match and match.group(1) in METRICS:
+                samples[(match.group(1), match.group(2) or '')] = float(match.group(3))
+    return samples
+
+
+def format_metrics(samples):
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        series = sorted((labels, value) for (metric, labels), value in samples.items() if metric == name)
+        if not series:
+            continue
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        for labels, value in series:
+            lines.append(f'{name}{labels} {value:.17g}')
+    return '\n'.join(lines) + '\n'
+
+
+def _update_metrics(path, finished):
+    lock_file = open(f'{path}.lock', 'w')
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        samples = read_metrics(path)
+        labels = _label_text(finished)
+        values = {
+            'gold_stage_wall_seconds': finished.wall,
+            'gold_stage_cpu_seconds': finished.cpu,
+            'gold_stage_rows': finished.rows,
+            'gold_stage_peak_traced_bytes': finished.peak_traced,
+            'gold_stage_success': 1 if finished.ok else 0,
+            'gold_stage_last_run_timestamp_seconds': time.time(),
+            'gold_stage_runs_total': samples.get(('gold_stage_runs_total', labels), 0) + 1,
+        }
+        for name, value in values.items():
+            if value is not None:
+                samples[(name, labels)] = value
+
+        # textfile collector가 쓰는 도중의 파일을 읽지 않도록 임시 파일로 쓴 뒤 교체
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(format_metrics(samples))
+        os.replace(tmp_path, path)
+    finally:
+        lock_file.close()
@@ -0,0 +1,257 @@
+"""
+저장된 금시세 데이터를 JSON으로 제공하는 로컬 HTTP 서버입니다.
+
+PNG 이미지나 엑셀 파일 대신 대시보드/프론트엔드가 직접 조회할 수 있도록
+기간 조회, 최신 시세, 요약 통계, 주/월/연 집계를 JSON으로 응답합니다.
+
+- 조회 결과는 저장소 파일의 버전(수정 시각, 크기)을 키에 포함하여 LRU 캐시하므로
+  데이터가 바뀌지 않으면 저장소를 다시 읽지 않습니다.
+- ETag를 보내고 If-None-Match가 같으면 304로 응답하므로 주기적인 폴링 비용이 작습니다.
+- 클라이언트가 지원하면 gzip으로 압축하여 보냅니다.
+
+사용법:
+    python price_server.py --port 8000
+    curl "http://127.0.0.1:8000/api/prices?start=2026-01-01&end=2026-01-15"
+    curl "http://127.0.0.1:8000/api/latest"
+    curl "http://127.0.0.1:8000/api/summary?start=2025-12-01"
+    curl "http://127.0.0.1:8000/api/rollup?resolution=month&series=domestic"
+"""
+import argparse
+import functools
+import gzip
+import hashlib
+import json
+import math
+import os
+import sys
+import io
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from rollups import RESOLUTIONS, SERIES
+from schema import DATE_COLUMN, PRICE_COLUMNS
+from storage import DB_COLUMNS, STORE_PATH, open_storage
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+# 캐시할 조회 결과 수
+CACHE_SIZE = 256
+# 이보다 작은 응답은 압축하지 않음
+GZIP_MIN_SIZE = 512
+
+# 저장소 컬럼 -> JSON 필드
+JSON_FIELDS = dict(zip(PRICE_COLUMNS, DB_COLUMNS[1:]))
+
+ENDPOINTS = ['/api/prices', '/api/latest', '/api/summary', '/api/rollup']
+
+
+class QueryError(Exception):
+    """잘못된 조회 요청 (400으로 응답)"""
+
+
+def _clean(value):
+    """JSON에 쓸 수 없는 NaN/inf를 null로 바꿉니다."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _rows(df):
+    """가격 DataFrame을 날짜 오름차순의 JSON 행 목록으로 변환합니다."""
+    df = df.sort_values(DATE_COLUMN)
+    dates = df[DATE_COLUMN].dt.strftime('%Y-%m-%d').tolist()
+    columns = [df[column].tolist() for column in PRICE_COLUMNS]
+    return [
+        {'date': date, **{JSON_FIELDS[column]: _clean(value) for column, value in zip(PRICE_COLUMNS, values)}}
+        for date, *values in zip(dates, *columns)
+    ]
+
+
+def _series_summary(series):
+    values = series.dropna()
+    if values.empty:
+        return {'count': 0}
+    mean = values.mean()
+    return {
+        'count': int(len(values)),
+        'mean': _clean(float(mean)),
+        'median': _clean(float(values.median())),
+        'std': _clean(float(values.std())),
+        'min': _clean(float(values.min())),
+        'max': _clean(float(values.max())),
+        # 변동계수 (%)
+        'cv': _clean(float(values.std() / mean * 100)) if mean else None,
+        'first': _clean(float(values.iloc[0])),
+        'last': _clean(float(values.iloc[-1])),
+        # 기간 수익률 (%)
+        'change': _clean(float((values.iloc[-1] / values.iloc[0] - 1) * 100)) if values.iloc[0] else None,
+    }
+
+
+def _optional_int(params, name):
+    if name not in params:
+        return None
+    try:
+        value = int(params[name])
+    except ValueError:
+        raise QueryError(f"{name}는 정수여야 합니다: {params[name]}")
+    if value <= 0:
+        raise QueryError(f"{name}는 1 이상이어야 합니다: {value}")
+    return value
+
+
+class PriceQueries:
+    """
+    저장소 조회를 수행하고 결과(JSON 바이트, gzip 바이트, ETag)를 LRU 캐시합니다.
+    캐시 키에 저장소 파일의 (수정 시각, 크기)가 포함되므로 데이터가 바뀌면 자동으로 다시 조회합니다.
+    """
+
+    def __init__(self, store_path=STORE_PATH, cache_size=CACHE_SIZE):
+        self.store_path = store_path
+        self._cached = functools.lru_cache(maxsize=cache_size)(self._run)
+
+    def version(self):
+        try:
+            stat = os.stat(self.store_path)
+        except FileNotFoundError:
+            raise QueryError(f"{self.store_path} 파일을 찾을 수 없습니다.")
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, endpoint, params):
+        """반환값: (JSON 바이트, gzip 바이트 또는 None, ETag)"""
+        if endpoint not in ENDPOINTS:
+            raise LookupError(endpoint)
+        return self._cached(self.version(), endpoint, tuple(sorted(params.items())))
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def _run(self, version, endpoint, params):
+        params = dict(params)
+        storage = open_storage(self.store_path)
+        try:
+            payload = self._query(storage, endpoint, params)
+        except (ValueError, KeyError) as e:
+            raise QueryError(f"잘못된 조회 조건입니다: {e}")
+        finally:
+            storage.close()
+
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return body, compressed, etag
+
+    def _query(self, storage, endpoint, params):
+        start, end = params.get('start'), params.get('end')
+        if endpoint == '/api/prices':
+            df = storage.read(limit=_optional_int(params, 'limit'), start=start, end=end)
+            return {'start': start, 'end': end, 'count': len(df), 'rows': _rows(df)}
+
+        if endpoint == '/api/latest':
+            df = storage.read(limit=1)
+            return {'latest': _rows(df)[0] if len(df) else None, 'total': len(storage)}
+
+        if endpoint == '/api/summary':
+            df = storage.read(start=start, end=end).sort_values(DATE_COLUMN)
+            return {
+                'start': df[DATE_COLUMN].min().strftime('%Y-%m-%d') if len(df) else None,
+                'end': df[DATE_COLUMN].max().strftime('%Y-%m-%d') if len(df) else None,
+                'count': len(df),
+                'series': {JSON_FIELDS[column]: _series_summary(df[column]) for column in PRICE_COLUMNS},
+            }
+
+        # /api/rollup
+        resolution = params.get('resolution', 'month')
+        series = params.get('series', 'domestic')
+        if resolution not in RESOLUTIONS:
+            raise QueryError(f"resolution은 {', '.join(RESOLUTIONS)} 중 하나여야 합니다.")
+        if series not in SERIES:
+            raise QueryError(f"series는 {', '.join(SERIES)} 중 하나여야 합니다.")
+        df = storage.read_rollup(resolution, series, start, end)
+        periods = df['기간'].dt.strftime('%Y-%m-%d').tolist()
+        columns = ['open', 'high', 'low', 'close', 'mean', 'count']
+        return {
+            'resolution': resolution,
+            'series': series,
+            'rows': [
+                {'period': period, **{column: _clean(value) for column, value in zip(columns, values)}}
+                for period, *values in zip(periods, *(df[column].tolist() for column in columns))
+            ],
+        }
+
+
+class PriceRequestHandler(BaseHTTPRequestHandler):
+    """GET /api/* 요청을 PriceQueries로 처리합니다."""
+
+    queries = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        try:
+            body, compressed, etag = self.queries.get(url.path.rstrip('/'), params)
+        except LookupError:
+            return self._send_error(404, f"지원하지 않는 경로입니다. ({', '.join(ENDPOINTS)})")
+        except QueryError as e:
+            return self._send_error(400, str(e))
+
+        if etag in (tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')):
+            self.send_response(304)
+            self._send_common_headers(etag)
+            self.end_headers()
+            return
+
+        use_gzip = compressed is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        payload = compressed if use_gzip else body
+        self.send_response(200)
+        self._send_common_headers(etag)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_common_headers(self, etag):
+        self.send_header('ETag', etag)
+        # 매번 ETag로 재검증 (데이터가 같으면 304)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+
+    def _send_error(self, status, message):
+        body = json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(store_path=STORE_PATH, host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=CACHE_SIZE):
+    """요청마다 스레드로 처리하는 서버를 만듭니다. (serve_forever()로 실행)"""
+    handler = type('Handler', (PriceRequestHandler,), {'queries': PriceQueries(store_path, cache_size)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='금시세 JSON 조회 서버')
+    parser.add_argument('--store', default=STORE_PATH, help='데이터 저장소 경로')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help='캐시할 조회 결과 수')
+    args = parser.parse_args()
+
+    server = create_server(args.store, args.host, args.port, args.cache_size)
+    print(f"금시세 조회 서버 시작: http://{args.host}:{args.port} ({', '.join(ENDPOINTS)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
+    finally:
+        server.server_close()
@@ -0,0 +1,98 @@
+"""
+차트에서 사용하는 가격 컬럼들의 기술 통계와 상관계수를 한 번에 계산합니다.
+
+가격 컬럼들을 (행 수, 컬럼 수) 배열 하나로 모아 평균, 중앙값, 표준편차, 최솟값, 최댓값을
+컬럼 방향으로 한 번씩만 계산하고, 결과는 변경할 수 없는 객체로 만들어 모든 차트가 공유합니다.
+(pandas와 같이 NaN은 제외하며 표준편차는 표본 표준편차)
+"""
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SeriesSummary:
+    """가격 컬럼 하나의 기술 통계"""
+    count: int
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+
+    @property
+    def cv(self):
+        """변동계수 (%)"""
+        return self.std / self.mean * 100 if self.mean else float('nan')
+
+
+@dataclass(frozen=True)
+class PriceStatistics:
+    """컬럼별 SeriesSummary(columns와 같은 순서)와 상관계수 행렬 (읽기 전용)"""
+    columns: tuple
+    summaries: tuple
+    correlation: np.ndarray
+
+    def __post_init__(self):
+        self.correlation.setflags(write=False)
+
+    def __reduce__(self):
+        # 작업 프로세스로 전달된 뒤에도 상관계수 배열이 읽기 전용이 되도록 생성자로 복원
+        return self.__class__, (self.columns, self.summaries, self.correlation)
+
+    def __getitem__(self, column):
+        return self.summaries[self.columns.index(column)]
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        """df의 columns에 대한 통계를 계산합니다."""
+        columns = tuple(columns)
+        values = df[list(columns)].to_numpy(dtype='float64')
+        return cls.from_array(values, columns)
+
+    @classmethod
+    def from_array(cls, values, columns):
+        values = np.asarray(values, dtype='float64').reshape(-1, len(columns))
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if valid.all():
+                means = values.mean(axis=0)
+                medians = np.median(values, axis=0)
+                stds = values.std(axis=0, ddof=1) if len(values) > 1 else np.full(len(columns), np.nan)
+                mins, maxs = values.min(axis=0), values.max(axis=0)
+            else:
+                with warnings.catch_warnings():
+                    # 값이 모두 NaN인 컬럼은 결과도 NaN
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    means = np.nanmean(values, axis=0)
+                    medians = np.nanmedian(values, axis=0)
+                    stds = np.nanstd(values, axis=0, ddof=1)
+                    mins, maxs = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+        summaries = tuple(
+            SeriesSummary(int(count), float(mean), float(median), float(std), float(low), float(high))
+            for count, mean, median, std, low, high in zip(counts, means, medians, stds, mins, maxs)
+        )
+        return cls(columns, summaries, _correlation(values, valid))
+
+
+def _correlation(values, valid):
+    """피어슨 상관계수 행렬 (NaN이 있으면 pandas의 corr()와 같이 두 컬럼이 모두 있는 행만 사용)"""
+    n_columns = values.shape[1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if valid.all():
+            if len(values) < 2:
+                return np.full((n_columns, n_columns), np.nan)
+            return np.atleast_2d(np.corrcoef(values, rowvar=False))
+
+        correlation = np.full((n_columns, n_columns), np.nan)
+        for i in range(n_columns):
+            for j in range(i, n_columns):
+                both = valid[:, i] & valid[:, j]
+                if both.sum() < 2:
+                    continue
+                x, y = values[both, i], values[both, j]
+                x, y = x - x.mean(), y - y.mean()
+                correlation[i, j] = correlation[j, i] = (x @ y) / np.sqrt((x @ x) * (y @ y))
+        return correlation
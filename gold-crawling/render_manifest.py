@@ -0,0 +1,39 @@
+"""
+차트 이미지가 어떤 입력으로 만들어졌는지 기록하는 매니페스트입니다.
+
+이미지마다 입력 데이터 해시, 렌더링 파라미터, 차트 코드 해시를 저장해 두고
+셋 중 하나라도 바뀌었거나 이미지 파일이 없을 때만 다시 그리도록 합니다.
+"""
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = 'render_manifest.json'
+
+
+def text_digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class RenderManifest:
+    """{이미지 파일명: {'data', 'params', 'code'}} 형태의 JSON 매니페스트"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def is_fresh(self, output_file, fingerprint):
+        """이미지 파일이 있고 같은 입력으로 만들어졌으면 True"""
+        return os.path.exists(output_file) and self.entries.get(output_file) == fingerprint
+
+    def record(self, output_file, fingerprint):
+        self.entries[output_file] = fingerprint
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
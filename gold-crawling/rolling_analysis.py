@@ -0,0 +1,324 @@
+"""
+여러 창(window) 길이의 이동 상관계수 행렬과 국내기준가의 국제가 대비 프리미엄을 계산합니다.
+
+- 이동 상관계수는 컬럼 쌍마다 (개수, 합, 제곱합, 곱의 합)의 누적합 차이로 창의 통계를 구하므로
+  창 길이와 관계없이 이력 길이에 비례하는 시간에 모든 창을 한 번에 계산합니다.
+  누적합은 BLOCK_SIZE 행 단위로 나누어 블록 평균을 뺀 값으로 계산하므로 긴 이력에서도 오차가 쌓이지 않습니다.
+  (NaN은 pandas와 같이 두 컬럼이 모두 있는 행만 사용)
+- RollingCorrelation은 같은 통계를 행 하나가 들어올 때마다 O(1)로 이어서 갱신합니다.
+- 프리미엄은 국제가(USD/T.oz)를 원/g으로 환산한 값 대비 국내기준가의 비율입니다.
+  USD/KRW 환율 시계열이 없으면 국내기준가와 국제가로부터 역산한 내재 환율만 계산합니다.
+
+사용법:
+    python rolling_analysis.py --windows 20 60 250
+    python rolling_analysis.py --tables prices prices_silver prices_platinum --series domestic
+    python rolling_analysis.py --fx usdkrw.csv --output premium.csv
+"""
+import argparse
+import sys
+import io
+
+import numpy as np
+import pandas as pd
+
+from schema import DATE_COLUMN, PRICE_COLUMNS
+
+# 1 트로이온스 = 31.1034768 g
+GRAMS_PER_TROY_OUNCE = 31.1034768
+
+DEFAULT_WINDOWS = (20, 60, 250)
+# 누적합을 다시 시작하는 행 수 (블록마다 평균을 빼서 누적 오차를 줄임)
+BLOCK_SIZE = 4096
+# RollingCorrelation이 합계를 창의 값으로 다시 계산하는 주기 (누적 오차 제거)
+RESYNC_EVERY = 4096
+
+SERIES_COLUMNS = dict(zip(('bid', 'ask', 'international', 'domestic'), PRICE_COLUMNS))
+
+
+def _pair_terms(values, offset):
+    """
+    행마다 컬럼 쌍 (i, j)의 (둘 다 있는지, x_i, x_i^2, x_i * x_j) 값을 (4, 행 수, k, k) 배열로 반환합니다.
+    x는 offset을 뺀 값이며, 둘 중 하나라도 NaN이면 0입니다.
+    """
+    x = values - offset
+    valid = ~np.isnan(x)
+    x = np.where(valid, x, 0.0)
+    v = valid.astype('float64')
+    return np.stack([
+        v[:, :, None] * v[:, None, :],
+        x[:, :, None] * v[:, None, :],
+        (x * x)[:, :, None] * v[:, None, :],
+        x[:, :, None] * x[:, None, :],
+    ])
+
+
+def _offset(values):
+    """블록의 컬럼별 평균 (값이 없는 컬럼은 0)"""
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    sums = np.where(valid, values, 0.0).sum(axis=0)
+    return np.divide(sums, counts, out=np.zeros(values.shape[1]), where=counts > 0)
+
+
+def _correlation_from_sums(sums, min_periods):
+    """(개수, 합, 제곱합, 곱의 합) 합계(..., k, k)에서 피어슨 상관계수를 계산합니다."""
+    count, sx, sxx, sxy = sums
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sy = np.swapaxes(sx, -1, -2)
+        cov = sxy - sx * sy / count
+        var_x = sxx - sx * sx / count
+        var_y = np.swapaxes(var_x, -1, -2)
+        correlation = cov / np.sqrt(var_x * var_y)
+    correlation[(count < max(min_periods, 2)) | (var_x <= 0) | (var_y <= 0)] = np.nan
+    return np.clip(correlation, -1.0, 1.0)
+
+
+def _window_sums(values, windows):
+    """
+    (행 수, k) 배열을 BLOCK_SIZE 행씩 나누어, 창 길이마다 각 행에서 끝나는 창의 컬럼 쌍 합계를 계산합니다.
+    합계는 블록의 컬럼 평균(offset)을 뺀 값 기준이며, 블록마다 다음을 생성합니다.
+    (시작 행, 끝 행, offset, {창 길이: (4, 블록 행 수, k, k) 배열 (개수, 합, 제곱합, 곱의 합)})
+    """
+    n = len(values)
+    longest = windows[-1]
+    for start in range(0, n, BLOCK_SIZE):
+        stop = min(start + BLOCK_SIZE, n)
+        # 블록 첫 행의 창이 시작하는 행부터 읽음
+        first = max(0, start - longest + 1)
+        block = values[first:stop]
+        offset = _offset(block)
+        cumulative = np.zeros((4, len(block) + 1) + values.shape[1:] * 2)
+        np.cumsum(_pair_terms(block, offset), axis=1, out=cumulative[:, 1:])
+        end = start + 1 - first
+        rows = stop - start
+        sums = {}
+        for window in windows:
+            begin = end - window
+            if begin >= 0:
+                lower = cumulative[:, begin:begin + rows]
+            else:
+                # 이력 앞부분은 창이 첫 행에서 잘림
+                lower = cumulative[:, np.maximum(np.arange(begin, begin + rows), 0)]
+            sums[window] = cumulative[:, end:end + rows] - lower
+        yield start, stop, offset, sums
+
+
+def _as_windows(windows):
+    windows = sorted(set(int(window) for window in windows))
+    if not windows or windows[0] < 1:
+        raise Exception(f"창 길이는 1 이상이어야 합니다: {windows}")
+    return windows
+
+
+def rolling_correlation(values, windows=DEFAULT_WINDOWS, min_periods=None):
+    """
+    (행 수, k) 배열의 창 길이별 이동 상관계수 행렬을 계산합니다.
+    min_periods(기본: 창 길이)보다 유효한 행이 적은 창은 NaN입니다.
+    반환값: {창 길이: (행 수, k, k) 배열}
+    """
+    values = np.asarray(values, dtype='float64')
+    n, k = values.shape
+    windows = _as_windows(windows)
+    result = {window: np.empty((n, k, k)) for window in windows}
+    for start, stop, _, sums in _window_sums(values, windows):
+        for window in windows:
+            result[window][start:stop] = _correlation_from_sums(
+                sums[window], window if min_periods is None else min_periods
+            )
+    return result
+
+
+def rolling_mean_std(series, windows=DEFAULT_WINDOWS, min_periods=None):
+    """1차원 시계열의 창 길이별 이동 평균과 표본 표준편차를 계산합니다. 반환값: {창 길이: (평균, 표준편차)}"""
+    values = np.asarray(series, dtype='float64').reshape(-1, 1)
+    windows = _as_windows(windows)
+    result = {window: (np.empty(len(values)), np.empty(len(values))) for window in windows}
+    for start, stop, offset, sums in _window_sums(values, windows):
+        for window in windows:
+            count, sx, sxx, _ = sums[window][:, :, 0, 0]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = sx / count
+                std = np.sqrt(np.maximum(sxx - sx * mean, 0.0) / (count - 1))
+            short = count < (window if min_periods is None else min_periods)
+            mean[short] = np.nan
+            std[short | (count < 2)] = np.nan
+            result[window][0][start:stop] = mean + offset[0]
+            result[window][1][start:stop] = std
+    return result
+
+
+class RollingCorrelation:
+    """
+    새 행이 들어올 때마다 창 길이별 이동 상관계수를 이어서 계산합니다.
+    최근 max(windows)개 행을 링 버퍼에 보관하고, 창마다 컬럼 쌍의 합계를 더하고 빼서 갱신합니다.
+    """
+
+    def __init__(self, n_series, windows=DEFAULT_WINDOWS, min_periods=None):
+        self.windows = _as_windows(windows)
+        self.min_periods = min_periods
+        self.size = self.windows[-1]
+        self.buffer = np.full((self.size, n_series), np.nan)
+        self.count = 0
+        self.offset = np.zeros(n_series)
+        self.sums = {window: np.zeros((4, n_series, n_series)) for window in self.windows}
+
+    @classmethod
+    def from_history(cls, values, windows=DEFAULT_WINDOWS, min_periods=None):
+        """이력 전체(행 수, k)를 넣은 상태로 만듭니다. (마지막 행들만 버퍼에 남김)"""
+        values = np.asarray(values, dtype='float64')
+        rolling = cls(values.shape[1], windows, min_periods)
+        tail = values[-rolling.size:]
+        rolling.count = len(values)
+        for i, row in enumerate(tail, start=len(values) - len(tail)):
+            rolling.buffer[i % rolling.size] = row
+        rolling._resync()
+        return rolling
+
+    def update(self, row):
+        """행 하나를 추가하고 창 길이별 현재 상관계수 행렬을 반환합니다."""
+        row = np.asarray(row, dtype='float64')
+        # 가장 긴 창에 값이 없는 컬럼은 그 컬럼의 합계가 모두 0이므로 새 값을 기준(offset)으로 삼음
+        # (첫 행이 NaN인 컬럼이 다음 재계산까지 offset 0으로 남아 오차가 커지는 것을 막음)
+        unset = (self.sums[self.size][0].diagonal() == 0) & ~np.isnan(row)
+        self.offset = np.where(unset, row, self.offset)
+        added = _pair_terms(row[None], self.offset)[:, 0]
+        for window in self.windows:
+            self.sums[window] += added
+            if self.count >= window:
+                # 창에서 빠지는 행
+                leaving = self.buffer[(self.count - window) % self.size]
+                self.sums[window] -= _pair_terms(leaving[None], self.offset)[:, 0]
+        self.buffer[self.count % self.size] = row
+        self.count += 1
+        if self.count % RESYNC_EVERY == 0:
+            self._resync()
+        return self.correlation()
+
+    def correlation(self):
+        """{창 길이: (k, k) 상관계수 행렬}"""
+        return {
+            window: _correlation_from_sums(sums, window if self.min_periods is None else self.min_periods)
+            for window, sums in self.sums.items()
+        }
+
+    def _recent(self, n):
+        """최근 n개 행 (오래된 순서)"""
+        n = min(n, self.count)
+        indices = np.arange(self.count - n, self.count) % self.size
+        return self.buffer[indices]
+
+    def _resync(self):
+        # 더하고 빼면서 쌓인 부동소수점 오차를 없애기 위해 창의 값으로 합계를 다시 계산
+        recent = self._recent(self.size)
+        self.offset = _offset(recent)
+        for window in self.windows:
+            self.sums[window] = _pair_terms(recent[-window:], self.offset).sum(axis=1)
+
+
+def international_krw_per_gram(international, usdkrw):
+    """국제가(USD/T.oz)를 원/g으로 환산합니다."""
+    return np.asarray(international, dtype='float64') * np.asarray(usdkrw, dtype='float64') / GRAMS_PER_TROY_OUNCE
+
+
+def implied_usdkrw(domestic, international):
+    """국내기준가(원/g)와 국제가(USD/T.oz)가 같다고 볼 때의 환율 (원/USD)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.asarray(domestic, dtype='float64') * GRAMS_PER_TROY_OUNCE / np.asarray(international, dtype='float64')
+
+
+def domestic_premium(df, fx=None):
+    """
+    고시날짜별 국내기준가의 국제가 대비 프리미엄을 계산합니다.
+    fx는 고시날짜와 환율(원/USD) 컬럼의 DataFrame으로, 각 고시날짜에는 그 날짜 이전의 가장 최근 환율을 사용합니다.
+    반환값: 고시날짜 오름차순 DataFrame (내재환율, fx가 있으면 국제가환산(₩/g), 프리미엄(%))
+    """
+    df = df[[DATE_COLUMN, PRICE_COLUMNS[2], PRICE_COLUMNS[3]]].sort_values(DATE_COLUMN).reset_index(drop=True)
+    domestic = df[PRICE_COLUMNS[3]].to_numpy(dtype='float64')
+    international = df[PRICE_COLUMNS[2]].to_numpy(dtype='float64')
+    result = pd.DataFrame({DATE_COLUMN: df[DATE_COLUMN], '내재환율': implied_usdkrw(domestic, international)})
+    if fx is not None:
+        fx = fx.sort_values(DATE_COLUMN)
+        rates = pd.merge_asof(df[[DATE_COLUMN]], fx, on=DATE_COLUMN)['환율'].to_numpy(dtype='float64')
+        converted = international_krw_per_gram(international, rates)
+        result['환율'] = rates
+        result['국제가환산(₩/g)'] = converted
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result['프리미엄(%)'] = (domestic / converted - 1) * 100
+    return result
+
+
+def load_fx(path):
+    """날짜와 환율(원/USD) 두 컬럼의 CSV 파일을 읽습니다. (헤더 이름은 상관없음)"""
+    fx = pd.read_csv(path, usecols=[0, 1])
+    fx.columns = [DATE_COLUMN, '환율']
+    fx[DATE_COLUMN] = pd.to_datetime(fx[DATE_COLUMN], errors='coerce')
+    fx['환율'] = pd.to_numeric(fx['환율'].astype(str).str.replace(',', '', regex=False), errors='coerce')
+    fx = fx.dropna()
+    if fx.empty:
+        raise Exception(f"{path}에서 환율 데이터를 읽을 수 없습니다.")
+    return fx
+
+
+def load_series(store_path, tables=('prices',), series=None):
+    """
+    저장소 테이블들의 가격을 고시날짜 기준으로 합쳐 날짜 오름차순 DataFrame으로 읽습니다.
+    테이블이 하나이고 series가 없으면 네 가격 컬럼을, 아니면 테이블마다 series 컬럼 하나를 사용합니다.
+    """
+    from storage import SQLiteStorage
+
+    merged = None
+    for table in tables:
+        storage = SQLiteStorage(store_path, table=table)
+        try:
+            df = storage.read()
+        finally:
+            storage.close()
+        if len(tables) > 1 or series:
+            column = SERIES_COLUMNS[series or 'domestic']
+            df = df[[DATE_COLUMN, column]].rename(columns={column: f'{table}:{series or "domestic"}'})
+        merged = df if merged is None else merged.merge(df, on=DATE_COLUMN, how='outer')
+    return merged.sort_values(DATE_COLUMN).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from storage import STORE_PATH
+
+    # Windows 콘솔 인코딩 설정
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='이동 상관계수와 국내 프리미엄 분석')
+    parser.add_argument('--store', default=STORE_PATH, help='저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--tables', nargs='+', default=['prices'], help='분석할 테이블 (여러 개면 종목 간 상관계수)')
+    parser.add_argument('--series', choices=list(SERIES_COLUMNS), help='테이블마다 사용할 가격 컬럼')
+    parser.add_argument('--windows', type=int, nargs='+', default=list(DEFAULT_WINDOWS), help='창 길이 (행 수)')
+    parser.add_argument('--fx', help='USD/KRW 환율 CSV 파일 (날짜, 환율)')
+    parser.add_argument('--output', help='이동 상관계수와 프리미엄 시계열을 저장할 CSV 파일')
+    args = parser.parse_args()
+
+    df = load_series(args.store, args.tables, args.series)
+    columns = [column for column in df.columns if column != DATE_COLUMN]
+    if df.empty:
+        raise Exception(f"{args.store}에 데이터가 없습니다.")
+    print(f"{len(df)}개 행, 컬럼 {len(columns)}개, 창 {args.windows}")
+
+    correlations = rolling_correlation(df[columns].to_numpy(dtype='float64'), args.windows)
+    output = pd.DataFrame({DATE_COLUMN: df[DATE_COLUMN]})
+    pairs = [(i, j) for i in range(len(columns)) for j in range(i + 1, len(columns))]
+    for window, matrices in correlations.items():
+        print(f"\n[{window}행 이동 상관계수] {df[DATE_COLUMN].iloc[-1]:%Y.%m.%d}")
+        print(pd.DataFrame(matrices[-1], index=columns, columns=columns).round(3).to_string())
+        for i, j in pairs:
+            output[f'corr{window}:{columns[i]}~{columns[j]}'] = matrices[:, i, j]
+
+    if len(args.tables) == 1 and not args.series:
+        premium = domestic_premium(df, load_fx(args.fx) if args.fx else None)
+        column = '프리미엄(%)' if args.fx else '내재환율'
+        print(f"\n[{column}] 최근 {premium[column].iloc[-1]:,.2f}")
+        for window, (mean, std) in rolling_mean_std(premium[column], args.windows).items():
+            print(f"  {window}행 평균 {mean[-1]:,.2f}, 표준편차 {std[-1]:,.2f}")
+        output = output.merge(premium, on=DATE_COLUMN, how='left')
+
+    if args.output:
+        output.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"\n저장했습니다: {args.output}")
@@ -0,0 +1,198 @@
+"""
+Bid, Ask, 국제가, 국내기준가의 주/월/연 단위 집계(시가, 고가, 저가, 종가, 평균)를 미리 계산해 둡니다.
+
+가격 테이블 옆의 {table}_rollup 테이블에 (단위, 시리즈, 기간 시작일)마다 한 행씩 보관하며,
+upsert된 날짜가 속한 기간만 다시 집계하므로 새 행이 추가될 때의 비용은 전체 이력이 아니라
+해당 주/월/연의 행 수에 비례합니다. 긴 기간의 조회나 차트는 일별 행 전체 대신
+수백 개의 집계 행만 읽으면 됩니다. (고가/저가가 기간 내 최댓값/최솟값)
+
+사용법:
+    python rollups.py --resolution month --series domestic
+    python rollups.py --resolution year --start 2020-01-01 --rebuild
+"""
+import argparse
+import sys
+import io
+
+import numpy as np
+import pandas as pd
+
+from schema import date_to_day
+
+# 집계 단위
+RESOLUTIONS = ('week', 'month', 'year')
+# 집계하는 시리즈 (가격 테이블 컬럼)
+SERIES = ('bid', 'ask', 'international', 'domestic')
+# 기간별 집계 방식 (pandas groupby는 NaN을 건너뜀)
+AGGREGATES = [('open', 'first'), ('high', 'max'), ('low', 'min'), ('close', 'last'), ('sum', 'sum'), ('count', 'count')]
+
+_MONTHLY_UNITS = {'month': 'datetime64[M]', 'year': 'datetime64[Y]'}
+
+
+def period_start(resolution, days):
+    """고시날짜(1970-01-01 기준 일수)가 속한 기간의 시작일(일수)을 반환합니다. (주는 월요일 시작)"""
+    days = np.asarray(days, dtype='int64')
+    if resolution == 'week':
+        # 1970-01-01은 목요일
+        return days - (days + 3) % 7
+    unit = _MONTHLY_UNITS[resolution]
+    return days.astype('datetime64[D]').astype(unit).astype('datetime64[D]').astype('int64')
+
+
+def period_end(resolution, starts):
+    """기간 시작일(일수)의 다음 기간 시작일을 반환합니다."""
+    starts = np.asarray(starts, dtype='int64')
+    if resolution == 'week':
+        return starts + 7
+    unit = _MONTHLY_UNITS[resolution]
+    return (starts.astype('datetime64[D]').astype(unit) + 1).astype('datetime64[D]').astype('int64')
+
+
+def aggregate(resolution, rows):
+    """
+    날짜 오름차순 (day, bid, ask, international, domestic) 행들을 기간별로 집계하여
+    (resolution, series, period, open, high, low, close, sum, count) 레코드 목록을 반환합니다.
+    """
+    frame = pd.DataFrame(rows, columns=['day', *SERIES], dtype='float64')
+    frame['period'] = period_start(resolution, frame['day'].to_numpy(dtype='int64'))
+    grouped = frame.groupby('period', sort=True)[list(SERIES)]
+    stats = {name: grouped.agg(func) for name, func in AGGREGATES}
+    periods = stats['open'].index.tolist()
+
+    records = []
+    for series in SERIES:
+        columns = [stats[name][series].tolist() for name, _ in AGGREGATES]
+        for period, *values in zip(periods, *columns):
+            records.append((resolution, series, int(period), *values[:-1], int(values[-1])))
+    return records
+
+
+class RollupIndex:
+    """SQLite 가격 테이블 하나의 주/월/연 집계를 관리합니다."""
+
+    def __init__(self, conn, table='prices'):
+        self.conn = conn
+        self.table = table
+        self.rollup_table = f'{table}_rollup'
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.rollup_table,)
+        ).fetchone()
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.rollup_table} ('
+            'resolution TEXT, series TEXT, period INTEGER, '
+            'open REAL, high REAL, low REAL, close REAL, sum REAL, count INTEGER, '
+            'PRIMARY KEY (resolution, series, period)) WITHOUT ROWID'
+        )
+        if not exists:
+            # 집계 기능 이전에 만들어진 저장소는 처음 열 때 한 번 전체 집계
+            with conn:
+                self.rebuild()
+
+    def _write(self, records):
+        self.conn.executemany(
+            f'INSERT OR REPLACE INTO {self.rollup_table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', records
+        )
+
+    def update(self, days):
+        """
+        추가되거나 변경된 고시날짜(일수)가 속한 기간만 다시 집계합니다.
+        반환값: 다시 집계한 기간 수 (단위별 합계)
+        """
+        days = np.unique(np.asarray(list(days), dtype='int64'))
+        if not len(days):
+            return 0
+        # 영향받는 기간들의 범위를 합쳐 겹치지 않는 구간마다 조회
+        # (멀리 떨어진 날짜 사이의 기간은 읽지 않음, 주는 월/연 경계를 넘을 수 있음)
+        ranges = []
+        for resolution in RESOLUTIONS:
+            starts = np.unique(period_start(resolution, days))
+            ranges.extend(zip(starts.tolist(), period_end(resolution, starts).tolist()))
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        rows = []
+        for start, end in merged:
+            rows.extend(self.conn.execute(
+                f'SELECT day, {", ".join(SERIES)} FROM {self.table} WHERE day >= ? AND day < ? ORDER BY day',
+                (start, end),
+            ).fetchall())
+        row_days = np.array([row[0] for row in rows], dtype='int64')
+
+        updated = 0
+        for resolution in RESOLUTIONS:
+            affected = np.unique(period_start(resolution, days))
+            selected = np.isin(period_start(resolution, row_days), affected)
+            self._write(aggregate(resolution, [row for row, keep in zip(rows, selected) if keep]))
+            updated += len(affected)
+        return updated
+
+    def rebuild(self):
+        """가격 테이블 전체에서 모든 집계를 다시 계산합니다. 반환값: 집계 행 수"""
+        rows = self.conn.execute(
+            f'SELECT day, {", ".join(SERIES)} FROM {self.table} ORDER BY day'
+        ).fetchall()
+        self.conn.execute(f'DELETE FROM {self.rollup_table}')
+        total = 0
+        for resolution in RESOLUTIONS:
+            records = aggregate(resolution, rows)
+            self._write(records)
+            total += len(records)
+        return total
+
+    def read(self, resolution='month', series='domestic', start=None, end=None):
+        """
+        집계를 기간 오름차순의 DataFrame(기간, open, high, low, close, mean, count)으로 읽습니다.
+        start/end(날짜)가 있으면 해당 날짜를 포함하는 기간부터 end 이전에 시작하는 기간까지 읽습니다.
+        """
+        if resolution not in RESOLUTIONS:
+            raise Exception(f"지원하지 않는 집계 단위입니다: {resolution}")
+        if series not in SERIES:
+            raise Exception(f"지원하지 않는 시리즈입니다: {series}")
+        query = (
+            f'SELECT period, open, high, low, close, sum, count FROM {self.rollup_table} '
+            'WHERE resolution = ? AND series = ?'
+        )
+        params = [resolution, series]
+        if start is not None:
+            query += ' AND period >= ?'
+            params.append(int(period_start(resolution, [date_to_day(start)])[0]))
+        if end is not None:
+            query += ' AND period <= ?'
+            params.append(date_to_day(end))
+        query += ' ORDER BY period'
+
+        array = np.array(self.conn.execute(query, params).fetchall(), dtype='float64').reshape(-1, 7)
+        df = pd.DataFrame({'기간': array[:, 0].astype('int64').astype('datetime64[D]').astype('datetime64[ns]')})
+        for i, column in enumerate(['open', 'high', 'low', 'close'], start=1):
+            df[column] = array[:, i]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            df['mean'] = np.where(array[:, 6] > 0, array[:, 5] / array[:, 6], np.nan)
+        df['count'] = array[:, 6].astype('int64')
+        return df
+
+
+if __name__ == "__main__":
+    from storage import STORE_PATH, open_storage
+
+    # Windows 콘솔 인코딩 설정
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='금시세 주/월/연 집계 조회')
+    parser.add_argument('--store', default=STORE_PATH, help='SQLite 저장소 경로')
+    parser.add_argument('--resolution', choices=RESOLUTIONS, default='month')
+    parser.add_argument('--series', choices=SERIES, default='domestic')
+    parser.add_argument('--start', help='시작 날짜 (예: 2025-01-01)')
+    parser.add_argument('--end', help='끝 날짜 (예: 2025-12-31)')
+    parser.add_argument('--rebuild', action='store_true', help='집계를 처음부터 다시 계산합니다.')
+    args = parser.parse_args()
+
+    storage = open_storage(args.store)
+    if args.rebuild and hasattr(storage, 'rollups'):
+        with storage.conn:
+            print(f"집계 {storage.rollups.rebuild()}개를 다시 계산했습니다.")
+    print(storage.read_rollup(args.resolution, args.series, args.start, args.end).to_string(index=False))
+    storage.close()
@@ -0,0 +1,60 @@
+"""
+금시세 데이터의 컬럼과 타입을 정의하고, 쉼표 문자열 형태의 원본 데이터를 변환합니다.
+
+수집 단계에서 한 번만 변환하여 저장소에는 날짜(datetime64)와 가격(숫자)으로 보관합니다.
+(엑셀로 내보낼 때도 숫자 셀에 표시 형식만 지정하므로 문자열로 되돌리지 않음)
+"""
+import numpy as np
+import pandas as pd
+
+from tabulator_parser import COLUMNS
+
+DATE_COLUMN = COLUMNS[0]
+PRICE_COLUMNS = COLUMNS[1:]
+
+# 원본 고시날짜 형식
+DATE_FORMAT = '%Y.%m.%d'
+
+# 분석용 DataFrame의 가격 타입 (저장소는 원본 정밀도를 위해 float64로 보관)
+PRICE_DTYPE = 'float32'
+
+
+def parse_dates(series):
+    """고시날짜 문자열을 datetime64로 변환합니다. (형식이 다르면 일반 파싱으로 재시도)"""
+    parsed = pd.to_datetime(series, format=DATE_FORMAT, errors='coerce')
+    missing = parsed.isna() & series.notna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(series[missing], errors='coerce')
+    return parsed
+
+
+def parse_prices(series):
+    """'4,603.84' 같은 쉼표 문자열 가격을 숫자로 변환합니다."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype('float64')
+    # 빈 입력도 float64가 되도록 맞춤
+    return pd.to_numeric(series.astype(str).str.replace(',', '', regex=False), errors='coerce').astype('float64', copy=False)
+
+
+def normalize_frame(df):
+    """
+    수집한 데이터를 저장 형식(고시날짜 datetime64, 가격 float)으로 변환합니다.
+    고시날짜를 해석할 수 없는 행은 제외합니다.
+    """
+    if df.empty:
+        # 행이 없는 테이블은 pd.DataFrame([])처럼 컬럼도 없으므로 빈 저장 형식으로 맞춤
+        df = pd.DataFrame(columns=COLUMNS)
+    typed = pd.DataFrame({DATE_COLUMN: parse_dates(df[DATE_COLUMN])})
+    for column in PRICE_COLUMNS:
+        typed[column] = parse_prices(df[column])
+    return typed[typed[DATE_COLUMN].notna()].reset_index(drop=True)
+
+
+def date_to_day(value):
+    """날짜(문자열, datetime 등)를 1970-01-01 기준 일수로 변환합니다."""
+    return int(np.datetime64(pd.Timestamp(value), 'D').astype('int64'))
+
+
+def compact_frame(df, columns=PRICE_COLUMNS):
+    """분석용으로 가격(또는 지정한) 컬럼을 PRICE_DTYPE으로 줄입니다. (날짜는 datetime64 유지)"""
+    return df.astype({column: PRICE_DTYPE for column in columns})
@@ -0,0 +1,321 @@
+"""
+금시세 데이터 저장소입니다.
+
+기본 저장소는 SQLite(gold_prices.db)이며 날짜와 가격을 숫자 타입으로 보관합니다.
+엑셀 파일(gold_prices.xlsx)은 필요할 때만 내보내는 선택 출력이고(excel_export.py로 행 단위 스트리밍),
+기존 엑셀 파일만 있는 경우 처음 열 때 SQLite로 옮겨옵니다.
+"""
+import math
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from analytics_state import ANALYTICS_COLUMNS, AnalyticsStore, compute_analytics
+from instrumentation import span
+from rollups import RollupIndex
+from schema import DATE_COLUMN, PRICE_COLUMNS, date_to_day, normalize_frame
+
+STORE_PATH = 'gold_prices.db'
+EXCEL_PATH = 'gold_prices.xlsx'
+
+# SQLite 컬럼 (고시날짜는 1970-01-01 기준 일수로 저장)
+DB_COLUMNS = ['day', 'bid', 'ask', 'international', 'domestic']
+
+# iter_records가 SQLite에서 한 번에 가져오는 행 수
+FETCH_SIZE = 10_000
+
+# 이미 저장된 날짜를 확인할 때 한 번에 조회하는 날짜 수 (SQLite 매개변수 개수 제한보다 작게)
+_QUERY_CHUNK = 500
+
+
+def _day_to_timestamp(day):
+    return pd.Timestamp(int(day), unit='D')
+
+
+def _prices_differ(new, old):
+    """새 가격(NaN 포함)이 저장된 가격(NULL은 None, 없으면 old가 None)과 다른지 확인합니다."""
+    if old is None:
+        return True
+    for value, stored in zip(new, old):
+        if stored is None:
+            if not math.isnan(value):
+                return True
+        elif value != stored:
+            return True
+    return False
+
+
+class SQLiteStorage:
+    """
+    SQLite 테이블 하나에 금시세를 고시날짜 기준으로 보관합니다.
+    데이터를 바꿀 때 같은 트랜잭션에서 분석값(이동평균, 변동률, 누적 수익률)과
+    주/월/연 집계도 갱신합니다.
+    """
+
+    def __init__(self, path=STORE_PATH, table='prices'):
+        self.path = path
+        self.table = table
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} ('
+            'day INTEGER PRIMARY KEY, bid REAL, ask REAL, international REAL, domestic REAL)'
+        )
+        self.analytics = AnalyticsStore(self.conn, table)
+        self.rollups = RollupIndex(self.conn, table)
+
+    def __len__(self):
+        return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def read(self, limit=None, start=None, end=None):
+        """
+        데이터를 최신 날짜순의 DataFrame으로 읽습니다. (limit이 있으면 최신 limit개)
+        start/end(날짜)가 있으면 해당 기간(양 끝 포함)만 기본 키 범위 검색으로 읽습니다.
+        """
+        query = f'SELECT {", ".join(DB_COLUMNS)} FROM {self.table}'
+        conditions, params = [], []
+        if start is not None:
+            conditions.append('day >= ?')
+            params.append(date_to_day(start))
+        if end is not None:
+            conditions.append('day <= ?')
+            params.append(date_to_day(end))
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY day DESC'
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        return self._to_frame(self.conn.execute(query, params).fetchall())
+
+    def iter_records(self):
+        """
+        전체 이력을 최신 날짜순의 (일수, Bid, Ask, 국제가, 국내기준가) 행으로 하나씩 읽습니다.
+        FETCH_SIZE 행씩 가져오므로 이력 전체를 메모리에 올리지 않습니다. (NULL 가격은 NaN)
+        """
+        cursor = self.conn.execute(f'SELECT {", ".join(DB_COLUMNS)} FROM {self.table} ORDER BY day DESC')
+        nan = float('nan')
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            for day, *prices in rows:
+                yield (day, *(nan if price is None else price for price in prices))
+
+    def date_range(self):
+        """저장된 가장 오래된/최신 고시날짜를 반환합니다. (비어 있으면 None, None)"""
+        first, last = self.conn.execute(f'SELECT MIN(day), MAX(day) FROM {self.table}').fetchone()
+        if first is None:
+            return None, None
+        return _day_to_timestamp(first), _day_to_timestamp(last)
+
+    def read_analytics(self, start=None):
+        """분석값을 최신 날짜순의 DataFrame(고시날짜 + ANALYTICS_COLUMNS)으로 읽습니다. (start 이후만)"""
+        return self.analytics.read(None if start is None else date_to_day(start))
+
+    def read_rollup(self, resolution='month', series='domestic', start=None, end=None):
+        """주/월/연 집계를 기간 오름차순의 DataFrame으로 읽습니다. (rollups.RollupIndex.read 참고)"""
+        return self.rollups.read(resolution, series, start, end)
+
+    def upsert(self, df, keep='last'):
+        """
+        고시날짜를 키로 df의 행을 추가합니다.
+        같은 날짜가 이미 있으면 keep='last'는 새 값으로 덮어쓰고, keep='first'는 기존 값을 유지합니다.
+        기본 키 인덱스로 저장된 행과 비교하여 새 날짜와 값이 바뀐 날짜만 쓰므로
+        비용은 전체 이력이 아니라 들어온 행 수에 비례합니다. (최근 100개를 다시 수집해도
+        바뀐 행이 없으면 분석값과 집계를 다시 계산하지 않음)
+        반환값: 추가되거나 변경된 행 수
+        """
+        with span('store.upsert', backend='sqlite', table=self.table, keep=keep) as s:
+            typed = normalize_frame(df).drop_duplicates(subset=[DATE_COLUMN], keep=keep)
+            records = list(self._to_records(typed))
+            with self.conn:
+                stored = self._stored_prices([record[0] for record in records])
+                if keep == 'last':
+                    records = [record for record in records if _prices_differ(record[1:], stored.get(record[0]))]
+                else:
+                    # 기존 날짜는 값을 유지하므로 새 날짜만 추가
+                    records = [record for record in records if record[0] not in stored]
+                self.conn.executemany(f'INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?)', records)
+                if records:
+                    days = [record[0] for record in records]
+                    self.analytics.update(days)
+                    self.rollups.update(days)
+            s.rows = len(records)
+        return s.rows
+
+    def write(self, df):
+        """저장소의 내용을 df로 교체합니다."""
+        typed = normalize_frame(df).drop_duplicates(subset=[DATE_COLUMN], keep='first')
+        with self.conn:
+            self.conn.execute(f'DELETE FROM {self.table}')
+            self.conn.executemany(
+                f'INSERT INTO {self.table} VALUES (?, ?, ?, ?, ?)', self._to_records(typed)
+            )
+            self.analytics.rebuild()
+            self.rollups.rebuild()
+
+    def close(self):
+        self.conn.close()
+
+    def _stored_prices(self, days):
+        """
+        days 중 이미 저장된 날짜의 {일수: (Bid, Ask, 국제가, 국내기준가)} (NULL 가격은 None)
+        (날짜 범위로 조회하면 드문드문한 날짜에도 사이의 모든 행을 읽으므로 기본 키로 해당 날짜만 조회)
+        """
+        stored = {}
+        for start in range(0, len(days), _QUERY_CHUNK):
+            chunk = days[start:start + _QUERY_CHUNK]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f'SELECT {", ".join(DB_COLUMNS)} FROM {self.table} WHERE day IN ({placeholders})', chunk
+            ).fetchall()
+            stored.update((day, tuple(prices)) for day, *prices in rows)
+        return stored
+
+    @staticmethod
+    def _to_records(typed):
+        days = typed[DATE_COLUMN].values.astype('datetime64[D]').astype('int64')
+        prices = typed[PRICE_COLUMNS].to_numpy(dtype='float64')
+        # SQLite는 NaN 가격을 NULL로 저장
+        return zip(days.tolist(), *prices.T.tolist())
+
+    @staticmethod
+    def _to_frame(records):
+        array = np.array(records, dtype='float64').reshape(-1, len(DB_COLUMNS))
+        df = pd.DataFrame({DATE_COLUMN: array[:, 0].astype('int64').astype('datetime64[D]').astype('datetime64[ns]')})
+        for i, column in enumerate(PRICE_COLUMNS, start=1):
+            df[column] = array[:, i]
+        return df
+
+
+class ExcelStorage:
+    """
+    엑셀 파일을 저장소처럼 다룹니다.
+    숫자 셀로 쓰며, 기존 형식(쉼표 문자열)이나 연도별 시트로 나뉜 파일도 읽을 수 있습니다.
+    """
+
+    def __init__(self, path=EXCEL_PATH):
+        self.path = path
+
+    def __len__(self):
+        return len(self.read())
+
+    def read(self, limit=None, start=None, end=None):
+        if not os.path.exists(self.path):
+            return normalize_frame(pd.DataFrame(columns=[DATE_COLUMN, *PRICE_COLUMNS]))
+        sheets = pd.read_excel(self.path, sheet_name=None)
+        df = normalize_frame(pd.concat(sheets.values(), ignore_index=True))
+        df = df.sort_values(DATE_COLUMN, ascending=False)
+        if start is not None:
+            df = df[df[DATE_COLUMN] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df[DATE_COLUMN] <= pd.Timestamp(end)]
+        df = df.reset_index(drop=True)
+        return df if limit is None else df.head(limit)
+
+    def iter_records(self):
+        from excel_export import frame_records
+
+        return frame_records(self.read())
+
+    def date_range(self):
+        df = self.read()
+        if df.empty:
+            return None, None
+        return df[DATE_COLUMN].min(), df[DATE_COLUMN].max()
+
+    def read_analytics(self, start=None):
+        """엑셀 파일에는 분석값을 보관하지 않으므로 읽을 때마다 계산합니다."""
+        df = self.read().sort_values(DATE_COLUMN).reset_index(drop=True)
+        analytics = pd.DataFrame({DATE_COLUMN: df[DATE_COLUMN]})
+        for column, values in compute_analytics(df[PRICE_COLUMNS[-1]]).items():
+            analytics[column] = values
+        if start is not None:
+            analytics = analytics[analytics[DATE_COLUMN] >= pd.Timestamp(start)]
+        return analytics[[DATE_COLUMN, *ANALYTICS_COLUMNS]].iloc[::-1].reset_index(drop=True)
+
+    def read_rollup(self, resolution='month', series='domestic', start=None, end=None):
+        """엑셀 파일에는 집계를 보관하지 않으므로 읽을 때마다 계산합니다."""
+        # 메모리 SQLite에 옮겨 SQLite 저장소와 같은 방식으로 집계
+        memory = SQLiteStorage(':memory:')
+        try:
+            memory.write(self.read())
+            return memory.read_rollup(resolution, series, start, end)
+        finally:
+            memory.close()
+
+    def upsert(self, df, keep='last'):
+        """엑셀 파일은 부분 갱신이 불가능하므로 전체를 읽어 병합한 뒤 다시 씁니다."""
+        with span('store.upsert', backend='excel', keep=keep) as s:
+            existing = self.read()
+            new = normalize_frame(df)
+            frames = [new, existing] if keep == 'last' else [existing, new]
+            combined = pd.concat(frames, ignore_index=True).drop_duplicates(subset=[DATE_COLUMN], keep='first')
+            combined = combined.sort_values(DATE_COLUMN, ascending=False)
+            self.write(combined)
+            s.rows = len(combined) - len(existing)
+        return s.rows
+
+    def write(self, df, by_year=False):
+        from excel_export import frame_records, write_excel
+
+        return write_excel(frame_records(normalize_frame(df)), self.path, by_year)
+
+    def close(self):
+        pass
+
+
+def open_storage(path=STORE_PATH, legacy_excel=EXCEL_PATH):
+    """
+    경로의 확장자에 맞는 저장소를 엽니다. (.xlsx는 엑셀, 그 외는 SQLite)
+    새 SQLite 저장소를 만들 때 기존 엑셀 파일이 있으면 데이터를 옮겨옵니다.
+    """
+    if path.endswith('.xlsx'):
+        return ExcelStorage(path)
+
+    is_new = not os.path.exists(path)
+    storage = SQLiteStorage(path)
+    if is_new and legacy_excel and os.path.exists(legacy_excel):
+        legacy = ExcelStorage(legacy_excel).read()
+        storage.write(legacy)
+        print(f"기존 엑셀 데이터 {len(legacy)}개를 {path}로 옮겼습니다.")
+    return storage
+
+
+def export_excel(data, excel_path=EXCEL_PATH, by_year=False):
+    """
+    저장소(iter_records가 있는 객체) 또는 DataFrame의 데이터를 엑셀 파일로 내보냅니다.
+    저장소는 행 단위로 읽어 바로 쓰므로 이력이 길어도 메모리 사용량이 일정합니다.
+    """
+    # openpyxl은 엑셀로 내보낼 때만 필요하므로 여기서 불러옴
+    from excel_export import frame_records, write_excel
+
+    with span('store.export_excel', by_year=by_year) as s:
+        if hasattr(data, 'iter_records'):
+            records = data.iter_records()
+        else:
+            records = frame_records(normalize_frame(data))
+        s.rows = write_excel(records, excel_path, by_year)
+    print(f"엑셀 파일로 내보냈습니다: {excel_path}")
+
+
+def save_prices(df, store_path=STORE_PATH, excel_path=None, keep='last', alerts=None):
+    """
+    데이터를 저장소에 고시날짜 기준으로 추가(upsert)하고,
+    excel_path가 있으면 전체 이력을 엑셀 파일로도 내보냅니다.
+    alerts(alerts.AlertEngine)가 있으면 새로 들어오거나 바뀐 행에 알림 규칙을 적용합니다.
+    반환값: 추가되거나 변경된 행 수
+    """
+    storage = open_storage(store_path)
+    try:
+        before = alerts.snapshot(storage) if alerts else None
+        changed = storage.upsert(df, keep=keep)
+        print(f"\n✅ {changed}개의 데이터를 {store_path}에 반영했습니다. (전체 {len(storage)}개)")
+        if alerts and changed:
+            alerts.check_ingest(storage, before)
+        if excel_path:
+            export_excel(storage, excel_path)
+    finally:
+        storage.close()
+    return changed
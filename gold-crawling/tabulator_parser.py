@@ -0,0 +1,210 @@
+"""
+Tabulator 테이블(#example-table) HTML에서 금시세 행을 스트리밍 방식으로 추출합니다.
+
+BeautifulSoup(html.parser)로 전체 트리를 만드는 대신 lxml 파서에 HTML을 조각 단위로
+넣고 이벤트(target) 콜백으로 셀 텍스트만 모읍니다. 트리를 만들지 않으므로
+입력 크기와 관계없이 메모리 사용량이 일정하고, 행은 제너레이터로 하나씩 전달됩니다.
+"""
+import mmap
+import os
+import stat
+import sys
+
+from lxml import etree
+
+# 추출 결과 컬럼 (셀 순서대로)
+COLUMNS = ['고시날짜', 'Bid', 'Ask', '국제가 (USD/T.oz)', '국내기준가 (₩/g)']
+
+# 파서에 한 번에 넣을 조각 크기
+CHUNK_SIZE = 1 << 20
+
+# 이보다 큰 파일은 메모리 매핑하여 읽음 (파일 버퍼를 거치지 않고 페이지 캐시에서 바로 조각을 만듦)
+MMAP_THRESHOLD = 8 * CHUNK_SIZE
+
+# 표준 입력을 뜻하는 경로
+STDIN_PATH = '-'
+
+# div 역할
+_TABLE, _ROW, _CELL, _COLUMN, _TITLE, _OTHER = range(6)
+
+
+class _RowCollector:
+    """
+    lxml 파서 target: div 스택을 따라가며 완성된 행(셀 텍스트 목록)을 rows에 쌓습니다.
+    머리글 컬럼은 [tabulator-field, 제목] 목록으로 columns에 쌓습니다.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.columns = []
+        self.table_found = False
+        self._stack = []      # 열려 있는 div의 역할
+        self._tables = 0      # 열려 있는 테이블 컨테이너 수
+        self._in_row = False
+        self._in_cell = False
+        self._in_column = False
+        self._cells = []
+        self._text = []       # 현재 셀의 완성된 텍스트 조각
+        self._piece = []      # 현재 텍스트 노드 (data 콜백이 나뉘어 올 수 있음)
+
+    def _flush_piece(self):
+        if self._piece:
+            self._text.append(''.join(self._piece).strip())
+            self._piece = []
+
+    def start(self, tag, attrib):
+        if self._in_cell:
+            self._flush_piece()
+        if tag != 'div':
+            return
+        cls = attrib.get('class', '')
+        role = _OTHER
+        if attrib.get('id') == 'example-table' or 'tabulator' in cls.split():
+            role = _TABLE
+            self._tables += 1
+            self.table_found = True
+        elif self._tables and 'tabulator-row' in cls.split():
+            role = _ROW
+            self._in_row = True
+            self._cells = []
+        elif self._in_row and 'tabulator-cell' in cls.split():
+            role = _CELL
+            self._in_cell = True
+            self._text = []
+            self._piece = []
+        elif self._tables and not self._in_row and 'tabulator-col' in cls.split():
+            role = _COLUMN
+            self._in_column = True
+            self.columns.append([attrib.get('tabulator-field'), ''])
+        elif self._in_column and 'tabulator-col-title' in cls.split():
+            # 제목 텍스트는 셀과 같은 방식으로 모음
+            role = _TITLE
+            self._in_cell = True
+            self._text = []
+            self._piece = []
+        self._stack.append(role)
+
+    def end(self, tag):
+        if self._in_cell:
+            self._flush_piece()
+        if tag != 'div' or not self._stack:
+            return
+        role = self._stack.pop()
+        if role == _CELL:
+            self._in_cell = False
+            # BeautifulSoup의 get_text(strip=True)와 동일한 결과
+            self._cells.append(''.join(self._text))
+        elif role == _ROW:
+            self._in_row = False
+            if self._cells:
+                self.rows.append(self._cells)
+        elif role == _TITLE:
+            self._in_cell = False
+            self.columns[-1][1] = ''.join(self._text)
+        elif role == _COLUMN:
+            self._in_column = False
+        elif role == _TABLE:
+            self._tables -= 1
+
+    def data(self, text):
+        if self._in_cell:
+            self._piece.append(text)
+
+    def close(self):
+        return None
+
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    else:
+        # 파일 객체
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_cells(source, chunk_size=CHUNK_SIZE):
+    """
+    HTML 문자열(또는 읽기 가능한 파일 객체)에서 테이블 행마다 셀 텍스트 목록을 하나씩 생성합니다.
+    컬럼 구성이 다른 테이블도 셀 순서로 읽을 수 있습니다.
+    """
+    collector = _RowCollector()
+    parser = etree.HTMLParser(target=collector, encoding='utf-8')
+
+    for chunk in _iter_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        parser.feed(chunk)
+        if collector.rows:
+            yield from collector.rows
+            collector.rows = []
+
+    parser.close()
+    yield from collector.rows
+    collector.rows = []
+
+    if not collector.table_found:
+        raise Exception("테이블을 찾을 수 없습니다.")
+
+
+def read_columns(source, chunk_size=CHUNK_SIZE):
+    """
+    테이블 머리글의 컬럼을 셀 순서대로 (tabulator-field, 제목) 목록으로 반환합니다.
+    머리글은 행보다 앞에 있으므로 첫 행이 나오면 더 읽지 않습니다.
+    """
+    collector = _RowCollector()
+    parser = etree.HTMLParser(target=collector, encoding='utf-8')
+
+    for chunk in _iter_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        parser.feed(chunk)
+        if collector.rows:
+            break
+    else:
+        parser.close()
+
+    if not collector.table_found:
+        raise Exception("테이블을 찾을 수 없습니다.")
+    return [tuple(column) for column in collector.columns]
+
+
+def iter_rows(source, chunk_size=CHUNK_SIZE):
+    """
+    HTML 문자열(또는 읽기 가능한 파일 객체)에서 금시세 행을 하나씩 생성합니다.
+    셀이 5개 미만인 행은 건너뜁니다.
+    """
+    for cells in iter_cells(source, chunk_size):
+        if len(cells) >= len(COLUMNS):
+            yield dict(zip(COLUMNS, cells))
+
+
+def iter_rows_from_file(html_file_path, chunk_size=CHUNK_SIZE):
+    """HTML 파일에서 금시세 행을 하나씩 생성합니다. (큰 파일은 메모리 매핑하여 조각 단위로 파싱)"""
+    with open(html_file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield from iter_rows(f, chunk_size)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter_rows(mapped, chunk_size)
+
+
+def iter_rows_from_path(path, chunk_size=CHUNK_SIZE):
+    """HTML 파일 경로('-'이면 표준 입력)에서 금시세 행을 하나씩 생성합니다."""
+    if path == STDIN_PATH:
+        yield from iter_rows(sys.stdin.buffer, chunk_size)
+    else:
+        yield from iter_rows_from_file(path, chunk_size)
+
+
+def stdin_is_piped():
+    """표준 입력으로 파이프나 (비어 있지 않은) 파일이 연결되어 있으면 True"""
+    try:
+        info = os.fstat(sys.stdin.fileno())
+    except (AttributeError, ValueError, OSError):
+        return False
+    return stat.S_ISFIFO(info.st_mode) or (stat.S_ISREG(info.st_mode) and info.st_size > 0)
@@ -0,0 +1,36 @@
+"""
+테스트 공용 설정: gold-crawling 디렉토리의 모듈을 불러올 수 있게 하고 합성 시세 데이터를 만듭니다.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(TEST_DIR)
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from tabulator_parser import COLUMNS  # noqa: E402
+
+
+@pytest.fixture
+def make_prices():
+    """
+    고시날짜 목록으로 수집 결과와 같은 형태(쉼표 문자열 가격)의 DataFrame을 만드는 함수를 반환합니다.
+    nan_rate만큼의 가격은 빈 문자열(NaN)입니다.
+    """
+    def make(dates, seed=0, nan_rate=0.0):
+        rng = np.random.default_rng(seed)
+        dates = pd.DatetimeIndex(dates)
+        prices = np.round(1000 + rng.normal(0, 20, (len(dates), 4)).cumsum(axis=0), 2)
+        data = {COLUMNS[0]: dates.strftime('%Y.%m.%d')}
+        for i, column in enumerate(COLUMNS[1:]):
+            values = [f'{price:,.2f}' for price in prices[:, i]]
+            for j in np.flatnonzero(rng.random(len(dates)) < nan_rate):
+                values[j] = ''
+            data[column] = values
+        return pd.DataFrame(data)
+    return make
@@ -0,0 +1,109 @@
+"""
+알림 엔진 테스트: 이진 검색 색인으로 찾은 규칙을 모든 규칙을 하나씩 비교한 결과와 비교합니다.
+"""
+import math
+import operator
+
+import numpy as np
+import pandas as pd
+
+from alerts import AlertEngine, METRICS, OPERATORS, Rule, _row_dict, rows_frame
+from storage import SQLiteStorage
+
+COMPARE = {'>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt}
+
+
+class _ListSink:
+    def __init__(self):
+        self.events = []
+
+    def send(self, events):
+        self.events.extend(events)
+
+
+def _random_rules(rng, count):
+    rules = []
+    for i in range(count):
+        metric = rng.choice(list(METRICS))
+        # 같은 임계값이 여러 번 나오도록 반올림
+        threshold = float(np.round(rng.normal(0, 3), 1)) if metric == 'change' else float(np.round(rng.uniform(900, 1100)))
+        rules.append(Rule(f'rule{i}', str(metric), str(rng.choice(OPERATORS)), threshold))
+    for i, (metric, direction) in enumerate([('ma5', 'up'), ('ma5', 'down'), ('ma10', 'both')]):
+        rules.append(Rule(f'cross{i}', metric, direction=direction))
+    return rules
+
+
+def _brute_force(rules, row, previous):
+    events = set()
+    for rule in rules:
+        if rule.is_cross:
+            if previous is None:
+                continue
+            before = previous['domestic'] - previous[rule.metric]
+            after = row['domestic'] - row[rule.metric]
+            up = before <= 0 < after
+            down = before >= 0 > after
+            if (up and rule.direction in ('up', 'both')) or (down and rule.direction in ('down', 'both')):
+                events.add((rule.name, row['date']))
+        elif not math.isnan(row[rule.metric]) and COMPARE[rule.op](row[rule.metric], rule.threshold):
+            events.add((rule.name, row['date']))
+    return events
+
+
+def _random_row(rng, i):
+    bid = float(rng.uniform(900, 1100))
+    domestic = float(rng.uniform(900, 1100))
+    row = {
+        'date': f'2024.01.{i:02d}',
+        'bid': bid,
+        'ask': bid + float(rng.uniform(0, 10)),
+        'international': float(rng.uniform(900, 1100)),
+        'domestic': domestic,
+        'change': float(np.round(rng.normal(0, 3), 1)),
+        'ma5': domestic + float(rng.normal(0, 20)),
+        'ma10': domestic + float(rng.normal(0, 20)),
+    }
+    row['spread'] = row['ask'] - row['bid']
+    if i % 7 == 0:
+        row['ma10'] = math.nan
+    return row
+
+
+def test_index_matches_brute_force():
+    rng = np.random.default_rng(4)
+    rules = _random_rules(rng, 500)
+    engine = AlertEngine(rules)
+    previous = None
+    for i in range(1, 29):
+        row = _random_row(rng, i)
+        events = engine.evaluate(row, previous)
+        found = {(event['rule'], event['date']) for event in events}
+        assert len(found) == len(events)
+        assert found == _brute_force(rules, row, previous)
+        previous = row
+
+
+def test_check_ingest_evaluates_only_new_rows(make_prices):
+    rng = np.random.default_rng(5)
+    rules = _random_rules(rng, 200)
+    sink = _ListSink()
+    engine = AlertEngine(rules, [sink])
+    full = make_prices(pd.date_range('2024-01-01', periods=60, freq='D'))
+
+    storage = SQLiteStorage(':memory:')
+    try:
+        storage.upsert(full.iloc[:40])
+        before = engine.snapshot(storage)
+        # 겹치는 10개 행은 값이 같으므로 새 20개 행만 평가
+        storage.upsert(full.iloc[30:])
+        events = engine.check_ingest(storage, before)
+        assert events == sink.events
+
+        rows = [_row_dict(values) for values in rows_frame(storage, None).itertuples(index=False, name=None)]
+        expected = set()
+        for i in range(40, 60):
+            expected |= _brute_force(rules, rows[i], rows[i - 1])
+        assert expected
+        assert {(event['rule'], event['date']) for event in events} == expected
+    finally:
+        storage.close()
@@ -0,0 +1,63 @@
+"""
+분석값 테이블 테스트: upsert마다 이어서 계산한 분석값을 전체 이력에 compute_analytics를
+적용한 값과 비교합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics_state import ANALYTICS_COLUMNS, compute_analytics
+from schema import DATE_COLUMN, PRICE_COLUMNS
+from storage import SQLiteStorage
+
+
+@pytest.fixture
+def storage():
+    storage = SQLiteStorage(':memory:')
+    yield storage
+    storage.close()
+
+
+def _assert_matches_recompute(storage):
+    prices = storage.read().sort_values(DATE_COLUMN)
+    analytics = storage.read_analytics().sort_values(DATE_COLUMN)
+    assert analytics[DATE_COLUMN].tolist() == prices[DATE_COLUMN].tolist()
+    expected = compute_analytics(prices[PRICE_COLUMNS[-1]].to_numpy())
+    for column in ANALYTICS_COLUMNS:
+        np.testing.assert_allclose(analytics[column].to_numpy(), expected[column], rtol=1e-9, equal_nan=True)
+
+
+def test_appends_are_incremental(storage, make_prices, monkeypatch):
+    full = make_prices(pd.date_range('2024-01-01', periods=200, freq='D'), nan_rate=0.05)
+    storage.upsert(full.iloc[:30])
+    _assert_matches_recompute(storage)
+
+    rebuilds = []
+    original = storage.analytics.rebuild
+    monkeypatch.setattr(storage.analytics, 'rebuild', lambda: rebuilds.append(1) or original())
+    for start in range(30, 200, 17):
+        # 마지막 날짜 이후만 추가 (직전 배치와 겹치는 같은 값의 행은 반영되지 않음)
+        storage.upsert(full.iloc[start - 5:start + 17])
+        _assert_matches_recompute(storage)
+    assert rebuilds == []
+
+
+def test_earlier_changes_rebuild(storage, make_prices):
+    dates = pd.date_range('2024-01-01', periods=120, freq='D')
+    storage.upsert(make_prices(dates[::2]))
+    _assert_matches_recompute(storage)
+
+    # 중간 날짜가 끼어듦
+    storage.upsert(make_prices(dates[1:60:2], seed=1))
+    _assert_matches_recompute(storage)
+
+    # 이전 날짜의 가격이 바뀜
+    changed = make_prices(dates[10:12], seed=2)
+    storage.upsert(changed)
+    _assert_matches_recompute(storage)
+
+    # 다른 경로로 가격 테이블에만 추가된 행은 읽을 때 이어서 계산
+    with storage.conn:
+        last_day = storage.conn.execute('SELECT MAX(day) FROM prices').fetchone()[0]
+        storage.conn.execute('INSERT INTO prices VALUES (?, 1, 1, 1, 1234.5)', (last_day + 1,))
+    _assert_matches_recompute(storage)
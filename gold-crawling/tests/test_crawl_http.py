@@ -0,0 +1,118 @@
+"""
+HTTP 우선 수집 경로 테스트입니다.
+
+로컬 http.server로 JSON 데이터 소스, ajaxURL만 있는 페이지, 서버에서 렌더링된 테이블을 제공하고
+Selenium을 거치지 않고 행을 가져오는지 확인합니다.
+
+사용법 (gold-crawling 디렉토리에서):
+    python -m pytest tests
+"""
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+import crawl_gold_prices
+from tabulator_parser import COLUMNS
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(TEST_DIR)
+FIXTURE_DIR = os.path.join(TEST_DIR, 'fixtures')
+
+# 경로 -> (파일, Content-Type)
+ROUTES = {
+    '/api/gold_prices.json': (os.path.join(FIXTURE_DIR, 'gold_prices.json'), 'application/json'),
+    '/gold-price': (os.path.join(FIXTURE_DIR, 'gold_price_page.html'), 'text/html; charset=utf-8'),
+    '/rendered': (os.path.join(PROJECT_DIR, 'samples', 'extract_from_html.html'), 'text/html; charset=utf-8'),
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.server.requested.append(path)
+        if path not in ROUTES:
+            self.send_error(404)
+            return
+        file_path, content_type = ROUTES[path]
+        with open(file_path, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+    httpd.requested = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def no_selenium(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Selenium 경로를 사용하면 안 됩니다.")
+    monkeypatch.setattr(crawl_gold_prices, 'crawl_with_selenium', fail)
+
+
+def test_json_source(server):
+    _, base = server
+    rows = crawl_gold_prices.fetch_table_http(f'{base}/api/gold_prices.json', session=requests.Session())
+
+    assert len(rows) == 3
+    assert list(rows[0]) == COLUMNS
+    # 페이지의 국제가 컬럼은 ask 필드에 묶여 있음
+    assert all(row['국제가 (USD/T.oz)'] == row['Ask'] for row in rows)
+    assert rows[0] == {
+        '고시날짜': '2026.01.15', 'Bid': '4,603.84', 'Ask': '4,605.62',
+        '국제가 (USD/T.oz)': '4,605.62', '국내기준가 (₩/g)': '217,845',
+    }
+
+
+def test_korean_json_fields():
+    row = dict(zip(COLUMNS, ['2026.01.15', '1', '2', '3', '4']))
+    assert crawl_gold_prices.rows_from_json([row]) == [row]
+    # 필수 필드가 빠진 행은 건너뜀
+    assert crawl_gold_prices.rows_from_json([{'date': '2026.01.15', 'bid': '1'}]) == []
+
+
+def test_page_with_ajax_url(server):
+    httpd, base = server
+    rows = crawl_gold_prices.fetch_table_http(f'{base}/gold-price', session=requests.Session())
+
+    assert [row['고시날짜'] for row in rows] == ['2026.01.15', '2026.01.14', '2026.01.13']
+    assert httpd.requested == ['/gold-price', '/api/gold_prices.json']
+
+
+def test_rendered_html(server):
+    _, base = server
+    rows = crawl_gold_prices.fetch_table_http(f'{base}/rendered', session=requests.Session())
+
+    assert len(rows) == 30
+    assert rows[0]['국제가 (USD/T.oz)'] == rows[0]['Ask'] == '4,605.62'
+
+
+@pytest.mark.parametrize('full_history', [False, True])
+def test_crawl_uses_http_first(server, no_selenium, tmp_path, full_history):
+    httpd, base = server
+    df = crawl_gold_prices.crawl_gold_prices(
+        f'{base}/gold-price', session=requests.Session(), full_history=full_history,
+        store_path=str(tmp_path / 'gold_prices.db'),
+    )
+
+    assert df is not None
+    assert len(df) == 3
+    assert '/api/gold_prices.json' in httpd.requested
@@ -0,0 +1,89 @@
+"""
+이동 상관계수 테스트: 누적합으로 계산한 값과 행마다 이어서 갱신한 값을 창마다 직접 계산한 값과 비교합니다.
+(pandas rolling corr는 가격 수준의 값에서 자체 오차가 커서 평균/표준편차만 pandas와 비교)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import rolling_analysis
+from rolling_analysis import RollingCorrelation, rolling_correlation, rolling_mean_std
+
+WINDOWS = (3, 5, 20)
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # 블록 경계와 재계산 주기가 짧은 이력 안에 여러 번 오도록 줄임
+    monkeypatch.setattr(rolling_analysis, 'BLOCK_SIZE', 7)
+    monkeypatch.setattr(rolling_analysis, 'RESYNC_EVERY', 11)
+
+
+def _values(n=80, k=3, nan_rate=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    # 값 수준이 커도 (가격 단위) 오차가 커지지 않는지 보기 위해 큰 offset을 더함
+    values = 100_000 + np.cumsum(rng.normal(0, 1, (n, k)), axis=0) + rng.normal(0, 0.5, (n, k))
+    values[rng.random((n, k)) < nan_rate] = np.nan
+    return values
+
+
+def _direct_correlation(values, window, min_periods):
+    """행마다 창의 값에서 두 컬럼이 모두 있는 행만 골라 상관계수를 직접 계산합니다."""
+    n, k = values.shape
+    result = np.full((n, k, k), np.nan)
+    for t in range(n):
+        block = values[max(0, t - window + 1):t + 1]
+        for i in range(k):
+            for j in range(k):
+                both = ~np.isnan(block[:, i]) & ~np.isnan(block[:, j])
+                if both.sum() < max(min_periods, 2):
+                    continue
+                x = block[both, i] - block[both, i].mean()
+                y = block[both, j] - block[both, j].mean()
+                scale = np.sqrt((x * x).sum() * (y * y).sum())
+                if scale > 0:
+                    result[t, i, j] = (x * y).sum() / scale
+    return result
+
+
+@pytest.mark.parametrize('min_periods', [None, 2])
+def test_batch_matches_direct(min_periods):
+    values = _values()
+    result = rolling_correlation(values, WINDOWS, min_periods)
+    for window in WINDOWS:
+        expected = _direct_correlation(values, window, window if min_periods is None else min_periods)
+        np.testing.assert_allclose(result[window], expected, atol=1e-8, equal_nan=True)
+
+
+@pytest.mark.parametrize('min_periods', [None, 2])
+def test_update_matches_batch(min_periods):
+    values = _values(seed=1)
+    batch = rolling_correlation(values, WINDOWS, min_periods)
+    rolling = RollingCorrelation(values.shape[1], WINDOWS, min_periods)
+    for i, row in enumerate(values):
+        current = rolling.update(row)
+        for window in WINDOWS:
+            np.testing.assert_allclose(current[window], batch[window][i], atol=1e-8, equal_nan=True)
+
+
+@pytest.mark.parametrize('split', [1, 4, 19, 20, 50])
+def test_from_history_continues(split):
+    values = _values(seed=2)
+    batch = rolling_correlation(values, WINDOWS)
+    rolling = RollingCorrelation.from_history(values[:split], WINDOWS)
+    for window in WINDOWS:
+        np.testing.assert_allclose(rolling.correlation()[window], batch[window][split - 1], atol=1e-8, equal_nan=True)
+    for i in range(split, len(values)):
+        current = rolling.update(values[i])
+        for window in WINDOWS:
+            np.testing.assert_allclose(current[window], batch[window][i], atol=1e-8, equal_nan=True)
+
+
+def test_mean_std_matches_pandas():
+    series = _values(k=1, nan_rate=0.15, seed=3)[:, 0]
+    result = rolling_mean_std(series, WINDOWS)
+    for window in WINDOWS:
+        rolled = pd.Series(series).rolling(window)
+        mean, std = result[window]
+        np.testing.assert_allclose(mean, rolled.mean().to_numpy(), rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(std, rolled.std().to_numpy(), rtol=1e-6, atol=1e-9, equal_nan=True)
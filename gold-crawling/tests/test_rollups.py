@@ -0,0 +1,72 @@
+"""
+주/월/연 집계 테스트: upsert마다 갱신한 집계를 전체 재집계(rebuild) 및 pandas resample 결과와 비교합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from rollups import RESOLUTIONS, SERIES
+from schema import DATE_COLUMN, PRICE_COLUMNS
+from storage import SQLiteStorage
+
+ROLLUP_QUERY = 'SELECT * FROM prices_rollup ORDER BY resolution, series, period'
+
+
+@pytest.fixture
+def storage():
+    storage = SQLiteStorage(':memory:')
+    yield storage
+    storage.close()
+
+
+def _rebuilt(storage):
+    memory = SQLiteStorage(':memory:')
+    try:
+        memory.write(storage.read())
+        return memory.conn.execute(ROLLUP_QUERY).fetchall()
+    finally:
+        memory.close()
+
+
+def _assert_same_rows(actual, expected):
+    assert len(actual) == len(expected)
+    for row, other in zip(actual, expected):
+        assert row[:3] == other[:3]
+        np.testing.assert_allclose(
+            np.array(row[3:], dtype='float64'), np.array(other[3:], dtype='float64'), rtol=1e-12, equal_nan=True
+        )
+
+
+def test_update_matches_rebuild(storage, make_prices):
+    dates = pd.date_range('2014-12-20', '2026-01-10', freq='D')
+    storage.upsert(make_prices(dates[::5], nan_rate=0.05))
+    rng = np.random.default_rng(3)
+    for seed in range(6):
+        # 멀리 떨어진 날짜들(연/월/주 경계 포함)을 새 값으로 upsert
+        picked = np.sort(rng.choice(len(dates), 12, replace=False))
+        storage.upsert(make_prices(dates[picked], seed=seed, nan_rate=0.1))
+        _assert_same_rows(storage.conn.execute(ROLLUP_QUERY).fetchall(), _rebuilt(storage))
+
+
+def test_rollup_matches_resample(storage, make_prices):
+    dates = pd.date_range('2023-11-01', '2025-02-15', freq='D')
+    storage.upsert(make_prices(dates[::2], nan_rate=0.05))
+    storage.upsert(make_prices(dates[1::2], seed=1, nan_rate=0.05))
+
+    prices = storage.read().sort_values(DATE_COLUMN).set_index(DATE_COLUMN)
+    # 주는 월요일 시작 ([월요일, 다음 월요일))
+    rules = {'week': 'W-MON', 'month': 'MS', 'year': 'YS'}
+    for resolution in RESOLUTIONS:
+        for series, column in zip(SERIES, PRICE_COLUMNS):
+            resampled = prices[column].resample(rules[resolution], label='left', closed='left')
+            expected = pd.DataFrame({
+                'open': resampled.first(), 'high': resampled.max(), 'low': resampled.min(),
+                'close': resampled.last(), 'mean': resampled.mean(), 'count': resampled.count(),
+            })
+            actual = storage.read_rollup(resolution, series)
+            assert actual['기간'].tolist() == expected.index.tolist()
+            for name in expected:
+                np.testing.assert_allclose(
+                    actual[name].to_numpy(dtype='float64'), expected[name].to_numpy(dtype='float64'),
+                    rtol=1e-12, equal_nan=True,
+                )
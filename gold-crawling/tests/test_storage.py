@@ -0,0 +1,78 @@
+"""
+SQLiteStorage.upsert 테스트: keep='first'/'last'의 결과와 반영 행 수를
+딕셔너리로 다시 계산한 값과 비교합니다.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from schema import DATE_COLUMN, PRICE_COLUMNS, normalize_frame
+from storage import SQLiteStorage
+
+
+@pytest.fixture
+def storage():
+    storage = SQLiteStorage(':memory:')
+    yield storage
+    storage.close()
+
+
+def _expected(history, df, keep):
+    """{날짜: 가격 튜플}에 df를 keep 방식으로 반영하고 바뀐 날짜 수를 반환합니다."""
+    typed = normalize_frame(df).drop_duplicates(subset=[DATE_COLUMN], keep=keep)
+    changed = 0
+    for date, *prices in typed.itertuples(index=False, name=None):
+        old = history.get(date)
+        if old is not None and (keep == 'first' or _same(old, prices)):
+            continue
+        history[date] = tuple(prices)
+        changed += 1
+    return changed
+
+
+def _same(a, b):
+    return all(x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(a, b))
+
+
+def _stored(storage):
+    df = storage.read()
+    return {date: tuple(prices) for date, *prices in df.itertuples(index=False, name=None)}
+
+
+@pytest.mark.parametrize('keep', ['first', 'last'])
+def test_upsert_matches_recompute(storage, make_prices, keep):
+    dates = pd.date_range('2024-01-01', periods=300, freq='D')
+    history = {}
+    rng = np.random.default_rng(1)
+    for seed in range(8):
+        # 겹치는 구간, 새 날짜, 같은 배치 안의 중복 날짜를 섞음
+        picked = np.sort(rng.choice(len(dates), 80, replace=True))
+        df = make_prices(dates[picked], seed=seed % 3, nan_rate=0.1)
+        expected_changed = _expected(history, df, keep)
+        assert storage.upsert(df, keep=keep) == expected_changed
+
+        stored = _stored(storage)
+        assert stored.keys() == history.keys()
+        assert all(_same(stored[date], history[date]) for date in history)
+
+
+def test_unchanged_rows_are_not_counted(storage, make_prices):
+    df = make_prices(pd.date_range('2024-01-01', periods=100, freq='D'), nan_rate=0.2)
+    assert storage.upsert(df) == 100
+    # 같은 값(NaN 포함)을 다시 넣으면 반영할 행이 없음
+    assert storage.upsert(df) == 0
+    assert storage.upsert(df, keep='first') == 0
+
+    changed = df.copy()
+    changed.loc[5, PRICE_COLUMNS[0]] = '1.5'
+    assert storage.upsert(changed) == 1
+    assert storage.upsert(changed, keep='first') == 0
+    assert storage.read(start='2024-01-06', end='2024-01-06')[PRICE_COLUMNS[0]].iloc[0] == 1.5
+
+
+def test_empty_input(storage):
+    assert storage.upsert(pd.DataFrame([])) == 0
+    assert len(storage) == 0
+    assert storage.date_range() == (None, None)
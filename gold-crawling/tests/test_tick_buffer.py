@@ -0,0 +1,80 @@
+"""
+TickBuffer 테스트: 링 버퍼가 한 바퀴 돈 뒤의 조회와 파일 매핑(spill/open)을
+모든 틱을 보관한 리스트의 마지막 capacity개와 비교합니다.
+"""
+import numpy as np
+import pytest
+
+from tick_buffer import TICK_COLUMNS, TickBuffer
+
+
+def _ticks(count, start=0):
+    timestamps = np.arange(start, start + count, dtype='int64') * 1_000
+    prices = np.arange(start, start + count, dtype='float64')[:, None] + np.arange(len(TICK_COLUMNS)) / 10
+    return timestamps, prices
+
+
+def _assert_holds(buffer, timestamps, prices):
+    """buffer가 (timestamps, prices)의 마지막 capacity개를 오래된 순서로 보관하는지 확인합니다."""
+    expected_t = timestamps[-buffer.capacity:]
+    expected_p = prices[-buffer.capacity:]
+    view_t, view_p = buffer.view()
+    np.testing.assert_array_equal(view_t, expected_t)
+    np.testing.assert_array_equal(view_p, expected_p)
+    assert len(buffer) == len(expected_t)
+    assert buffer.total == len(timestamps)
+
+    for n in range(-1, buffer.capacity + 2):
+        latest_t, latest_p = buffer.latest(n)
+        count = max(0, min(n, len(expected_t)))
+        np.testing.assert_array_equal(latest_t, expected_t[len(expected_t) - count:])
+        np.testing.assert_array_equal(latest_p, expected_p[len(expected_p) - count:])
+
+    for timestamp in (-1, *expected_t[::3], expected_t[-1] + 1 if len(expected_t) else 0):
+        since_t, since_p = buffer.since(timestamp)
+        keep = expected_t >= timestamp
+        np.testing.assert_array_equal(since_t, expected_t[keep])
+        np.testing.assert_array_equal(since_p, expected_p[keep])
+
+
+@pytest.mark.parametrize('total', [0, 3, 7, 8, 13, 30])
+def test_append_wraps(total):
+    buffer = TickBuffer(8)
+    timestamps, prices = _ticks(total)
+    for timestamp, row in zip(timestamps, prices):
+        buffer.append(timestamp, *row)
+    _assert_holds(buffer, timestamps, prices)
+
+
+@pytest.mark.parametrize('batches', [[3, 4], [5, 5, 5], [20], [1, 7, 9, 2]])
+def test_extend_matches_append(batches):
+    buffer = TickBuffer(8)
+    all_t, all_p = _ticks(0)
+    start = 0
+    for size in batches:
+        timestamps, prices = _ticks(size, start)
+        buffer.extend(timestamps, prices)
+        all_t, all_p = np.concatenate([all_t, timestamps]), np.concatenate([all_p, prices])
+        start += size
+        _assert_holds(buffer, all_t, all_p)
+
+
+def test_spill_and_reopen(tmp_path):
+    path = str(tmp_path / 'ticks.bin')
+    buffer = TickBuffer(8)
+    timestamps, prices = _ticks(11)
+    buffer.extend(timestamps[:6], prices[:6])
+    buffer.spill(path)
+    buffer.extend(timestamps[6:], prices[6:])
+    _assert_holds(buffer, timestamps, prices)
+    buffer.close()
+
+    reopened = TickBuffer.open(path)
+    assert reopened.capacity == 8
+    _assert_holds(reopened, timestamps, prices)
+    more_t, more_p = _ticks(5, 11)
+    reopened.extend(more_t, more_p)
+    _assert_holds(reopened, np.concatenate([timestamps, more_t]), np.concatenate([prices, more_p]))
+
+    with pytest.raises(Exception):
+        TickBuffer(8).spill(path)
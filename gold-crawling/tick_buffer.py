@@ -0,0 +1,224 @@
+"""
+장중 시세(틱)를 미리 할당한 고정 크기 배열에 보관하는 링 버퍼입니다.
+
+고시날짜별 한 행이 아니라 1분에도 여러 번 관측한 Bid, Ask, 국제가, 국내기준가를
+시각(int64, Unix epoch 나노초)과 가격(float64, 4개 컬럼) 배열에 차례로 기록합니다.
+가득 차면 가장 오래된 틱부터 덮어쓰며, 틱 하나에 40바이트만 사용하므로
+DataFrame 없이 몇 달치 틱을 메모리에 둘 수 있습니다.
+
+- 메모리 배열 대신 파일에 메모리 매핑할 수 있어(spill) 프로세스를 다시 시작해도 이어서 기록합니다.
+- segments()/view()는 복사 없이 버퍼를 가리키는 NumPy 뷰를 반환합니다.
+
+사용법:
+    python tick_buffer.py ticks.bin --last 20
+"""
+import argparse
+import os
+import sys
+import io
+import time
+
+import numpy as np
+
+# 가격 컬럼 (저장소 컬럼과 같은 순서)
+TICK_COLUMNS = ('bid', 'ask', 'international', 'domestic')
+
+# 기본 용량: 약 100만 틱 (1분에 4번이면 약 6개월, 40MB)
+DEFAULT_CAPACITY = 1 << 20
+
+# 파일 형식: 매직(8바이트) + 헤더(int64 x 3: 버전, 용량, 누적 기록 수) + 시각 배열 + 가격 배열
+_MAGIC = b'GOLDTICK'
+_VERSION = 1
+_HEADER_SIZE = len(_MAGIC) + 3 * 8
+
+
+def _file_size(capacity):
+    return _HEADER_SIZE + capacity * 8 * (1 + len(TICK_COLUMNS))
+
+
+class TickBuffer:
+    """
+    시각(int64 나노초)과 가격(float64 x 4)을 보관하는 링 버퍼입니다.
+    틱은 시각 오름차순으로 추가한다고 가정합니다. (since()의 이진 검색에 사용)
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise Exception(f"용량은 1 이상이어야 합니다: {capacity}")
+        self.capacity = capacity
+        self.path = None
+        self._header = np.array([_VERSION, capacity, 0], dtype='int64')
+        self.timestamps = np.zeros(capacity, dtype='int64')
+        self.prices = np.full((capacity, len(TICK_COLUMNS)), np.nan, dtype='float64')
+
+    @classmethod
+    def open(cls, path, capacity=DEFAULT_CAPACITY):
+        """path의 틱 파일을 메모리 매핑하여 엽니다. (없으면 capacity 크기로 만듦)"""
+        buffer = cls.__new__(cls)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(_MAGIC)
+                f.write(np.array([_VERSION, capacity, 0], dtype='int64').tobytes())
+                f.truncate(_file_size(capacity))
+        with open(path, 'rb') as f:
+            magic = f.read(len(_MAGIC))
+            version, capacity, _ = np.frombuffer(f.read(3 * 8), dtype='int64')
+        if magic != _MAGIC or version != _VERSION:
+            raise Exception(f"틱 파일 형식이 아닙니다: {path}")
+        if os.path.getsize(path) != _file_size(capacity):
+            raise Exception(f"틱 파일 크기가 올바르지 않습니다: {path}")
+        buffer._map(path, int(capacity))
+        return buffer
+
+    def _map(self, path, capacity):
+        self.path = path
+        self.capacity = capacity
+        self._header = np.memmap(path, dtype='int64', mode='r+', offset=len(_MAGIC), shape=(3,))
+        self.timestamps = np.memmap(path, dtype='int64', mode='r+', offset=_HEADER_SIZE, shape=(capacity,))
+        self.prices = np.memmap(
+            path, dtype='float64', mode='r+', offset=_HEADER_SIZE + capacity * 8,
+            shape=(capacity, len(TICK_COLUMNS)),
+        )
+
+    def spill(self, path):
+        """
+        메모리의 틱을 path 파일로 옮기고 이후에는 파일에 메모리 매핑하여 기록합니다.
+        반환값: self
+        """
+        if self.path is not None:
+            raise Exception(f"이미 파일에 매핑되어 있습니다: {self.path}")
+        if os.path.exists(path):
+            raise Exception(f"파일이 이미 있습니다: {path}")
+        with open(path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(self._header.astype('int64').tobytes())
+            f.write(self.timestamps.tobytes())
+            f.write(self.prices.tobytes())
+        self._map(path, self.capacity)
+        return self
+
+    @property
+    def total(self):
+        """지금까지 기록한 틱 수 (덮어쓴 틱 포함)"""
+        return int(self._header[2])
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, timestamp, bid, ask, international, domestic):
+        """틱 하나를 기록합니다. (timestamp: Unix epoch 나노초, None이면 현재 시각)"""
+        if timestamp is None:
+            timestamp = time.time_ns()
+        index = self.total % self.capacity
+        self.timestamps[index] = timestamp
+        self.prices[index] = (bid, ask, international, domestic)
+        self._header[2] += 1
+
+    def extend(self, timestamps, prices):
+        """틱 여러 개를 한 번에 기록합니다. (prices: (n, 4) 배열)"""
+        timestamps = np.asarray(timestamps, dtype='int64')
+        prices = np.asarray(prices, dtype='float64').reshape(-1, len(TICK_COLUMNS))
+        if len(timestamps) != len(prices):
+            raise Exception("시각과 가격의 개수가 다릅니다.")
+        # 용량보다 많으면 마지막 capacity개만 남음
+        skip = max(0, len(timestamps) - self.capacity)
+        timestamps, prices = timestamps[skip:], prices[skip:]
+        start = (self.total + skip) % self.capacity
+        first = min(len(timestamps), self.capacity - start)
+        self.timestamps[start:start + first] = timestamps[:first]
+        self.prices[start:start + first] = prices[:first]
+        self.timestamps[:len(timestamps) - first] = timestamps[first:]
+        self.prices[:len(timestamps) - first] = prices[first:]
+        self._header[2] += skip + len(timestamps)
+
+    def segments(self):
+        """
+        보관 중인 틱을 오래된 순서의 (시각, 가격) 뷰 목록으로 반환합니다. (복사 없음)
+        버퍼가 한 바퀴 돌았으면 [오래된 부분, 최근 부분] 두 조각입니다.
+        """
+        if self.total <= self.capacity:
+            return [(self.timestamps[:self.total], self.prices[:self.total])]
+        head = self.total % self.capacity
+        parts = [(self.timestamps[head:], self.prices[head:])]
+        if head:
+            parts.append((self.timestamps[:head], self.prices[:head]))
+        return parts
+
+    def view(self):
+        """
+        보관 중인 틱 전체를 오래된 순서의 (시각, 가격) 배열로 반환합니다.
+        버퍼가 한 조각이면 복사 없는 뷰, 두 조각이면 이어 붙인 복사본입니다.
+        """
+        parts = self.segments()
+        if len(parts) == 1:
+            return parts[0]
+        return (np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]))
+
+    def latest(self, n=1):
+        """
+        최근 n개 틱의 (시각, 가격) 배열 (오래된 순서)
+        전체를 이어 붙이지 않고 뒤쪽 조각에서 잘라내므로, 최근 조각 안이면 복사 없는 뷰입니다.
+        """
+        if n <= 0:
+            return self.timestamps[:0], self.prices[:0]
+        parts = []
+        for times, prices in reversed(self.segments()):
+            if n <= 0:
+                break
+            take = min(n, len(times))
+            parts.append((times[len(times) - take:], prices[len(times) - take:]))
+            n -= take
+        if len(parts) == 1:
+            return parts[0]
+        parts.reverse()
+        return (np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]))
+
+    def since(self, timestamp):
+        """timestamp(나노초) 이후의 틱을 (시각, 가격) 배열로 반환합니다. (한 조각 안이면 복사 없음)"""
+        parts = []
+        for times, prices in self.segments():
+            start = np.searchsorted(times, timestamp, side='left')
+            if start < len(times):
+                parts.append((times[start:], prices[start:]))
+        if not parts:
+            return self.timestamps[:0], self.prices[:0]
+        if len(parts) == 1:
+            return parts[0]
+        return (np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]))
+
+    def to_frame(self):
+        """분석용 DataFrame(시각(UTC) + 가격 컬럼)으로 복사합니다."""
+        import pandas as pd
+
+        timestamps, prices = self.view()
+        df = pd.DataFrame({'시각': timestamps.astype('datetime64[ns]')})
+        for i, column in enumerate(TICK_COLUMNS):
+            df[column] = prices[:, i]
+        return df
+
+    def flush(self):
+        """파일에 매핑된 경우 변경 내용을 디스크에 씁니다."""
+        if self.path is not None:
+            self._header.flush()
+            self.timestamps.flush()
+            self.prices.flush()
+
+    def close(self):
+        self.flush()
+
+
+if __name__ == "__main__":
+    # Windows 콘솔 인코딩 설정
+    if sys.platform == 'win32':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+    parser = argparse.ArgumentParser(description='장중 틱 파일 조회')
+    parser.add_argument('path', help='틱 파일 경로')
+    parser.add_argument('--last', type=int, default=20, help='출력할 최근 틱 수')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        raise Exception(f"{args.path} 파일을 찾을 수 없습니다.")
+    ticks = TickBuffer.open(args.path)
+    print(f"틱 {len(ticks)}개 보관 (누적 {ticks.total}개, 용량 {ticks.capacity}개)")
+    print(ticks.to_frame().tail(args.last).to_string(index=False))
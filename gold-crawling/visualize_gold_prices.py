@@ -1,74 +1,149 @@
 """
 금시세 데이터를 시각화하여 PNG 파일로 저장합니다.
 """
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from datetime import datetime
+import argparse
+import functools
 import sys
 import io
 import os
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+
+from instrumentation import span
+from plot_setup import setup_plotting
+from render_manifest import RenderManifest, text_digest
 
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    # Windows 한글 폰트 설정
-    import matplotlib.font_manager as fm
-    font_list = [f.name for f in fm.fontManager.ttflist]
-    if 'Malgun Gothic' in font_list:
-        plt.rcParams['font.family'] = 'Malgun Gothic'
-    elif 'NanumGothic' in font_list:
-        plt.rcParams['font.family'] = 'NanumGothic'
-    elif 'Gulim' in font_list:
-        plt.rcParams['font.family'] = 'Gulim'
-    else:
-        # 한글 폰트가 없으면 기본 폰트 사용
-        plt.rcParams['font.family'] = 'DejaVu Sans'
-    plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
-else:
-    # Mac/Linux용
-    try:
-        plt.rcParams['font.family'] = 'AppleGothic'
-    except:
-        try:
-            plt.rcParams['font.family'] = 'NanumGothic'
-        except:
-            pass
 
-# 스타일 설정
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
+# pandas/matplotlib/numpy는 시작 시간을 줄이기 위해 실제로 필요할 때 불러옴
+plt = None
+np = None
 
-def load_data():
-    """엑셀 파일에서 데이터를 로드합니다."""
-    file_path = 'gold_prices.xlsx'
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"{file_path} 파일을 찾을 수 없습니다.")
-    
-    df = pd.read_excel(file_path)
+# 이미지 해상도
+DPI = 300
+
+# load_data 결과 형식의 버전 (_build_frame이 만드는 컬럼이 바뀌면 올림)
+FRAME_VERSION = 2
+
+# 차트 지문에 들어가는 렌더링 버전 (코드 해시로 알 수 없는 변경이 있으면 올림, 예: 폰트 파일 교체)
+RENDER_VERSION = 1
+
+# 모든 차트가 사용하는 도우미 모듈 (소스가 바뀌면 모든 차트를 다시 그림)
+RENDER_HELPER_MODULES = ('downsample', 'plot_setup', 'price_statistics')
+
+# 저장소 컬럼 -> 분석용 컬럼
+ANALYSIS_COLUMNS = {
+    '고시날짜': '날짜',
+    'Bid': 'Bid_숫자',
+    'Ask': 'Ask_숫자',
+    '국제가 (USD/T.oz)': '국제가_숫자',
+    '국내기준가 (₩/g)': '국내기준가_숫자',
+}
+
+def _build_frame(file_path):
+    from analytics_state import ANALYTICS_COLUMNS
+    from schema import compact_frame
+    from storage import open_storage
     
-    # 날짜를 datetime으로 변환
-    df['날짜'] = pd.to_datetime(df['고시날짜'], format='%Y.%m.%d')
+    # 저장소에는 날짜/가격이 이미 타입이 지정된 상태로 보관됨
+    storage = open_storage(file_path)
+    df = storage.read()
+    # 이동평균/변동률/누적 수익률은 저장소에 미리 계산된 값을 사용
+    analytics = storage.read_analytics()
+    storage.close()
     
-    # 숫자 데이터 변환 (쉼표 제거)
-    df['Bid_숫자'] = df['Bid'].astype(str).str.replace(',', '').astype(float)
-    df['Ask_숫자'] = df['Ask'].astype(str).str.replace(',', '').astype(float)
-    df['국제가_숫자'] = df['국제가 (USD/T.oz)'].astype(str).str.replace(',', '').astype(float)
-    df['국내기준가_숫자'] = df['국내기준가 (₩/g)'].astype(str).str.replace(',', '').astype(float)
+    df = compact_frame(df).merge(compact_frame(analytics, ANALYTICS_COLUMNS), on='고시날짜', how='left')
+    df = df.rename(columns=ANALYSIS_COLUMNS)
     
     # 날짜순 정렬
-    df = df.sort_values('날짜')
+    return df.sort_values('날짜').reset_index(drop=True)
+
+def load_data(file_path=None, use_cache=True):
+    """
+    저장소(SQLite 또는 엑셀 파일)에서 데이터를 로드합니다.
+    저장소 파일의 내용이 이전과 같으면 캐시된 DataFrame을 그대로 사용합니다.
+    """
+    from frame_cache import cached_frame
+    from storage import EXCEL_PATH, STORE_PATH
     
+    file_path = file_path or STORE_PATH
+    # 새 SQLite 저장소는 기존 엑셀 파일에서 데이터를 옮겨올 수 있음
+    if file_path.endswith('.xlsx') or os.path.exists(file_path):
+        source = file_path
+    else:
+        source = EXCEL_PATH
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"{file_path} 파일을 찾을 수 없습니다.")
+    
+    with span('load.data', cached=use_cache and source == file_path) as s:
+        if not use_cache or source != file_path:
+            df = _build_frame(file_path)
+        else:
+            df = cached_frame(file_path, lambda: _build_frame(file_path), version=FRAME_VERSION)
+        s.rows = len(df)
     return df
 
-def create_time_series_plot(df):
+def _ensure_plotting(backend=None):
+    """matplotlib/numpy를 불러오고 한글 폰트와 스타일을 적용합니다. (처음 한 번만)"""
+    global plt, np
+    setup_plotting(backend)
+    if plt is None:
+        import matplotlib.pyplot as plt
+        import numpy as np
+
+def _sample(ax, df, *columns, method='lttb'):
+    """
+    축의 픽셀 폭에 맞게 줄인 df의 행을 반환합니다. (columns별 선택점의 합집합)
+    이력이 길어져도 그리는 점의 수가 일정하여 렌더링 시간과 PNG 크기가 늘지 않습니다.
+    """
+    from downsample import axes_pixel_width, downsample_indices
+    
+    width = axes_pixel_width(ax, DPI)
+    dates = df['날짜'].to_numpy()
+    indices = [downsample_indices(dates, df[column].to_numpy(), width, method) for column in columns]
+    return df.iloc[functools.reduce(np.union1d, indices)]
+
+# 통계를 계산하는 가격 컬럼
+PRICE_COLUMNS = ['Bid_숫자', 'Ask_숫자', '국제가_숫자', '국내기준가_숫자']
+
+def compute_statistics(df):
+    """모든 차트가 공유하는 가격 컬럼 통계를 한 번에 계산합니다. (price_statistics.PriceStatistics)"""
+    from price_statistics import PriceStatistics
+    
+    with span('render.statistics', rows=len(df)):
+        return PriceStatistics.from_frame(df, PRICE_COLUMNS)
+
+def _chart(func):
+    """
+    차트 함수를 호출할 때 그리기 환경을 준비하고 소요 시간을 기록합니다.
+    통계(stats)를 넘기지 않으면 여기서 계산합니다.
+    """
+    @functools.wraps(func)
+    def wrapper(df, stats=None):
+        with span('render.chart', rows=len(df), chart=func.__name__):
+            _ensure_plotting()
+            return func(df, stats or compute_statistics(df))
+    return wrapper
+
+def _savefig(path):
+    """현재 그림을 DPI 해상도의 PNG로 저장하고 닫습니다."""
+    with span('render.savefig', file=path):
+        plt.savefig(path, dpi=DPI, bbox_inches='tight')
+        plt.close()
+
+@_chart
+def create_time_series_plot(df, stats):
     """시계열 그래프 - 가격 추이"""
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('금시세 시계열 분석', fontsize=16, fontweight='bold')
     
+    from downsample import marker_for
+    
     # 1. 국내기준가 추이
-    axes[0, 0].plot(df['날짜'], df['국내기준가_숫자'], marker='o', linewidth=2, markersize=4)
+    shown = _sample(axes[0, 0], df, '국내기준가_숫자')
+    axes[0, 0].plot(shown['날짜'], shown['국내기준가_숫자'], marker=marker_for(len(shown), 'o'), linewidth=2, markersize=4)
     axes[0, 0].set_title('국내기준가 추이 (₩/g)', fontsize=12, fontweight='bold')
     axes[0, 0].set_xlabel('날짜')
     axes[0, 0].set_ylabel('가격 (원)')
@@ -76,7 +151,8 @@ def create_time_series_plot(df):
     axes[0, 0].tick_params(axis='x', rotation=45)
     
     # 2. 국제가 추이
-    axes[0, 1].plot(df['날짜'], df['국제가_숫자'], marker='s', color='orange', linewidth=2, markersize=4)
+    shown = _sample(axes[0, 1], df, '국제가_숫자')
+    axes[0, 1].plot(shown['날짜'], shown['국제가_숫자'], marker=marker_for(len(shown), 's'), color='orange', linewidth=2, markersize=4)
     axes[0, 1].set_title('국제가 추이 (USD/T.oz)', fontsize=12, fontweight='bold')
     axes[0, 1].set_xlabel('날짜')
     axes[0, 1].set_ylabel('가격 (USD)')
@@ -84,9 +160,10 @@ def create_time_series_plot(df):
     axes[0, 1].tick_params(axis='x', rotation=45)
     
     # 3. Bid/Ask 스프레드
-    axes[1, 0].plot(df['날짜'], df['Bid_숫자'], label='Bid', marker='o', linewidth=2, markersize=4)
-    axes[1, 0].plot(df['날짜'], df['Ask_숫자'], label='Ask', marker='s', linewidth=2, markersize=4)
-    axes[1, 0].fill_between(df['날짜'], df['Bid_숫자'], df['Ask_숫자'], alpha=0.3)
+    shown = _sample(axes[1, 0], df, 'Bid_숫자', 'Ask_숫자')
+    axes[1, 0].plot(shown['날짜'], shown['Bid_숫자'], label='Bid', marker=marker_for(len(shown), 'o'), linewidth=2, markersize=4)
+    axes[1, 0].plot(shown['날짜'], shown['Ask_숫자'], label='Ask', marker=marker_for(len(shown), 's'), linewidth=2, markersize=4)
+    axes[1, 0].fill_between(shown['날짜'], shown['Bid_숫자'], shown['Ask_숫자'], alpha=0.3)
     axes[1, 0].set_title('Bid/Ask 가격 비교', fontsize=12, fontweight='bold')
     axes[1, 0].set_xlabel('날짜')
     axes[1, 0].set_ylabel('가격 (USD)')
@@ -95,11 +172,10 @@ def create_time_series_plot(df):
     axes[1, 0].tick_params(axis='x', rotation=45)
     
     # 4. 이동평균선 (국내기준가)
-    df['MA5'] = df['국내기준가_숫자'].rolling(window=5).mean()
-    df['MA10'] = df['국내기준가_숫자'].rolling(window=10).mean()
-    axes[1, 1].plot(df['날짜'], df['국내기준가_숫자'], label='실제가격', linewidth=2, alpha=0.7)
-    axes[1, 1].plot(df['날짜'], df['MA5'], label='5일 이동평균', linewidth=2, linestyle='--')
-    axes[1, 1].plot(df['날짜'], df['MA10'], label='10일 이동평균', linewidth=2, linestyle='--')
+    shown = _sample(axes[1, 1], df, '국내기준가_숫자', 'MA5', 'MA10')
+    axes[1, 1].plot(shown['날짜'], shown['국내기준가_숫자'], label='실제가격', linewidth=2, alpha=0.7)
+    axes[1, 1].plot(shown['날짜'], shown['MA5'], label='5일 이동평균', linewidth=2, linestyle='--')
+    axes[1, 1].plot(shown['날짜'], shown['MA10'], label='10일 이동평균', linewidth=2, linestyle='--')
     axes[1, 1].set_title('국내기준가 이동평균선', fontsize=12, fontweight='bold')
     axes[1, 1].set_xlabel('날짜')
     axes[1, 1].set_ylabel('가격 (원)')
@@ -108,19 +184,22 @@ def create_time_series_plot(df):
     axes[1, 1].tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    plt.savefig('gold_prices_timeseries.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _savefig('gold_prices_timeseries.png')
     print("✓ 시계열 그래프 저장: gold_prices_timeseries.png")
 
-def create_statistical_plots(df):
+@_chart
+def create_statistical_plots(df, stats):
     """통계 분석 그래프"""
+    from downsample import marker_for
+    
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
     fig.suptitle('금시세 통계 분석', fontsize=16, fontweight='bold')
     
     # 1. 히스토그램 - 국내기준가 분포
+    domestic = stats['국내기준가_숫자']
     axes[0, 0].hist(df['국내기준가_숫자'], bins=15, edgecolor='black', alpha=0.7, color='skyblue')
-    axes[0, 0].axvline(df['국내기준가_숫자'].mean(), color='red', linestyle='--', linewidth=2, label=f'평균: {df["국내기준가_숫자"].mean():.0f}원')
-    axes[0, 0].axvline(df['국내기준가_숫자'].median(), color='green', linestyle='--', linewidth=2, label=f'중앙값: {df["국내기준가_숫자"].median():.0f}원')
+    axes[0, 0].axvline(domestic.mean, color='red', linestyle='--', linewidth=2, label=f'평균: {domestic.mean:.0f}원')
+    axes[0, 0].axvline(domestic.median, color='green', linestyle='--', linewidth=2, label=f'중앙값: {domestic.median:.0f}원')
     axes[0, 0].set_title('국내기준가 분포', fontsize=12, fontweight='bold')
     axes[0, 0].set_xlabel('가격 (원)')
     axes[0, 0].set_ylabel('빈도')
@@ -135,8 +214,14 @@ def create_statistical_plots(df):
     axes[0, 1].grid(True, alpha=0.3)
     
     # 3. 일일 변동률
-    df['일일변동률'] = df['국내기준가_숫자'].pct_change() * 100
-    axes[1, 0].bar(df['날짜'], df['일일변동률'], alpha=0.7, color=['red' if x < 0 else 'blue' for x in df['일일변동률']])
+    # 버킷별 최소/최대 변동률만 남겨 급등락을 보존
+    shown = _sample(axes[1, 0], df, '일일변동률', method='minmax')
+    colors = np.where(shown['일일변동률'] < 0, 'red', 'blue')
+    if len(shown) == len(df):
+        axes[1, 0].bar(shown['날짜'], shown['일일변동률'], alpha=0.7, color=colors)
+    else:
+        # 막대가 픽셀보다 좁아지면 세로선 하나로 그림
+        axes[1, 0].vlines(shown['날짜'], 0, shown['일일변동률'], colors=colors, alpha=0.7)
     axes[1, 0].axhline(0, color='black', linestyle='-', linewidth=1)
     axes[1, 0].set_title('일일 가격 변동률 (%)', fontsize=12, fontweight='bold')
     axes[1, 0].set_xlabel('날짜')
@@ -145,8 +230,8 @@ def create_statistical_plots(df):
     axes[1, 0].tick_params(axis='x', rotation=45)
     
     # 4. 누적 수익률
-    df['누적수익률'] = (1 + df['일일변동률']/100).cumprod() - 1
-    axes[1, 1].plot(df['날짜'], df['누적수익률'] * 100, marker='o', linewidth=2, markersize=4, color='purple')
+    shown = _sample(axes[1, 1], df, '누적수익률')
+    axes[1, 1].plot(shown['날짜'], shown['누적수익률'] * 100, marker=marker_for(len(shown), 'o'), linewidth=2, markersize=4, color='purple')
     axes[1, 1].axhline(0, color='black', linestyle='--', linewidth=1)
     axes[1, 1].set_title('누적 수익률 추이', fontsize=12, fontweight='bold')
     axes[1, 1].set_xlabel('날짜')
@@ -155,19 +240,17 @@ def create_statistical_plots(df):
     axes[1, 1].tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    plt.savefig('gold_prices_statistics.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _savefig('gold_prices_statistics.png')
     print("✓ 통계 분석 그래프 저장: gold_prices_statistics.png")
 
-def create_correlation_heatmap(df):
+@_chart
+def create_correlation_heatmap(df, stats):
     """상관관계 히트맵"""
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    # 상관관계 계산
-    corr_data = df[['Bid_숫자', 'Ask_숫자', '국제가_숫자', '국내기준가_숫자']].corr()
-    
-    # 히트맵 생성
-    sns.heatmap(corr_data, annot=True, fmt='.3f', cmap='coolwarm', center=0,
+    # 히트맵 생성 (상관계수는 공유 통계에서 사용, seaborn은 이 차트에서만 사용)
+    import seaborn as sns
+    sns.heatmap(stats.correlation, annot=True, fmt='.3f', cmap='coolwarm', center=0,
                 square=True, linewidths=1, cbar_kws={"shrink": 0.8}, ax=ax)
     
     ax.set_title('금시세 변수 간 상관관계 분석', fontsize=14, fontweight='bold', pad=20)
@@ -175,12 +258,14 @@ def create_correlation_heatmap(df):
     ax.set_yticklabels(['Bid', 'Ask', '국제가\n(USD/T.oz)', '국내기준가\n(₩/g)'], rotation=0)
     
     plt.tight_layout()
-    plt.savefig('gold_prices_correlation.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _savefig('gold_prices_correlation.png')
     print("✓ 상관관계 히트맵 저장: gold_prices_correlation.png")
 
-def create_comparison_chart(df):
+@_chart
+def create_comparison_chart(df, stats):
     """비교 차트"""
+    from downsample import marker_for
+    
     fig, axes = plt.subplots(2, 1, figsize=(14, 10))
     fig.suptitle('금시세 비교 분석', fontsize=16, fontweight='bold')
     
@@ -188,9 +273,11 @@ def create_comparison_chart(df):
     ax1 = axes[0]
     ax2 = ax1.twinx()
     
-    line1 = ax1.plot(df['날짜'], df['국내기준가_숫자'], color='blue', marker='o', 
+    domestic = _sample(ax1, df, '국내기준가_숫자')
+    international = _sample(ax2, df, '국제가_숫자')
+    line1 = ax1.plot(domestic['날짜'], domestic['국내기준가_숫자'], color='blue', marker=marker_for(len(domestic), 'o'), 
                      linewidth=2, markersize=4, label='국내기준가 (₩/g)')
-    line2 = ax2.plot(df['날짜'], df['국제가_숫자'], color='red', marker='s', 
+    line2 = ax2.plot(international['날짜'], international['국제가_숫자'], color='red', marker=marker_for(len(international), 's'), 
                      linewidth=2, markersize=4, label='국제가 (USD/T.oz)')
     
     ax1.set_xlabel('날짜', fontsize=11)
@@ -208,13 +295,13 @@ def create_comparison_chart(df):
     ax1.legend(lines, labels, loc='upper left')
     
     # 2. 가격 범위 (최고가, 최저가, 평균가)
-    dates = df['날짜']
-    high = df['국내기준가_숫자'].max()
-    low = df['국내기준가_숫자'].min()
-    mean = df['국내기준가_숫자'].mean()
+    shown = _sample(axes[1], df, '국내기준가_숫자')
+    dates = shown['날짜']
+    domestic = stats['국내기준가_숫자']
+    high, low, mean = domestic.max, domestic.min, domestic.mean
     
     axes[1].fill_between(dates, low, high, alpha=0.3, color='lightblue', label='가격 범위')
-    axes[1].plot(dates, df['국내기준가_숫자'], color='blue', linewidth=2, label='실제 가격')
+    axes[1].plot(dates, shown['국내기준가_숫자'], color='blue', linewidth=2, label='실제 가격')
     axes[1].axhline(mean, color='red', linestyle='--', linewidth=2, label=f'평균: {mean:.0f}원')
     axes[1].axhline(high, color='green', linestyle='--', linewidth=1, alpha=0.5, label=f'최고: {high:.0f}원')
     axes[1].axhline(low, color='orange', linestyle='--', linewidth=1, alpha=0.5, label=f'최저: {low:.0f}원')
@@ -227,48 +314,21 @@ def create_comparison_chart(df):
     axes[1].tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    plt.savefig('gold_prices_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _savefig('gold_prices_comparison.png')
     print("✓ 비교 차트 저장: gold_prices_comparison.png")
 
-def create_summary_statistics(df):
+@_chart
+def create_summary_statistics(df, stats):
     """요약 통계 그래프"""
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    # 통계값 계산
-    stats = {
-        '국내기준가': {
-            '평균': df['국내기준가_숫자'].mean(),
-            '중앙값': df['국내기준가_숫자'].median(),
-            '표준편차': df['국내기준가_숫자'].std(),
-            '최고가': df['국내기준가_숫자'].max(),
-            '최저가': df['국내기준가_숫자'].min(),
-            '변동계수': (df['국내기준가_숫자'].std() / df['국내기준가_숫자'].mean()) * 100
-        },
-        '국제가': {
-            '평균': df['국제가_숫자'].mean(),
-            '중앙값': df['국제가_숫자'].median(),
-            '표준편차': df['국제가_숫자'].std(),
-            '최고가': df['국제가_숫자'].max(),
-            '최저가': df['국제가_숫자'].min(),
-            '변동계수': (df['국제가_숫자'].std() / df['국제가_숫자'].mean()) * 100
-        }
-    }
+    domestic = stats['국내기준가_숫자']
+    international = stats['국제가_숫자']
     
     # 바 차트로 표시
     categories = ['평균', '중앙값', '최고가', '최저가']
-    domestic_values = [
-        stats['국내기준가']['평균'],
-        stats['국내기준가']['중앙값'],
-        stats['국내기준가']['최고가'],
-        stats['국내기준가']['최저가']
-    ]
-    international_values = [
-        stats['국제가']['평균'],
-        stats['국제가']['중앙값'],
-        stats['국제가']['최고가'],
-        stats['국제가']['최저가']
-    ]
+    domestic_values = [domestic.mean, domestic.median, domestic.max, domestic.min]
+    international_values = [international.mean, international.median, international.max, international.min]
     
     x = np.arange(len(categories))
     width = 0.35
@@ -294,49 +354,178 @@ def create_summary_statistics(df):
     # 통계 텍스트 추가
     stats_text = f"""
     국내기준가 통계:
-    • 표준편차: {stats['국내기준가']['표준편차']:.2f}원
-    • 변동계수: {stats['국내기준가']['변동계수']:.2f}%
+    • 표준편차: {domestic.std:.2f}원
+    • 변동계수: {domestic.cv:.2f}%
     
     국제가 통계:
-    • 표준편차: {stats['국제가']['표준편차']:.2f} USD
-    • 변동계수: {stats['국제가']['변동계수']:.2f}%
+    • 표준편차: {international.std:.2f} USD
+    • 변동계수: {international.cv:.2f}%
     """
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
     plt.tight_layout()
-    plt.savefig('gold_prices_summary.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _savefig('gold_prices_summary.png')
     print("✓ 요약 통계 그래프 저장: gold_prices_summary.png")
 
-def main():
-    """메인 함수"""
+# 생성할 차트와 출력 파일 (렌더링 시간이 긴 순서)
+CHARTS = [
+    create_time_series_plot,
+    create_statistical_plots,
+    create_comparison_chart,
+    create_summary_statistics,
+    create_correlation_heatmap,
+]
+CHART_FILES = {
+    create_time_series_plot: 'gold_prices_timeseries.png',
+    create_statistical_plots: 'gold_prices_statistics.png',
+    create_comparison_chart: 'gold_prices_comparison.png',
+    create_summary_statistics: 'gold_prices_summary.png',
+    create_correlation_heatmap: 'gold_prices_correlation.png',
+}
+# 명령줄에서 선택할 때 사용하는 차트 이름
+CHART_NAMES = {
+    'timeseries': create_time_series_plot,
+    'statistics': create_statistical_plots,
+    'comparison': create_comparison_chart,
+    'summary': create_summary_statistics,
+    'correlation': create_correlation_heatmap,
+}
+
+@functools.lru_cache(maxsize=None)
+def _helpers_digest():
+    """차트가 공유하는 도우미 함수와 도우미 모듈 소스의 해시 (모듈은 불러오지 않고 파일만 읽음)"""
+    import importlib.util
+    
+    sources = [inspect.getsource(helper) for helper in (_ensure_plotting, _sample, compute_statistics, _chart, _savefig)]
+    for name in RENDER_HELPER_MODULES:
+        with open(importlib.util.find_spec(name).origin, 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    return text_digest('\n'.join(sources))
+
+def chart_fingerprint(chart, data_hash):
+    """차트 이미지를 결정하는 입력(데이터, 렌더링 파라미터, 차트 코드와 도우미 코드)의 해시"""
+    import matplotlib
+    
+    params = {
+        'dpi': DPI,
+        'font': matplotlib.rcParams['font.family'],
+        'matplotlib': matplotlib.__version__,
+        'render_version': RENDER_VERSION,
+    }
+    return {
+        'data': data_hash,
+        'params': text_digest(repr(sorted(params.items()))),
+        'code': text_digest(inspect.getsource(chart)),
+        'helpers': _helpers_digest(),
+    }
+
+# 작업 프로세스에서 공유하는 데이터와 통계 (프로세스마다 한 번만 전달)
+_worker_df = None
+_worker_stats = None
+
+def _init_worker(df, stats):
+    global _worker_df, _worker_stats
+    _ensure_plotting('Agg')
+    _worker_df = df
+    _worker_stats = stats
+
+def _render_in_worker(index):
+    CHARTS[index](_worker_df, _worker_stats)
+    return index
+
+def render_charts(df, workers=None, force=False, charts=None):
+    """
+    차트를 그립니다. (charts가 있으면 해당 차트만)
+    매니페스트와 비교하여 입력이 바뀐 차트만 다시 그리고
+    (force이면 모두), 그린 차트 목록을 반환합니다.
+    workers가 2 이상이면 프로세스 풀에서 병렬로 그리며,
+    데이터는 작업마다가 아니라 작업 프로세스 생성 시 한 번만 전달합니다.
+    (workers=None이면 CPU 코어 수만큼 사용)
+    """
+    from frame_cache import frame_digest
+    
+    # 지문 계산에는 rcParams만 필요 (pyplot은 실제로 그릴 차트가 있을 때만 불러옴)
+    setup_plotting()
+    selected = [index for index, chart in enumerate(CHARTS) if charts is None or chart in charts]
+    manifest = RenderManifest()
+    data_hash = frame_digest(df)
+    fingerprints = {CHARTS[index]: chart_fingerprint(CHARTS[index], data_hash) for index in selected}
+    stale = [
+        index for index in selected
+        if force or not manifest.is_fresh(CHART_FILES[CHARTS[index]], fingerprints[CHARTS[index]])
+    ]
+    for index in selected:
+        chart = CHARTS[index]
+        if index not in stale:
+            print(f"- 변경 없음, 건너뜀: {CHART_FILES[chart]}")
+    
+    workers = min(workers or os.cpu_count() or 1, len(stale))
+    with span('render.charts', rows=len(stale)):
+        # 모든 차트가 같은 통계를 사용하므로 한 번만 계산
+        stats = compute_statistics(df) if stale else None
+        if workers <= 1:
+            for index in stale:
+                CHARTS[index](df, stats)
+        else:
+            # 작업 프로세스는 화면 없이 그리는 Agg 백엔드 사용
+            os.environ['MPLBACKEND'] = 'Agg'
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(df, stats)) as executor:
+                list(executor.map(_render_in_worker, stale))
+    
+    for index in stale:
+        chart = CHARTS[index]
+        manifest.record(CHART_FILES[chart], fingerprints[chart])
+    manifest.save()
+    return [CHART_FILES[CHARTS[index]] for index in stale]
+
+def main(workers=None, force=False, charts=None, file_path=None, refresh_font=False):
+    """메인 함수 (charts가 있으면 해당 차트만 그림)"""
     print("=" * 50)
     print("금시세 데이터 시각화 시작")
     print("=" * 50)
     
+    # 파일로만 저장하므로 화면 없는 Agg 백엔드 사용
+    if refresh_font:
+        print(f"한글 폰트: {setup_plotting('Agg', refresh=True)}")
+    setup_plotting('Agg')
+    
     # 데이터 로드
-    df = load_data()
+    df = load_data(file_path)
     print(f"\n데이터 로드 완료: {len(df)}개 행")
     print(f"날짜 범위: {df['날짜'].min().strftime('%Y-%m-%d')} ~ {df['날짜'].max().strftime('%Y-%m-%d')}")
     
     # 시각화 생성
     print("\n시각화 이미지 생성 중...")
-    create_time_series_plot(df)
-    create_statistical_plots(df)
-    create_correlation_heatmap(df)
-    create_comparison_chart(df)
-    create_summary_statistics(df)
+    render_charts(df, workers, force, charts)
     
     print("\n" + "=" * 50)
     print("모든 시각화 완료!")
     print("=" * 50)
     print("\n생성된 파일:")
-    print("  1. gold_prices_timeseries.png - 시계열 분석")
-    print("  2. gold_prices_statistics.png - 통계 분석")
-    print("  3. gold_prices_correlation.png - 상관관계 분석")
-    print("  4. gold_prices_comparison.png - 비교 분석")
-    print("  5. gold_prices_summary.png - 요약 통계")
+    descriptions = {
+        create_time_series_plot: '시계열 분석',
+        create_statistical_plots: '통계 분석',
+        create_correlation_heatmap: '상관관계 분석',
+        create_comparison_chart: '비교 분석',
+        create_summary_statistics: '요약 통계',
+    }
+    selected = [chart for chart in descriptions if charts is None or chart in charts]
+    for number, chart in enumerate(selected, start=1):
+        print(f"  {number}. {CHART_FILES[chart]} - {descriptions[chart]}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='금시세 데이터 시각화')
+    parser.add_argument('--chart', dest='charts', action='append', choices=list(CHART_NAMES),
+                        help='지정한 차트만 그립니다. (여러 번 지정 가능, 기본: 모든 차트)')
+    parser.add_argument('--store', default=None,
+                        help='데이터 저장소 경로 (기본: gold_prices.db)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='차트를 병렬로 그릴 프로세스 수 (기본: CPU 코어 수, 1이면 순차 실행)')
+    parser.add_argument('--force', action='store_true',
+                        help='입력이 바뀌지 않은 차트도 모두 다시 그립니다.')
+    parser.add_argument('--refresh-font', action='store_true',
+                        help='캐시된 한글 폰트 정보를 버리고 설치된 폰트를 다시 확인합니다.')
+    args = parser.parse_args()
+    charts = [CHART_NAMES[name] for name in args.charts] if args.charts else None
+    main(args.workers, args.force, charts, args.store, args.refresh_font)